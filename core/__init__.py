@@ -16,265 +16,202 @@ Modules:
     interview_engine: Interview orchestration for requirements gathering
     spec_manager: Specification CRUD with versioning
     design_system: Multi-brand theming with WCAG accessibility
+
+Public names are resolved lazily on first access. Environment variables:
+    KACA_EAGER_IMPORT=1: Resolve every public name at import time (for CI)
+    KACA_DISABLE_TELEMETRY=1: Hide the telemetry exports
+    KACA_DISABLE_INSIGHTS=1: Hide the insight engine exports
+    KACA_DISABLE_PLAN_UPDATER=1: Hide the plan updater exports
 """
 
 __version__ = "3.0.0"
 __author__ = "Kearney Digital & Analytics"
 
-from core.brand_guard import check_file, check_directory, BrandViolation
-from core.chart_engine import KDSChart
-from core.slide_engine import KDSPresentation
-from core.spreadsheet_engine import KDSSpreadsheet
-from core.document_engine import KDSDocument
-from core.data_profiler import profile_dataset
-from core.state_manager import (
-    load_state,
-    save_state,
-    init_project,
-    init_from_plan,
-    update_task_status,
-    get_status_summary,
-    ProjectState,
-    Task,
-)
-from core.spec_manager import (
-    Specification,
-    create_spec,
-    load_spec,
-    save_spec,
-    get_version,
-    spec_exists,
-    get_spec_summary,
-)
-from core.interview_engine import (
-    InterviewTree,
-    InterviewState,
-    load_interview_tree,
-    get_project_type_menu,
-    parse_project_type_choice,
-    parse_multi_select,
-    create_interview_state,
-    get_next_question,
-    answers_to_spec_dict,
-    should_use_express_mode,
-)
-
-# Web Application Support (v2.1)
-from core.kds_theme import KDSTheme
-from core.kds_data import KDSData, KDSDataSourceConfig
-from core.webapp_engine import KDSWebApp, KDSStreamlitApp, KDSReactApp
-
-# Utilities (v2.2)
-from core.kds_utils import safe_write_text, safe_read_text
-from core.streamlit_utils import (
-    launch_streamlit,
-    generate_requirements,
-    verify_imports,
-    is_port_in_use,
-    find_available_port,
-    STREAMLIT_CORE_DEPS,
-    STREAMLIT_ALL_DEPS,
-)
-
-# Workspace Protection (v2.2)
-from core.workspace_guard import (
-    is_template_repo,
-    verify_workspace,
-    get_workspace_info,
-    require_project_workspace,
-)
-
-# Design System Module (v3.0)
-from core.design_system import (
-    DesignSystem,
-    load_design_system,
-    save_design_system,
-    list_design_systems,
-    resolve_theme,
-    apply_design_system,
-    contrast_ratio,
-    ensure_contrast,
-)
-
-# Memory System (v3.1)
-from core.memory import (
-    load_user_profile,
-    save_user_profile,
-    get_user_preference,
-    update_user_preference,
-    add_episode,
-    get_recent_episodes,
-    build_memory_context,
-    update_session_context,
-    get_session_context,
-)
-
-# Memory Integration (v3.1)
-from core.memory_integration import (
-    get_agent_context,
-    update_session_after_task,
-    apply_user_defaults_to_spec,
-    get_client_overrides,
-)
-
-# Insight Engine (v3.2)
-from core.insight_engine import (
-    Insight,
-    Evidence,
-    InsightCatalog,
-    InsightEngine,
-)
-
-# Action Titles (v3.2)
-from core.action_titles import (
-    is_weak_title,
-    transform_to_action_title,
-    suggest_action_titles,
-    validate_action_title,
-)
-
-# Spec Diff Engine (v3.2)
-from core.spec_diff import (
-    compute_diff,
-    assess_plan_impact,
-    SpecChange,
-    ChangeType,
-    ImpactLevel,
-    DiffResult,
-)
-
-# Plan Updater (v3.2)
-from core.plan_updater import (
-    PlanUpdater,
-    PlanUpdateResult,
-    TaskUpdate,
-    update_plan_from_diff,
-)
-
-# Telemetry (v3.3)
-from core.telemetry import (
-    Telemetry,
-    Event,
-    EventType,
-    Metrics,
-    TelemetryTimer,
-)
+import importlib
+import os
 
-__all__ = [
+# Public name -> (submodule, attribute). Submodules are imported on first
+# attribute access (PEP 562) so that `import core` stays cheap for callers
+# that only need a single helper.
+_LAZY_ATTRS = {
     # Brand Guard
-    "check_file",
-    "check_directory",
-    "BrandViolation",
+    "check_file": ("core.brand_guard", "check_file"),
+    "check_directory": ("core.brand_guard", "check_directory"),
+    "BrandViolation": ("core.brand_guard", "BrandViolation"),
     # Chart Engine
-    "KDSChart",
+    "KDSChart": ("core.chart_engine", "KDSChart"),
     # Slide Engine
-    "KDSPresentation",
+    "KDSPresentation": ("core.slide_engine", "KDSPresentation"),
     # Spreadsheet Engine
-    "KDSSpreadsheet",
+    "KDSSpreadsheet": ("core.spreadsheet_engine", "KDSSpreadsheet"),
     # Document Engine
-    "KDSDocument",
+    "KDSDocument": ("core.document_engine", "KDSDocument"),
     # Data Profiler
-    "profile_dataset",
+    "profile_dataset": ("core.data_profiler", "profile_dataset"),
     # State Manager
-    "load_state",
-    "save_state",
-    "init_project",
-    "init_from_plan",
-    "update_task_status",
-    "get_status_summary",
-    "ProjectState",
-    "Task",
+    "load_state": ("core.state_manager", "load_state"),
+    "save_state": ("core.state_manager", "save_state"),
+    "init_project": ("core.state_manager", "init_project"),
+    "init_from_plan": ("core.state_manager", "init_from_plan"),
+    "update_task_status": ("core.state_manager", "update_task_status"),
+    "get_status_summary": ("core.state_manager", "get_status_summary"),
+    "ProjectState": ("core.state_manager", "ProjectState"),
+    "Task": ("core.state_manager", "Task"),
     # Spec Manager
-    "Specification",
-    "create_spec",
-    "load_spec",
-    "save_spec",
-    "get_version",
-    "spec_exists",
-    "get_spec_summary",
+    "Specification": ("core.spec_manager", "Specification"),
+    "create_spec": ("core.spec_manager", "create_spec"),
+    "load_spec": ("core.spec_manager", "load_spec"),
+    "save_spec": ("core.spec_manager", "save_spec"),
+    "get_version": ("core.spec_manager", "get_version"),
+    "spec_exists": ("core.spec_manager", "spec_exists"),
+    "get_spec_summary": ("core.spec_manager", "get_spec_summary"),
     # Interview Engine
-    "InterviewTree",
-    "InterviewState",
-    "load_interview_tree",
-    "get_project_type_menu",
-    "parse_project_type_choice",
-    "parse_multi_select",
-    "create_interview_state",
-    "get_next_question",
-    "answers_to_spec_dict",
-    "should_use_express_mode",
+    "InterviewTree": ("core.interview_engine", "InterviewTree"),
+    "InterviewState": ("core.interview_engine", "InterviewState"),
+    "load_interview_tree": ("core.interview_engine", "load_interview_tree"),
+    "get_project_type_menu": ("core.interview_engine", "get_project_type_menu"),
+    "parse_project_type_choice": ("core.interview_engine", "parse_project_type_choice"),
+    "parse_multi_select": ("core.interview_engine", "parse_multi_select"),
+    "create_interview_state": ("core.interview_engine", "create_interview_state"),
+    "get_next_question": ("core.interview_engine", "get_next_question"),
+    "answers_to_spec_dict": ("core.interview_engine", "answers_to_spec_dict"),
+    "should_use_express_mode": ("core.interview_engine", "should_use_express_mode"),
     # Web Application Support (v2.1)
-    "KDSTheme",
-    "KDSData",
-    "KDSDataSourceConfig",
-    "KDSWebApp",
-    "KDSStreamlitApp",
-    "KDSReactApp",
+    "KDSTheme": ("core.kds_theme", "KDSTheme"),
+    "KDSData": ("core.kds_data", "KDSData"),
+    "KDSDataSourceConfig": ("core.kds_data", "KDSDataSourceConfig"),
+    "KDSWebApp": ("core.webapp_engine", "KDSWebApp"),
+    "KDSStreamlitApp": ("core.webapp_engine", "KDSStreamlitApp"),
+    "KDSReactApp": ("core.webapp_engine", "KDSReactApp"),
     # Utilities (v2.2)
-    "safe_write_text",
-    "safe_read_text",
-    "launch_streamlit",
-    "generate_requirements",
-    "verify_imports",
-    "is_port_in_use",
-    "find_available_port",
-    "STREAMLIT_CORE_DEPS",
-    "STREAMLIT_ALL_DEPS",
+    "safe_write_text": ("core.kds_utils", "safe_write_text"),
+    "safe_read_text": ("core.kds_utils", "safe_read_text"),
+    "launch_streamlit": ("core.streamlit_utils", "launch_streamlit"),
+    "generate_requirements": ("core.streamlit_utils", "generate_requirements"),
+    "verify_imports": ("core.streamlit_utils", "verify_imports"),
+    "is_port_in_use": ("core.streamlit_utils", "is_port_in_use"),
+    "find_available_port": ("core.streamlit_utils", "find_available_port"),
+    "STREAMLIT_CORE_DEPS": ("core.streamlit_utils", "STREAMLIT_CORE_DEPS"),
+    "STREAMLIT_ALL_DEPS": ("core.streamlit_utils", "STREAMLIT_ALL_DEPS"),
     # Workspace Protection (v2.2)
-    "is_template_repo",
-    "verify_workspace",
-    "get_workspace_info",
-    "require_project_workspace",
+    "is_template_repo": ("core.workspace_guard", "is_template_repo"),
+    "verify_workspace": ("core.workspace_guard", "verify_workspace"),
+    "get_workspace_info": ("core.workspace_guard", "get_workspace_info"),
+    "require_project_workspace": ("core.workspace_guard", "require_project_workspace"),
     # Design System Module (v3.0)
-    "DesignSystem",
-    "load_design_system",
-    "save_design_system",
-    "list_design_systems",
-    "resolve_theme",
-    "apply_design_system",
-    "contrast_ratio",
-    "ensure_contrast",
+    "DesignSystem": ("core.design_system", "DesignSystem"),
+    "load_design_system": ("core.design_system", "load_design_system"),
+    "save_design_system": ("core.design_system", "save_design_system"),
+    "list_design_systems": ("core.design_system", "list_design_systems"),
+    "resolve_theme": ("core.design_system", "resolve_theme"),
+    "apply_design_system": ("core.design_system", "apply_design_system"),
+    "contrast_ratio": ("core.design_system", "contrast_ratio"),
+    "ensure_contrast": ("core.design_system", "ensure_contrast"),
     # Memory System (v3.1)
-    "load_user_profile",
-    "save_user_profile",
-    "get_user_preference",
-    "update_user_preference",
-    "add_episode",
-    "get_recent_episodes",
-    "build_memory_context",
-    "update_session_context",
-    "get_session_context",
+    "load_user_profile": ("core.memory", "load_user_profile"),
+    "save_user_profile": ("core.memory", "save_user_profile"),
+    "get_user_preference": ("core.memory", "get_user_preference"),
+    "update_user_preference": ("core.memory", "update_user_preference"),
+    "add_episode": ("core.memory", "add_episode"),
+    "get_recent_episodes": ("core.memory", "get_recent_episodes"),
+    "build_memory_context": ("core.memory", "build_memory_context"),
+    "update_session_context": ("core.memory", "update_session_context"),
+    "get_session_context": ("core.memory", "get_session_context"),
     # Memory Integration (v3.1)
-    "get_agent_context",
-    "update_session_after_task",
-    "apply_user_defaults_to_spec",
-    "get_client_overrides",
+    "get_agent_context": ("core.memory_integration", "get_agent_context"),
+    "update_session_after_task": (
+        "core.memory_integration",
+        "update_session_after_task",
+    ),
+    "apply_user_defaults_to_spec": (
+        "core.memory_integration",
+        "apply_user_defaults_to_spec",
+    ),
+    "get_client_overrides": ("core.memory_integration", "get_client_overrides"),
     # Insight Engine (v3.2)
-    "Insight",
-    "Evidence",
-    "InsightCatalog",
-    "InsightEngine",
+    "Insight": ("core.insight_engine", "Insight"),
+    "Evidence": ("core.insight_engine", "Evidence"),
+    "InsightCatalog": ("core.insight_engine", "InsightCatalog"),
+    "InsightEngine": ("core.insight_engine", "InsightEngine"),
     # Action Titles (v3.2)
-    "is_weak_title",
-    "transform_to_action_title",
-    "suggest_action_titles",
-    "validate_action_title",
+    "is_weak_title": ("core.action_titles", "is_weak_title"),
+    "transform_to_action_title": ("core.action_titles", "transform_to_action_title"),
+    "suggest_action_titles": ("core.action_titles", "suggest_action_titles"),
+    "validate_action_title": ("core.action_titles", "validate_action_title"),
     # Spec Diff Engine (v3.2)
-    "compute_diff",
-    "assess_plan_impact",
-    "SpecChange",
-    "ChangeType",
-    "ImpactLevel",
-    "DiffResult",
+    "compute_diff": ("core.spec_diff", "compute_diff"),
+    "assess_plan_impact": ("core.spec_diff", "assess_plan_impact"),
+    "SpecChange": ("core.spec_diff", "SpecChange"),
+    "ChangeType": ("core.spec_diff", "ChangeType"),
+    "ImpactLevel": ("core.spec_diff", "ImpactLevel"),
+    "DiffResult": ("core.spec_diff", "DiffResult"),
     # Plan Updater (v3.2)
-    "PlanUpdater",
-    "PlanUpdateResult",
-    "TaskUpdate",
-    "update_plan_from_diff",
+    "PlanUpdater": ("core.plan_updater", "PlanUpdater"),
+    "PlanUpdateResult": ("core.plan_updater", "PlanUpdateResult"),
+    "TaskUpdate": ("core.plan_updater", "TaskUpdate"),
+    "update_plan_from_diff": ("core.plan_updater", "update_plan_from_diff"),
     # Telemetry (v3.3)
-    "Telemetry",
-    "Event",
-    "EventType",
-    "Metrics",
-    "TelemetryTimer",
-]
+    "Telemetry": ("core.telemetry", "Telemetry"),
+    "Event": ("core.telemetry", "Event"),
+    "EventType": ("core.telemetry", "EventType"),
+    "Metrics": ("core.telemetry", "Metrics"),
+    "TelemetryTimer": ("core.telemetry", "TelemetryTimer"),
+}
+
+# Opt-out env var -> submodule whose exports it hides. Disabled names raise
+# AttributeError without importing the submodule.
+_FEATURE_FLAGS = {
+    "KACA_DISABLE_TELEMETRY": "core.telemetry",
+    "KACA_DISABLE_INSIGHTS": "core.insight_engine",
+    "KACA_DISABLE_PLAN_UPDATER": "core.plan_updater",
+}
+
+
+def _is_disabled(module_name):
+    """Return True if an opt-out env var hides this submodule's exports."""
+    for env_var, flagged_module in _FEATURE_FLAGS.items():
+        if flagged_module == module_name and os.environ.get(env_var):
+            return True
+    return False
+
+
+def _enabled_names():
+    """Return the public names whose submodule is not disabled."""
+    return tuple(
+        name for name, (module_name, _) in _LAZY_ATTRS.items()
+        if not _is_disabled(module_name)
+    )
+
+
+# Disabled names are left out so `from core import *` does not trip over them
+__all__ = _enabled_names()
+
+
+def __getattr__(name):
+    """Resolve a public name lazily from its submodule and cache it."""
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    if _is_disabled(module_name):
+        raise AttributeError(
+            f"{__name__}.{name} is disabled by environment configuration"
+        )
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_enabled_names()))
+
+
+# Escape hatch for CI: resolve every lazy name at import time so broken
+# deferred imports fail loudly instead of at first use.
+if os.environ.get("KACA_EAGER_IMPORT") == "1":
+    for _name, (_module_name, _) in _LAZY_ATTRS.items():
+        if not _is_disabled(_module_name):
+            __getattr__(_name)
+    del _name, _module_name
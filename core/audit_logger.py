@@ -33,15 +33,34 @@ Usage:
     )
 """
 
+import atexit
 import hashlib
+import io
 import json
+import mmap
+import os
 import platform
 import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from importlib import metadata
 from pathlib import Path
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, Any, IO, Iterator, List, Optional, Set, Tuple, Union
+from dataclasses import dataclass
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore
 
 # Log directories (relative to project_state/)
 LOGS_DIR = "logs"
@@ -49,8 +68,71 @@ COMMANDS_DIR = "commands"
 EXPORTS_DIR = "exports"
 SESSIONS_DIR = "sessions"
 
+# Distributions whose versions go into reproducibility records
+KEY_PACKAGES = (
+    "pandas",
+    "matplotlib",
+    "python-pptx",
+    "pyyaml",
+    "pillow",
+    "duckdb",
+)
+
+# File extensions treated as model artifacts in reproducibility records
+MODEL_EXTENSIONS = frozenset({".pkl", ".joblib", ".h5", ".pt", ".onnx"})
+
+# Optional CommandLogEntry context fields accepted by log_command(**kwargs)
+_COMMAND_CONTEXT_FIELDS = ("spec_version", "task_id", "tasks_created", "qc_passed")
+
+# Log file names
+COMMAND_LOG_FILE = "command_log.jsonl"
+EXPORT_LOG_FILE = "export_log.jsonl"
+
+# Running command statistics, kept next to the command log
+COMMAND_STATS_FILE = "stats.json"
+
+
+def _json_dumps(data: Dict[str, Any]) -> str:
+    """Serialize a log entry compactly, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(data, separators=(",", ":"))
+
+
+def _encode_line(data: Dict[str, Any]) -> bytes:
+    """Serialize a log entry to one UTF-8 JSONL line."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(data, separators=(",", ":")) + "\n").encode("utf-8")
+
 
-@dataclass
+# (epoch second, formatted "YYYY-MM-DDTHH:MM:SS") of the last timestamp
+_timestamp_cache = (-1, "")
+
+
+def _timestamp() -> str:
+    """Return the local time in ISO-8601 with microseconds.
+
+    Equivalent to datetime.now().isoformat() (always including the
+    fractional part), but only formats the date/time once per second.
+    """
+    global _timestamp_cache
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_seconds, prefix = _timestamp_cache
+    if seconds != cached_seconds:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(seconds))
+        _timestamp_cache = (seconds, prefix)
+    return f"{prefix}.{nanos // 1000:06d}"
+
+
+def _json_loads(line: Any) -> Any:
+    """Parse one JSONL line, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+@dataclass(slots=True)
 class CommandLogEntry:
     """Log entry for a command execution."""
     timestamp: str
@@ -64,13 +146,21 @@ class CommandLogEntry:
     tasks_created: Optional[int] = None
     qc_passed: Optional[bool] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dict, excluding None values."""
+        data = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if value is not None:
+                data[name] = value
+        return data
+
     def to_json(self) -> str:
         """Convert to JSON string, excluding None values."""
-        data = {k: v for k, v in asdict(self).items() if v is not None}
-        return json.dumps(data)
+        return _json_dumps(self.to_dict())
 
 
-@dataclass
+@dataclass(slots=True)
 class ExportLogEntry:
     """Log entry for an export operation."""
     timestamp: str
@@ -81,10 +171,35 @@ class ExportLogEntry:
     url: Optional[str] = None
     export_manifest: Optional[str] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dict, excluding None values."""
+        data = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if value is not None:
+                data[name] = value
+        return data
+
     def to_json(self) -> str:
         """Convert to JSON string, excluding None values."""
-        data = {k: v for k, v in asdict(self).items() if v is not None}
-        return json.dumps(data)
+        return _json_dumps(self.to_dict())
+
+
+# Append-mode file descriptors are kept per log file so bursty logging does
+# not pay for mkdir/open/close on every entry. Bounded to avoid leaking
+# descriptors when many projects are logged from one process.
+_MAX_OPEN_LOGS = 16
+_LOG_OPEN_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+_log_lock = threading.Lock()
+_log_fds: Dict[str, int] = {}
+_known_log_dirs: Set[str] = set()
+_stats_lock = threading.Lock()
+
+
+@lru_cache(maxsize=64)
+def _log_file_path(project_path: str, subdir: str, filename: str) -> Path:
+    """Resolve (and cache) the path of a log file for a project."""
+    return Path(project_path, "project_state", LOGS_DIR, subdir, filename)
 
 
 def _ensure_log_dirs(project_path: Path) -> Path:
@@ -96,6 +211,73 @@ def _ensure_log_dirs(project_path: Path) -> Path:
     return logs_path
 
 
+def _prepare_log_file(project_path: Path, subdir: str, filename: str) -> Path:
+    """Return a project's log file path, creating log dirs on first use.
+
+    This is the logging hot path, so the mkdirs run only the first time a
+    project is seen; _open_log_fd recreates a directory removed later.
+    """
+    key = os.fspath(project_path)
+    if key not in _known_log_dirs:
+        _ensure_log_dirs(project_path)
+        _known_log_dirs.add(key)
+    return _log_file_path(key, subdir, filename)
+
+
+def _open_log_fd(log_file: Path) -> int:
+    """Open a log file for appending, recreating its directory if needed."""
+    try:
+        return os.open(log_file, _LOG_OPEN_FLAGS, 0o644)
+    except FileNotFoundError:
+        # Directory was removed after it was cached; recreate it
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        return os.open(log_file, _LOG_OPEN_FLAGS, 0o644)
+
+
+def _append_line(log_file: Path, payload: bytes) -> int:
+    """Append one encoded line to a log file through a cached descriptor.
+
+    Writes go straight to the O_APPEND descriptor with os.write, bypassing
+    Python's buffered text layer. Nothing is held in memory, so other
+    readers (and crashes) never miss an audit entry, and on POSIX each
+    append lands atomically at the end of the file even with concurrent
+    writers in other processes.
+
+    Returns:
+        Offset just past the appended line (the log size it completes)
+    """
+    key = str(log_file)
+    with _log_lock:
+        fd = _log_fds.get(key)
+        if fd is not None and os.fstat(fd).st_nlink == 0:
+            # File was deleted or rotated under us; reopen by path
+            os.close(_log_fds.pop(key))
+            fd = None
+        if fd is None:
+            if len(_log_fds) >= _MAX_OPEN_LOGS:
+                oldest = next(iter(_log_fds))
+                os.close(_log_fds.pop(oldest))
+            fd = _log_fds[key] = _open_log_fd(log_file)
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+        return os.lseek(fd, 0, os.SEEK_CUR)
+
+
+def flush_logs() -> None:
+    """Close all cached log descriptors."""
+    with _log_lock:
+        for fd in _log_fds.values():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        _log_fds.clear()
+
+
+atexit.register(flush_logs)
+
+
 def log_command(
     project_path: Path,
     command: str,
@@ -118,23 +300,26 @@ def log_command(
     Returns:
         Path to the log file
     """
-    logs_path = _ensure_log_dirs(project_path)
-    log_file = logs_path / COMMANDS_DIR / "command_log.jsonl"
-
-    entry = CommandLogEntry(
-        timestamp=datetime.now().isoformat(),
-        command=command,
-        duration_sec=duration_sec,
-        result=result,
-        error_message=error_message,
-        spec_version=kwargs.get("spec_version"),
-        task_id=kwargs.get("task_id"),
-        tasks_created=kwargs.get("tasks_created"),
-        qc_passed=kwargs.get("qc_passed"),
-    )
-
-    with open(log_file, "a") as f:
-        f.write(entry.to_json() + "\n")
+    log_file = _prepare_log_file(project_path, COMMANDS_DIR, COMMAND_LOG_FILE)
+
+    # Build the entry dict directly (same fields and order as
+    # CommandLogEntry.to_dict) rather than via a throwaway dataclass
+    entry: Dict[str, Any] = {"timestamp": _timestamp(), "command": command}
+    if duration_sec is not None:
+        entry["duration_sec"] = duration_sec
+    if result is not None:
+        entry["result"] = result
+    if error_message is not None:
+        entry["error_message"] = error_message
+    for key in _COMMAND_CONTEXT_FIELDS:
+        value = kwargs.get(key)
+        if value is not None:
+            entry[key] = value
+
+    line = _encode_line(entry)
+    with _stats_lock:
+        log_size = _append_line(log_file, line)
+        _update_command_stats(log_file, entry, log_size, len(line))
 
     return log_file
 
@@ -163,25 +348,96 @@ def log_export(
     Returns:
         Path to the log file
     """
-    logs_path = _ensure_log_dirs(project_path)
-    log_file = logs_path / EXPORTS_DIR / "export_log.jsonl"
-
-    entry = ExportLogEntry(
-        timestamp=datetime.now().isoformat(),
-        files=files,
-        qc_passed=qc_passed,
-        human_review=human_review,
-        destination=destination,
-        url=url,
-        export_manifest=export_manifest,
-    )
-
-    with open(log_file, "a") as f:
-        f.write(entry.to_json() + "\n")
+    log_file = _prepare_log_file(project_path, EXPORTS_DIR, EXPORT_LOG_FILE)
+
+    # Same fields, order and None-filtering as ExportLogEntry.to_dict
+    entry: Dict[str, Any] = {"timestamp": _timestamp()}
+    for key, value in (
+        ("files", files),
+        ("qc_passed", qc_passed),
+        ("human_review", human_review),
+        ("destination", destination),
+        ("url", url),
+        ("export_manifest", export_manifest),
+    ):
+        if value is not None:
+            entry[key] = value
+
+    _append_line(log_file, _encode_line(entry))
 
     return log_file
 
 
+_TAIL_BLOCK_SIZE = 65536
+
+
+def _iter_lines_reversed(f: IO[bytes]) -> Iterator[bytes]:
+    """Yield the lines of a binary file from last to first.
+
+    Reads backwards in fixed-size blocks so that fetching the newest entries
+    costs O(limit) rather than O(file size).
+    """
+    f.seek(0, os.SEEK_END)
+    pos = f.tell()
+    remainder = b""
+    while pos > 0:
+        read_size = min(_TAIL_BLOCK_SIZE, pos)
+        pos -= read_size
+        f.seek(pos)
+        buf = f.read(read_size) + remainder
+        # Walk newlines with bytes.rfind (a C memrchr scan) so only the
+        # lines actually consumed are sliced out of the block
+        end = len(buf)
+        newline = buf.rfind(b"\n", 0, end)
+        while newline != -1:
+            yield buf[newline + 1:end]
+            end = newline
+            newline = buf.rfind(b"\n", 0, end)
+        remainder = buf[:end]
+    yield remainder
+
+
+def _read_log_entries(
+    log_file: Path,
+    limit: Optional[int] = None,
+    command_filter: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Read JSONL log entries newest first, skipping malformed lines.
+
+    With a positive limit the file is read from the end and stops once
+    enough entries are found; otherwise it is streamed front to back.
+    """
+    if not log_file.exists():
+        return []
+
+    tail = limit is not None and limit > 0
+    entries = []
+    # Binary mode: the io layer splits lines in C and the JSON parser takes
+    # the raw UTF-8 bytes, so no separate decode pass is needed
+    with open(log_file, "rb") as f:
+        for line in _iter_lines_reversed(f) if tail else f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = _json_loads(line)
+            except ValueError:
+                continue
+            if command_filter is not None and entry.get("command") != command_filter:
+                continue
+            entries.append(entry)
+            if tail and len(entries) >= limit:
+                break
+
+    if not tail:
+        # Reverse for newest first
+        entries.reverse()
+        if limit:
+            entries = entries[:limit]
+
+    return entries
+
+
 def get_command_history(
     project_path: Path,
     limit: Optional[int] = None,
@@ -198,28 +454,8 @@ def get_command_history(
     Returns:
         List of command log entries
     """
-    log_file = Path(project_path) / "project_state" / LOGS_DIR / COMMANDS_DIR / "command_log.jsonl"
-
-    if not log_file.exists():
-        return []
-
-    entries = []
-    for line in log_file.read_text().strip().split("\n"):
-        if line:
-            try:
-                entry = json.loads(line)
-                if command_filter is None or entry.get("command") == command_filter:
-                    entries.append(entry)
-            except json.JSONDecodeError:
-                continue
-
-    # Reverse for newest first
-    entries.reverse()
-
-    if limit:
-        entries = entries[:limit]
-
-    return entries
+    log_file = _log_file_path(os.fspath(project_path), COMMANDS_DIR, COMMAND_LOG_FILE)
+    return _read_log_entries(log_file, limit, command_filter)
 
 
 def get_export_history(
@@ -236,67 +472,120 @@ def get_export_history(
     Returns:
         List of export log entries
     """
-    log_file = Path(project_path) / "project_state" / LOGS_DIR / EXPORTS_DIR / "export_log.jsonl"
-
-    if not log_file.exists():
-        return []
+    log_file = _log_file_path(os.fspath(project_path), EXPORTS_DIR, EXPORT_LOG_FILE)
+    return _read_log_entries(log_file, limit)
 
-    entries = []
-    for line in log_file.read_text().strip().split("\n"):
-        if line:
-            try:
-                entries.append(json.loads(line))
-            except json.JSONDecodeError:
-                continue
 
-    entries.reverse()
+def _compute_command_stats(history: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Aggregate command statistics from history (newest first).
 
-    if limit:
-        entries = entries[:limit]
+    The result includes the internal success_count used by the running
+    stats file alongside the public fields.
+    """
+    success_count = sum(1 for e in history if e.get("result") == "success")
+    return {
+        "total_commands": len(history),
+        "commands_by_type": dict(Counter(e.get("command", "unknown") for e in history)),
+        "success_rate": success_count / len(history) if history else 0.0,
+        "total_duration_sec": sum(
+            (e["duration_sec"] for e in history if e.get("duration_sec")), 0.0
+        ),
+        "first_command": history[-1].get("timestamp") if history else None,
+        "last_command": history[0].get("timestamp") if history else None,
+        "success_count": success_count,
+    }
 
-    return entries
 
+def _update_command_stats(
+    log_file: Path,
+    entry: Dict[str, Any],
+    log_size: int,
+    line_size: int,
+) -> None:
+    """Fold one appended entry into the running stats file.
 
-def get_command_stats(project_path: Path) -> Dict[str, Any]:
+    The stats file records the log size it covers. If that does not match
+    the log size just before this entry (first run, a crash, or another
+    process appending concurrently), the stats are rebuilt from the log.
+    """
+    stats_path = log_file.parent / COMMAND_STATS_FILE
+    with open(stats_path, "a+", encoding="utf-8") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        f.seek(0)
+        try:
+            stats = json.loads(f.read() or "null")
+        except ValueError:
+            stats = None
+
+        if isinstance(stats, dict) and stats.get("log_size") == log_size - line_size:
+            command = entry.get("command", "unknown")
+            by_type = stats["commands_by_type"]
+            by_type[command] = by_type.get(command, 0) + 1
+            stats["total_commands"] += 1
+            if entry.get("result") == "success":
+                stats["success_count"] += 1
+            if entry.get("duration_sec"):
+                stats["total_duration_sec"] += entry["duration_sec"]
+            if stats["first_command"] is None:
+                stats["first_command"] = entry.get("timestamp")
+            stats["last_command"] = entry.get("timestamp")
+        else:
+            stats = _compute_command_stats(_read_log_entries(log_file))
+            log_size = log_file.stat().st_size
+
+        stats["success_rate"] = (
+            stats["success_count"] / stats["total_commands"]
+            if stats["total_commands"] else 0.0
+        )
+        stats["log_size"] = log_size
+
+        f.seek(0)
+        f.truncate()
+        f.write(json.dumps(stats))
+
+
+def get_command_stats(
+    project_path: Optional[Path] = None,
+    *,
+    history: Optional[List[Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
     """
     Get statistics about command usage.
 
+    Reads the running stats maintained by log_command, falling back to a
+    full scan of the command log when they are missing or out of date.
+    Callers that already loaded the history can pass it to skip all I/O.
+
     Args:
         project_path: Root path of the project
+        history: Preloaded command history (newest first)
 
     Returns:
         Dict with command statistics
     """
-    history = get_command_history(project_path)
-
-    stats = {
-        "total_commands": len(history),
-        "commands_by_type": {},
-        "success_rate": 0.0,
-        "total_duration_sec": 0.0,
-        "first_command": None,
-        "last_command": None,
-    }
-
-    if not history:
+    if history is not None:
+        stats = _compute_command_stats(history)
+        stats.pop("success_count")
         return stats
+    if project_path is None:
+        raise ValueError("project_path or history is required")
 
-    success_count = 0
-    for entry in history:
-        command = entry.get("command", "unknown")
-        stats["commands_by_type"][command] = stats["commands_by_type"].get(command, 0) + 1
+    log_file = _log_file_path(os.fspath(project_path), COMMANDS_DIR, COMMAND_LOG_FILE)
 
-        if entry.get("result") == "success":
-            success_count += 1
+    stats = None
+    try:
+        stored = json.loads((log_file.parent / COMMAND_STATS_FILE).read_text(encoding="utf-8"))
+        if isinstance(stored, dict) and stored.get("log_size") == log_file.stat().st_size:
+            stats = stored
+    except (OSError, ValueError):
+        pass
 
-        duration = entry.get("duration_sec")
-        if duration:
-            stats["total_duration_sec"] += duration
-
-    stats["success_rate"] = success_count / len(history) if history else 0.0
-    stats["first_command"] = history[-1].get("timestamp") if history else None
-    stats["last_command"] = history[0].get("timestamp") if history else None
+    if stats is None:
+        stats = _compute_command_stats(get_command_history(project_path))
 
+    stats.pop("log_size", None)
+    stats.pop("success_count", None)
     return stats
 
 
@@ -310,47 +599,77 @@ def compute_file_hash(file_path: Path) -> str:
     Returns:
         Hex string of SHA-256 hash
     """
-    sha256 = hashlib.sha256()
     with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256.update(chunk)
-    return sha256.hexdigest()
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+        sha256 = hashlib.sha256()
+        if os.fstat(f.fileno()).st_size:  # mmap rejects empty files
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                sha256.update(mapped)
+        return sha256.hexdigest()
+
+
+# Hashing is I/O bound and hashlib releases the GIL, so threads help
+_MAX_HASH_WORKERS = 8
+
+
+def _scan_data_files(data_dir: Path) -> List[os.DirEntry]:
+    """List visible regular files in a directory, sorted by name.
+
+    Uses os.scandir so the file type and size come from the cached
+    directory entry rather than separate stat calls per file.
+    """
+    try:
+        with os.scandir(data_dir) as it:
+            entries = [e for e in it if not e.name.startswith(".") and e.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    entries.sort(key=lambda e: e.name)
+    return entries
+
+
+def _safe_hash(file_path: Union[str, Path]) -> Optional[str]:
+    """Hash a file, returning None if it cannot be read."""
+    try:
+        return compute_file_hash(file_path)
+    except OSError:
+        return None
+
+
+def _hash_files(file_paths: List[Any]) -> Dict[Any, Optional[str]]:
+    """Hash files concurrently, mapping each path to its digest or None."""
+    if not file_paths:
+        return {}
+    workers = min(_MAX_HASH_WORKERS, len(file_paths))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(file_paths, executor.map(_safe_hash, file_paths)))
 
 
 def get_package_versions() -> Dict[str, str]:
     """
     Get versions of key packages.
 
+    Versions cannot change within a process, so they are looked up once
+    and a copy of the cached result is returned.
+
     Returns:
         Dict of package name to version
     """
-    packages = {}
+    return dict(_package_versions())
 
-    # Core packages to check
-    package_list = [
-        "pandas",
-        "matplotlib",
-        "python-pptx",
-        "pyyaml",
-        "pillow",
-        "duckdb",
-    ]
 
-    for pkg_name in package_list:
+@lru_cache(maxsize=1)
+def _package_versions() -> Dict[str, str]:
+    """Look up key package versions (cached for the process lifetime)."""
+    packages = {}
+
+    # Read versions from installed distribution metadata rather than
+    # importing the packages (importing pandas alone takes hundreds of ms)
+    for pkg_name in KEY_PACKAGES:
         try:
-            if pkg_name == "python-pptx":
-                import pptx
-                packages[pkg_name] = getattr(pptx, "__version__", "unknown")
-            elif pkg_name == "pyyaml":
-                import yaml
-                packages[pkg_name] = getattr(yaml, "__version__", "unknown")
-            elif pkg_name == "pillow":
-                from PIL import Image
-                packages[pkg_name] = getattr(Image, "__version__", "unknown")
-            else:
-                module = __import__(pkg_name)
-                packages[pkg_name] = getattr(module, "__version__", "unknown")
-        except ImportError:
+            packages[pkg_name] = metadata.version(pkg_name)
+        except metadata.PackageNotFoundError:
             packages[pkg_name] = "not installed"
 
     return packages
@@ -376,112 +695,109 @@ def create_reproducibility_record(
     logs_path = _ensure_log_dirs(project_path)
     record_path = logs_path / "reproducibility.md"
 
-    # Get template version
-    template_version = "unknown"
-    version_file = project_path / ".kaca-version.json"
-    if version_file.exists():
-        try:
-            data = json.loads(version_file.read_text())
-            template_version = data.get("template_version", "unknown")
-        except (json.JSONDecodeError, IOError):
-            pass
+    template_version = _get_template_version(project_path)
 
     # Get package versions
     packages = get_package_versions()
 
-    # Build record content
-    lines = [
-        "# Reproducibility Record",
-        "",
-        f"Generated: {datetime.now().isoformat()}",
-        "",
-        "## Environment",
-        "",
-        f"- Template Version: {template_version}",
-        f"- Python Version: {sys.version.split()[0]}",
-        f"- Platform: {platform.system()} {platform.release()}",
-        "",
-        "### Key Package Versions",
-        "",
-    ]
+    # Build record content as UTF-8 bytes in a single buffer
+    buf = io.BytesIO()
+    write = buf.write
+
+    write(b"# Reproducibility Record\n\n")
+    write(f"Generated: {datetime.now().isoformat()}\n\n".encode())
+    write(b"## Environment\n\n")
+    write((
+        f"- Template Version: {template_version}\n"
+        f"- Python Version: {sys.version.split()[0]}\n"
+        f"- Platform: {platform.system()} {platform.release()}\n"
+    ).encode())
+    write(b"\n### Key Package Versions\n\n")
 
     for pkg, version in sorted(packages.items()):
-        lines.append(f"- {pkg}: {version}")
+        write(f"- {pkg}: {version}\n".encode())
 
-    lines.append("")
+    write(b"\n")
 
-    # Data hashes
+    # Collect files first so all hashing can run concurrently
+    data_sections = []
     if include_data_hashes:
-        lines.extend([
-            "## Data Snapshot",
-            "",
-        ])
-
         raw_dir = project_path / "data" / "raw"
         processed_dir = project_path / "data" / "processed"
 
         for data_dir, label in [(raw_dir, "Raw"), (processed_dir, "Processed")]:
-            if data_dir.exists():
-                data_files = [f for f in data_dir.iterdir() if f.is_file() and not f.name.startswith(".")]
-                if data_files:
-                    lines.append(f"### {label} Data")
-                    lines.append("")
-                    for file_path in sorted(data_files)[:10]:  # Limit to 10 files
-                        try:
-                            file_hash = compute_file_hash(file_path)
-                            size_kb = file_path.stat().st_size / 1024
-                            lines.append(f"- {file_path.name}: {file_hash[:16]}... ({size_kb:.1f} KB)")
-                        except Exception:
-                            lines.append(f"- {file_path.name}: (could not compute hash)")
-                    lines.append("")
+            data_files = _scan_data_files(data_dir)
+            if data_files:
+                data_sections.append((label, data_files[:10]))  # Limit to 10 files
 
-    # Model artifacts
+    model_files = []
     if include_model_info:
-        outputs_dir = project_path / "outputs"
-        model_files = []
-
-        if outputs_dir.exists():
-            for ext in [".pkl", ".joblib", ".h5", ".pt", ".onnx"]:
-                model_files.extend(outputs_dir.rglob(f"*{ext}"))
-
-        if model_files:
-            lines.extend([
-                "## Model Artifacts",
-                "",
-            ])
-            for model_path in model_files:
+        # One walk over outputs/ instead of an rglob per extension
+        for dir_path, _, file_names in os.walk(project_path / "outputs"):
+            model_files.extend(
+                Path(dir_path) / name
+                for name in file_names
+                if os.path.splitext(name)[1] in MODEL_EXTENSIONS
+            )
+        model_files.sort()
+
+    hashes = _hash_files(
+        [entry.path for _, entries in data_sections for entry in entries] + model_files
+    )
+
+    # Data hashes
+    if include_data_hashes:
+        write(b"## Data Snapshot\n\n")
+
+        for label, data_files in data_sections:
+            write(f"### {label} Data\n\n".encode())
+            for entry in data_files:
+                file_hash = hashes[entry.path]
                 try:
-                    file_hash = compute_file_hash(model_path)
-                    size_kb = model_path.stat().st_size / 1024
-                    lines.append(f"- {model_path.name}")
-                    lines.append(f"  - Hash: {file_hash[:16]}...")
-                    lines.append(f"  - Size: {size_kb:.1f} KB")
-                    lines.append(f"  - Modified: {datetime.fromtimestamp(model_path.stat().st_mtime).isoformat()}")
-                except Exception:
-                    lines.append(f"- {model_path.name}: (could not read)")
-            lines.append("")
+                    size_kb = entry.stat().st_size / 1024
+                except OSError:
+                    file_hash = None
+                if file_hash is None:
+                    write(f"- {entry.name}: (could not compute hash)\n".encode())
+                else:
+                    write(f"- {entry.name}: {file_hash[:16]}... ({size_kb:.1f} KB)\n".encode())
+            write(b"\n")
+
+    # Model artifacts
+    if model_files:
+        write(b"## Model Artifacts\n\n")
+        for model_path in model_files:
+            file_hash = hashes[model_path]
+            try:
+                model_stat = model_path.stat()
+            except OSError:
+                file_hash = None
+            if file_hash is None:
+                write(f"- {model_path.name}: (could not read)\n".encode())
+                continue
+            write((
+                f"- {model_path.name}\n"
+                f"  - Hash: {file_hash[:16]}...\n"
+                f"  - Size: {model_stat.st_size / 1024:.1f} KB\n"
+                f"  - Modified: {datetime.fromtimestamp(model_stat.st_mtime).isoformat()}\n"
+            ).encode())
+        write(b"\n")
 
     # Command history summary
     stats = get_command_stats(project_path)
     if stats["total_commands"] > 0:
-        lines.extend([
-            "## Session History",
-            "",
-            f"- Total Commands: {stats['total_commands']}",
-            f"- Success Rate: {stats['success_rate']:.1%}",
-            f"- Total Duration: {stats['total_duration_sec']:.0f} seconds",
-            f"- First Command: {stats['first_command']}",
-            f"- Last Command: {stats['last_command']}",
-            "",
-        ])
-
-    lines.extend([
-        "---",
-        "",
-        "*Generated by Kearney AI Coding Assistant Audit Logger*",
-    ])
-
-    record_path.write_text("\n".join(lines))
+        write((
+            "## Session History\n\n"
+            f"- Total Commands: {stats['total_commands']}\n"
+            f"- Success Rate: {stats['success_rate']:.1%}\n"
+            f"- Total Duration: {stats['total_duration_sec']:.0f} seconds\n"
+            f"- First Command: {stats['first_command']}\n"
+            f"- Last Command: {stats['last_command']}\n\n"
+        ).encode())
+
+    write(b"---\n\n*Generated by Kearney AI Coding Assistant Audit Logger*")
+
+    record_path.write_bytes(buf.getvalue())
     return record_path
 
 
@@ -507,14 +823,9 @@ def create_export_manifest(
 
     # Get project name from spec
     project_name = "unknown"
-    spec_path = project_path / "project_state" / "spec.yaml"
-    if spec_path.exists():
-        try:
-            import yaml
-            spec = yaml.safe_load(spec_path.read_text())
-            project_name = spec.get("meta", {}).get("project_name", "unknown")
-        except Exception:
-            pass
+    spec_signature = _file_signature(project_path / "project_state" / "spec.yaml")
+    if spec_signature is not None:
+        project_name = _read_project_name(spec_signature)
 
     manifest = {
         "project_name": project_name,
@@ -532,16 +843,53 @@ def create_export_manifest(
     return manifest_path
 
 
+def _file_signature(path: Path) -> Optional[Tuple[str, int, int]]:
+    """Return (path, mtime_ns, size) for cache keys, or None if missing."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (str(path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=16)
+def _read_project_name(spec_signature: Tuple[str, int, int]) -> str:
+    """Read meta.project_name from spec.yaml, cached until the file changes."""
+    try:
+        import yaml
+        # libyaml-backed loader when available (several times faster)
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        with open(spec_signature[0], encoding="utf-8") as f:
+            spec = yaml.load(f, Loader=loader)
+        return spec.get("meta", {}).get("project_name", "unknown")
+    except Exception:
+        return "unknown"
+
+
 def _get_template_version(project_path: Path) -> str:
     """Get template version from .kaca-version.json."""
-    version_file = Path(project_path) / ".kaca-version.json"
-    if version_file.exists():
-        try:
-            data = json.loads(version_file.read_text())
-            return data.get("template_version", "unknown")
-        except (json.JSONDecodeError, IOError):
-            pass
-    return "unknown"
+    version_signature = _file_signature(Path(project_path) / ".kaca-version.json")
+    if version_signature is None:
+        return "unknown"
+    return _read_template_version(version_signature)
+
+
+@lru_cache(maxsize=16)
+def _read_template_version(version_signature: Tuple[str, int, int]) -> str:
+    """Parse .kaca-version.json, cached until the file changes."""
+    try:
+        with open(version_signature[0], "rb") as f:
+            data = _json_loads(f.read())
+        return data.get("template_version", "unknown")
+    except (ValueError, OSError):
+        return "unknown"
+
+
+# Fixed per-line layouts for the history formatters
+_CMD_LINE_FMT = "  %s %s %s %s"
+_DURATION_FMT = "(%.1fs)"
+_EXPORT_LINE_FMT = "  %s - %s - %s - %s"
+_EXPORT_FILE_FMT = "    - %s"
 
 
 def format_command_history(history: List[Dict[str, Any]], max_entries: int = 20) -> str:
@@ -571,9 +919,9 @@ def format_command_history(history: List[Dict[str, Any]], max_entries: int = 20)
         duration = entry.get("duration_sec", "")
 
         status = "[OK]" if result == "success" else "[ERR]"
-        duration_str = f"({duration:.1f}s)" if duration else ""
+        duration_str = _DURATION_FMT % duration if duration else ""
 
-        lines.append(f"  {status} {timestamp} {command} {duration_str}")
+        lines.append(_CMD_LINE_FMT % (status, timestamp, command, duration_str))
 
         if entry.get("task_id"):
             lines.append(f"       Task: {entry['task_id']}")
@@ -613,9 +961,8 @@ def format_export_history(history: List[Dict[str, Any]], max_entries: int = 10)
         review = "Reviewed" if entry.get("human_review") else "Pending Review"
         dest = entry.get("destination", "local")
 
-        lines.append(f"  {timestamp} - {dest} - {qc} - {review}")
-        for f in files[:5]:
-            lines.append(f"    - {f}")
+        lines.append(_EXPORT_LINE_FMT % (timestamp, dest, qc, review))
+        lines.extend(_EXPORT_FILE_FMT % (f,) for f in files[:5])
         if len(files) > 5:
             lines.append(f"    ... and {len(files) - 5} more files")
         lines.append("")
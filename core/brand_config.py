@@ -21,14 +21,26 @@ Usage:
     # Check if a color is allowed
     if is_color_allowed("#0066CC", config):
         print("Color is allowed")
+
+    # For many checks, compile the config once and pass the lean view
+    compiled = config.compiled
+    flagged = [c for c in ("#00FF00", "#0066CC") if is_color_forbidden(c, compiled)]
 """
 
+import copy
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Set
+from typing import Dict, Any, FrozenSet, List, Optional, Set, Tuple, Union
 from dataclasses import dataclass, field
 
 import yaml
 
+try:
+    # libyaml-backed loader, several times faster than the pure-Python one
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader  # type: ignore
+
 
 # Default Kearney brand configuration
 DEFAULT_BRAND_CONFIG = {
@@ -74,9 +86,14 @@ DEFAULT_BRAND_CONFIG = {
 }
 
 
-@dataclass
+# Parsed configs keyed by (project path, brand.yaml stamp, override stamp)
+_CONFIG_CACHE: Dict[Tuple[Any, ...], "BrandConfig"] = {}
+_CONFIG_CACHE_SIZE = 32
+
+
+@dataclass(slots=True)
 class BrandConfig:
-    """Brand configuration container."""
+    """Brand configuration container (slotted: no per-instance __dict__)."""
     brand_name: str = "Kearney"
     is_override: bool = False
     override_path: Optional[str] = None
@@ -107,6 +124,11 @@ class BrandConfig:
     logo_path: Optional[str] = None
     logo_placement: str = "top-right"
 
+    @property
+    def compiled(self) -> "CompiledBrandConfig":
+        """Immutable lookup sets for the current settings (see compile_brand_config)."""
+        return compile_brand_config(self)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -141,12 +163,57 @@ class BrandConfig:
         }
 
 
+@dataclass(frozen=True, slots=True)
+class CompiledBrandConfig:
+    """
+    Immutable, preprocessed view of a BrandConfig for hot-path checks.
+
+    Colors are lowercased and every collection is a frozenset, so each
+    check is a single hash lookup.
+    """
+    forbidden: FrozenSet[str]
+    allowed: FrozenSet[str]
+    enforced: FrozenSet[str]
+    chart_colors: Tuple[str, ...]
+
+
+def compile_brand_config(config: BrandConfig) -> CompiledBrandConfig:
+    """
+    Build the CompiledBrandConfig for a config's current settings.
+
+    The result is a snapshot: compile again after editing the config.
+    """
+    return _compile_brand_config(
+        tuple(config.forbidden_colors),
+        frozenset(config.allowed_colors),
+        tuple(config.enforced_rules),
+        tuple(config.chart_colors),
+    )
+
+
+@lru_cache(maxsize=32)
+def _compile_brand_config(
+    forbidden_colors: Tuple[str, ...],
+    allowed_colors: FrozenSet[str],
+    enforced_rules: Tuple[str, ...],
+    chart_colors: Tuple[str, ...],
+) -> CompiledBrandConfig:
+    """Compile one combination of settings; shared by equal configs."""
+    return CompiledBrandConfig(
+        forbidden=_forbidden_set(forbidden_colors),
+        allowed=frozenset(color.lower() for color in allowed_colors),
+        enforced=frozenset(enforced_rules),
+        chart_colors=chart_colors,
+    )
+
+
 def _load_yaml_file(path: Path) -> Optional[Dict[str, Any]]:
     """Load a YAML file safely."""
-    if not path.exists():
-        return None
     try:
-        return yaml.safe_load(path.read_text())
+        # Stream the binary file so the parser reads and decodes it itself;
+        # a missing file is an IOError like any other read failure
+        with path.open("rb") as f:
+            return yaml.load(f, Loader=_Loader)
     except (yaml.YAMLError, IOError):
         return None
 
@@ -167,7 +234,25 @@ def load_brand_config(project_path: Path) -> BrandConfig:
         BrandConfig with merged settings
     """
     project_path = Path(project_path)
+    default_path = project_path / "config" / "governance" / "brand.yaml"
+    override_path = project_path / "config" / "brand_override.yaml"
+
+    # Configs rarely change within a session; reuse the parsed result until
+    # either YAML file is created, edited or removed
+    cache_key = (project_path, _file_stamp(default_path), _file_stamp(override_path))
+    config = _CONFIG_CACHE.get(cache_key)
+    if config is None:
+        config = _build_brand_config(default_path, override_path)
+        if len(_CONFIG_CACHE) >= _CONFIG_CACHE_SIZE:
+            _CONFIG_CACHE.clear()
+        _CONFIG_CACHE[cache_key] = config
+
+    # Hand out a copy so callers cannot mutate the cached config
+    return copy.deepcopy(config)
+
 
+def _build_brand_config(default_path: Path, override_path: Path) -> BrandConfig:
+    """Build a BrandConfig from the default and override YAML files."""
     # Initialize with defaults
     config = BrandConfig()
     config.forbidden_colors = DEFAULT_BRAND_CONFIG["colors"]["forbidden"].copy()
@@ -175,14 +260,12 @@ def load_brand_config(project_path: Path) -> BrandConfig:
     config.enforced_rules = DEFAULT_BRAND_CONFIG["enforced"].copy()
 
     # Try to load default brand.yaml
-    default_path = project_path / "config" / "governance" / "brand.yaml"
     default_config = _load_yaml_file(default_path)
 
     if default_config:
         _apply_config(config, default_config)
 
     # Check for override
-    override_path = project_path / "config" / "brand_override.yaml"
     override_config = _load_yaml_file(override_path)
 
     if override_config and override_config.get("enabled", False):
@@ -212,69 +295,95 @@ def load_brand_config(project_path: Path) -> BrandConfig:
     return config
 
 
+def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) for a config file, or None if it is missing."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+# Dotted YAML key -> BrandConfig attribute it sets
+_CONFIG_FIELDS: Dict[str, str] = {
+    "brand_name": "brand_name",
+    "colors.primary": "primary_color",
+    "colors.secondary": "secondary_color",
+    "colors.background.dark": "background_dark",
+    "colors.background.light": "background_light",
+    "colors.accent": "accent_colors",
+    "typography.primary": "primary_font",
+    "typography.fallback": "fallback_font",
+    "typography.weights": "font_weights",
+    # Note: gridlines is ALWAYS false due to enforced rules
+    "charts.gridlines": "gridlines_allowed",
+    "charts.data_labels_outside": "data_labels_outside",
+    "charts.default_colors": "chart_colors",
+    "logo.path": "logo_path",
+    "logo.placement": "logo_placement",
+}
+
+# Dotted keys of mappings that contain configurable fields
+_CONFIG_SECTIONS = frozenset(
+    key.rsplit(".", 1)[0] for key in _CONFIG_FIELDS if "." in key
+)
+
+
 def _apply_config(config: BrandConfig, data: Dict[str, Any]) -> None:
     """Apply configuration data to BrandConfig object."""
-    if "brand_name" in data:
-        config.brand_name = data["brand_name"]
-
-    if "colors" in data:
-        colors = data["colors"]
-        if "primary" in colors:
-            config.primary_color = colors["primary"]
-        if "secondary" in colors:
-            config.secondary_color = colors["secondary"]
-        if "background" in colors:
-            bg = colors["background"]
-            if "dark" in bg:
-                config.background_dark = bg["dark"]
-            if "light" in bg:
-                config.background_light = bg["light"]
-        if "accent" in colors:
-            config.accent_colors = colors["accent"]
-
-    if "typography" in data:
-        typo = data["typography"]
-        if "primary" in typo:
-            config.primary_font = typo["primary"]
-        if "fallback" in typo:
-            config.fallback_font = typo["fallback"]
-        if "weights" in typo:
-            config.font_weights = typo["weights"]
-
-    if "charts" in data:
-        charts = data["charts"]
-        # Note: gridlines is ALWAYS false due to enforced rules
-        if "gridlines" in charts:
-            config.gridlines_allowed = charts["gridlines"]
-        if "data_labels_outside" in charts:
-            config.data_labels_outside = charts["data_labels_outside"]
-        if "default_colors" in charts:
-            config.chart_colors = charts["default_colors"]
-
-    if "logo" in data:
-        logo = data["logo"]
-        if "path" in logo:
-            config.logo_path = logo["path"]
-        if "placement" in logo:
-            config.logo_placement = logo["placement"]
+    # Walk the data once, setting known fields and descending into known
+    # sections; unknown keys (enabled, enforced, colors.forbidden, ...) are
+    # skipped
+    stack = [("", data)]
+    while stack:
+        prefix, section = stack.pop()
+        for key, value in section.items():
+            if not isinstance(key, str):
+                continue
+            dotted = prefix + key
+            attr = _CONFIG_FIELDS.get(dotted)
+            if attr is not None:
+                setattr(config, attr, value)
+            elif dotted in _CONFIG_SECTIONS and isinstance(value, dict):
+                stack.append((dotted + ".", value))
 
 
 def _build_allowed_colors(config: BrandConfig) -> Set[str]:
     """Build the set of allowed colors from config."""
+    return set(_allowed_colors_for(
+        config.primary_color,
+        config.secondary_color,
+        config.background_dark,
+        config.background_light,
+        tuple(config.accent_colors),
+        tuple(config.chart_colors),
+    ))
+
+
+@lru_cache(maxsize=32)
+def _allowed_colors_for(
+    primary_color: str,
+    secondary_color: str,
+    background_dark: str,
+    background_light: str,
+    accent_colors: Tuple[str, ...],
+    chart_colors: Tuple[str, ...],
+) -> FrozenSet[str]:
+    """Compute the allowed color set for one combination of brand colors."""
     allowed = set()
 
     # Add primary, secondary, backgrounds
-    allowed.add(config.primary_color.lower())
-    allowed.add(config.secondary_color.lower())
-    allowed.add(config.background_dark.lower())
-    allowed.add(config.background_light.lower())
+    allowed.add(primary_color.lower())
+    allowed.add(secondary_color.lower())
+    allowed.add(background_dark.lower())
+    allowed.add(background_light.lower())
 
     # Add accent colors
-    for color in config.accent_colors:
+    for color in accent_colors:
         allowed.add(color.lower())
 
     # Add chart colors
-    for color in config.chart_colors:
+    for color in chart_colors:
         allowed.add(color.lower())
 
     # Add common neutral colors
@@ -282,51 +391,51 @@ def _build_allowed_colors(config: BrandConfig) -> Set[str]:
     for color in neutrals:
         allowed.add(color)
 
-    return allowed
+    return frozenset(allowed)
 
 
-def is_color_allowed(color: str, config: BrandConfig) -> bool:
+def is_color_allowed(
+    color: str, config: Union[BrandConfig, CompiledBrandConfig]
+) -> bool:
     """
     Check if a color is allowed under the brand config.
 
     Args:
         color: Hex color string (e.g., "#7823DC")
-        config: BrandConfig to check against
+        config: BrandConfig or CompiledBrandConfig to check against
 
     Returns:
         True if color is allowed
     """
-    normalized = color.lower().strip()
-
-    # Check if explicitly forbidden
-    for forbidden in config.forbidden_colors:
-        if normalized == forbidden.lower():
-            return False
-
-    # Check if explicitly allowed
-    if normalized in config.allowed_colors:
-        return True
+    # Explicitly allowed colors and unknown colors are both allowed; only
+    # forbidden colors are blocked
+    return not is_color_forbidden(color, config)
 
-    # Default: allow (only forbidden colors are blocked)
-    return True
 
-
-def is_color_forbidden(color: str, config: BrandConfig) -> bool:
+def is_color_forbidden(
+    color: str, config: Union[BrandConfig, CompiledBrandConfig]
+) -> bool:
     """
     Check if a color is explicitly forbidden.
 
     Args:
         color: Hex color string (e.g., "#00FF00")
-        config: BrandConfig to check against
+        config: BrandConfig or CompiledBrandConfig to check against
 
     Returns:
         True if color is forbidden
     """
-    normalized = color.lower().strip()
-    for forbidden in config.forbidden_colors:
-        if normalized == forbidden.lower():
-            return True
-    return False
+    if isinstance(config, CompiledBrandConfig):
+        forbidden = config.forbidden
+    else:
+        forbidden = _forbidden_set(tuple(config.forbidden_colors))
+    return color.lower().strip() in forbidden
+
+
+@lru_cache(maxsize=32)
+def _forbidden_set(forbidden_colors: Tuple[str, ...]) -> FrozenSet[str]:
+    """Lowercased forbidden colors, computed once per distinct list."""
+    return frozenset(color.lower() for color in forbidden_colors)
 
 
 def get_brand_colors(config: BrandConfig) -> Dict[str, str]:
@@ -360,17 +469,21 @@ def get_chart_colors(config: BrandConfig) -> List[str]:
     return config.chart_colors.copy()
 
 
-def is_rule_enforced(rule: str, config: BrandConfig) -> bool:
+def is_rule_enforced(
+    rule: str, config: Union[BrandConfig, CompiledBrandConfig]
+) -> bool:
     """
     Check if a rule is enforced (cannot be overridden).
 
     Args:
         rule: Rule name (e.g., "no_emojis")
-        config: BrandConfig
+        config: BrandConfig or CompiledBrandConfig
 
     Returns:
         True if rule is enforced
     """
+    if isinstance(config, CompiledBrandConfig):
+        return rule in config.enforced
     return rule in config.enforced_rules
 
 
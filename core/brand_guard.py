@@ -13,17 +13,31 @@ Brand Rules (Non-Negotiable):
     - Dark Mode: Default background #1E1E1E
 """
 
+import hashlib
+import json
+import math
+import os
 import re
 import logging
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
-from dataclasses import dataclass
-from typing import List, Optional, Set, Tuple, Union
+from dataclasses import asdict, dataclass
+from typing import AbstractSet, Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple, Union
 
 try:
     from PIL import Image
 except ImportError:
     Image = None  # type: ignore
 
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
 try:
     import yaml
 except ImportError:
@@ -85,20 +99,20 @@ FORBIDDEN_COLORS: Set[str] = {
     "#7fff00",  # Chartreuse
 }
 
-# Emoji detection pattern (comprehensive)
+# Emoji detection pattern (comprehensive). The source blocks overlap, so
+# they are merged into sorted, disjoint ranges: re tests the ranges of a
+# non-BMP class one after another for every non-ASCII character, and four
+# ranges are cheaper to test than the original eleven.
+#   U+24C2-U+1F251  Enclosed characters (covers misc symbols, dingbats, flags)
+#   U+1F300-U+1F64F Symbols & pictographs, emoticons
+#   U+1F680-U+1F6FF Transport & map
+#   U+1F900-U+1FAFF Supplemental symbols, chess symbols, symbols extended
 EMOJI_PATTERN = re.compile(
     "["
-    "\U0001F600-\U0001F64F"  # Emoticons
-    "\U0001F300-\U0001F5FF"  # Symbols & pictographs
-    "\U0001F680-\U0001F6FF"  # Transport & map
-    "\U0001F1E0-\U0001F1FF"  # Flags
-    "\U00002702-\U000027B0"  # Dingbats
-    "\U000024C2-\U0001F251"  # Enclosed characters
-    "\U0001F900-\U0001F9FF"  # Supplemental symbols
-    "\U0001FA00-\U0001FA6F"  # Chess symbols
-    "\U0001FA70-\U0001FAFF"  # Symbols extended
-    "\U00002600-\U000026FF"  # Misc symbols
-    "\U00002700-\U000027BF"  # Dingbats
+    "\U000024C2-\U0001F251"
+    "\U0001F300-\U0001F64F"
+    "\U0001F680-\U0001F6FF"
+    "\U0001F900-\U0001FAFF"
     "]+"
 )
 
@@ -110,6 +124,85 @@ RGB_COLOR_PATTERN = re.compile(
     r"rgba?\s*\(\s*(\d{1,3})\s*,\s*(\d{1,3})\s*,\s*(\d{1,3})"
 )
 
+# Branches of the combined text check pattern, which runs the emoji, hex and
+# RGB checks in one scan. The alternatives start with disjoint characters,
+# so no match hides another. Whitespace in the RGB branch excludes newlines:
+# violations are reported per line and an rgb() split across lines is not
+# a match. The hex branch only matches forbidden colors, so the many allowed
+# hex values in typical files never reach Python code.
+_RGB_BRANCH = (
+    r"(?P<rgb>rgba?[^\S\n]*\([^\S\n]*(?P<r>\d{1,3})[^\S\n]*,"
+    r"[^\S\n]*(?P<g>\d{1,3})[^\S\n]*,[^\S\n]*(?P<b>\d{1,3}))"
+)
+
+# Bytes version of the RGB branch for ASCII-only content, which cannot
+# contain emojis. The explicit whitespace class matches what str \s (minus
+# newline) accepts among ASCII characters.
+_ASCII_SPACE = rb"[ \t\r\x0b\x0c\x1c-\x1f]*"
+_ASCII_RGB_BRANCH = (
+    rb"(?P<rgb>rgba?" + _ASCII_SPACE + rb"\(" + _ASCII_SPACE + rb"(?P<r>\d{1,3})"
+    + _ASCII_SPACE + rb"," + _ASCII_SPACE + rb"(?P<g>\d{1,3})"
+    + _ASCII_SPACE + rb"," + _ASCII_SPACE + rb"(?P<b>\d{1,3}))"
+)
+
+_LOWER_HEX6_PATTERN = re.compile(r"#[0-9a-f]{6}")
+
+
+def _forbidden_hex_branch(forbidden: FrozenSet[str]) -> str:
+    """
+    Regex source matching the hex tokens that HEX_COLOR_PATTERN would find
+    and normalize_hex would map into forbidden, in 6- and 3-digit spellings.
+    """
+    # Only lowercase 6-digit entries can equal a normalized color
+    long_forms = sorted(c[1:] for c in forbidden if _LOWER_HEX6_PATTERN.fullmatch(c))
+    short_forms = [
+        h[0] + h[2] + h[4] for h in long_forms
+        if h[0] == h[1] and h[2] == h[3] and h[4] == h[5]
+    ]
+    branches = [
+        "#(?i:" + "|".join(forms) + r")\b"
+        for forms in (long_forms, short_forms) if forms
+    ]
+    return "(?P<hex>" + ("|".join(branches) or "(?!)") + ")"
+
+
+@lru_cache(maxsize=32)
+def _text_check_pattern(
+    forbidden: FrozenSet[str],
+    as_bytes: bool,
+    emoji: bool,
+    hex_colors: bool,
+    rgb: bool,
+) -> "re.Pattern[Any]":
+    """
+    Compile the combined check pattern with only the requested branches.
+
+    Branches whose marker does not occur in the content are left out, which
+    shrinks the set of characters the engine must consider at each position.
+    Bytes patterns never include the emoji branch.
+    """
+    hex_branch = _forbidden_hex_branch(forbidden)
+    if as_bytes:
+        byte_branches: List[bytes] = []
+        if hex_colors:
+            byte_branches.append(hex_branch.encode("ascii"))
+        if rgb:
+            byte_branches.append(_ASCII_RGB_BRANCH)
+        return re.compile(b"|".join(byte_branches))
+
+    branches: List[str] = []
+    if emoji:
+        branches.append(f"(?P<emoji>{EMOJI_PATTERN.pattern})")
+    if hex_colors:
+        branches.append(hex_branch)
+    if rgb:
+        branches.append(_RGB_BRANCH)
+    return re.compile("|".join(branches))
+
+
+_NAMED_GREEN_PATTERN = re.compile(r"\bgreen\b", re.IGNORECASE)
+_NAMED_GREEN_BYTES_PATTERN = re.compile(rb"\bgreen\b", re.IGNORECASE)
+
 
 def normalize_hex(color: str) -> str:
     """Normalize hex color to lowercase 6-digit format."""
@@ -124,22 +217,98 @@ def rgb_to_hex(r: int, g: int, b: int) -> str:
     return f"#{r:02x}{g:02x}{b:02x}"
 
 
+# Green is dominant when G > 100 and G > 1.3 * R and G > 1.3 * B, which is
+# G >= _GREEN_THRESHOLDS[max(R, B)]: the smallest integer above both bounds.
+# Covers every value a 3-digit rgb() match or an 8-bit pixel can take.
+_GREEN_THRESHOLDS: Tuple[int, ...] = tuple(
+    max(101, math.floor(m * 1.3) + 1) for m in range(1000)
+)
+
+
 def is_green_rgb(r: int, g: int, b: int) -> bool:
     """Check if RGB color is a green variant (green dominates red and blue)."""
+    m = r if r > b else b
+    if 0 <= m < 1000:
+        return g >= _GREEN_THRESHOLDS[m]
     # Green is dominant when G > R and G > B by significant margin
-    if g > 100 and g > r * 1.3 and g > b * 1.3:
-        return True
-    return False
+    return g > 100 and g > r * 1.3 and g > b * 1.3
 
 
-def check_text_content(content: str, file_path: str) -> List[BrandViolation]:
-    """Check text content for brand violations."""
+def _read_source(file_path: Path) -> Union[str, bytes]:
+    """
+    Read a file for the text checks.
+
+    ASCII-only files without carriage returns are returned as undecoded
+    bytes. Anything else is decoded as UTF-8 with universal newlines, like
+    Path.read_text(encoding="utf-8"), and raises UnicodeDecodeError likewise.
+    """
+    raw = file_path.read_bytes()
+    if raw.isascii() and b"\r" not in raw:
+        return raw
+    return raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _matches_by_line(
+    content: Union[str, bytes],
+    pattern: "re.Pattern[Any]",
+) -> Iterator[Tuple[int, "re.Match[Any]"]]:
+    """Yield (line_number, match) for every pattern match in content."""
+    newline: Union[str, bytes] = b"\n" if isinstance(content, bytes) else "\n"
+    line_num = 1
+    pos = 0
+    for match in pattern.finditer(content):
+        start = match.start()
+        line_num += content.count(newline, pos, start)
+        pos = start
+        yield line_num, match
+
+
+def check_text_content(content: Union[str, bytes], file_path: str) -> List[BrandViolation]:
+    """
+    Check text content for brand violations.
+
+    ASCII-only content may be passed as bytes and is then scanned without
+    decoding; emojis cannot occur in ASCII.
+    """
     violations: List[BrandViolation] = []
-    lines = content.split("\n")
+    is_bytes = isinstance(content, bytes)
+
+    # Prefilter: each check needs its marker somewhere in the content (a
+    # non-ASCII character for emojis, '#' for hex, 'rgb' for RGB). These
+    # substring tests run at C speed and decide which branches to scan for.
+    if is_bytes:
+        scan_emoji = False
+        scan_hex = b"#" in content
+        scan_rgb = b"rgb" in content
+    else:
+        scan_emoji = not content.isascii()
+        scan_hex = "#" in content
+        scan_rgb = "rgb" in content
+    if not (scan_emoji or scan_hex or scan_rgb):
+        return violations
+
+    # Keyed on the current set so changes to FORBIDDEN_COLORS take effect
+    pattern = _text_check_pattern(
+        frozenset(FORBIDDEN_COLORS), is_bytes, scan_emoji, scan_hex, scan_rgb
+    )
+
+    for line_num, line_matches in groupby(
+        _matches_by_line(content, pattern), key=itemgetter(0)
+    ):
+        emoji_matches: List[str] = []
+        hex_colors: List[str] = []
+        rgb_matches: List[Tuple[str, str, str]] = []
+        for _, match in line_matches:
+            kind = match.lastgroup
+            if kind == "emoji":
+                emoji_matches.append(match.group())
+            elif kind == "hex":
+                color = match.group()
+                hex_colors.append(color.decode("ascii") if is_bytes else color)
+            else:
+                rgb_matches.append(match.group("r", "g", "b"))
 
-    for line_num, line in enumerate(lines, 1):
         # Check for emojis
-        emoji_matches = EMOJI_PATTERN.findall(line)
         if emoji_matches:
             violations.append(BrandViolation(
                 file_path=file_path,
@@ -148,22 +317,18 @@ def check_text_content(content: str, file_path: str) -> List[BrandViolation]:
                 line_number=line_num,
             ))
 
-        # Check hex colors
-        hex_colors = HEX_COLOR_PATTERN.findall(line)
+        # Check hex colors (the pattern only matches forbidden ones)
         for color in hex_colors:
-            normalized = normalize_hex(color)
-            if normalized in FORBIDDEN_COLORS:
-                violations.append(BrandViolation(
-                    file_path=file_path,
-                    rule="FORBIDDEN_COLOR",
-                    message=f"Forbidden green color: {color}",
-                    line_number=line_num,
-                ))
+            violations.append(BrandViolation(
+                file_path=file_path,
+                rule="FORBIDDEN_COLOR",
+                message=f"Forbidden green color: {color}",
+                line_number=line_num,
+            ))
 
         # Check RGB colors
-        rgb_matches = RGB_COLOR_PATTERN.findall(line)
-        for match in rgb_matches:
-            r, g, b = int(match[0]), int(match[1]), int(match[2])
+        for rgb in rgb_matches:
+            r, g, b = int(rgb[0]), int(rgb[1]), int(rgb[2])
             if is_green_rgb(r, g, b):
                 violations.append(BrandViolation(
                     file_path=file_path,
@@ -175,6 +340,39 @@ def check_text_content(content: str, file_path: str) -> List[BrandViolation]:
     return violations
 
 
+# A line can only fail a Python-specific check if it contains one of these
+_PYTHON_LINE_NEEDLES = ("grid(", "'green'", '"green"')
+
+
+def _candidate_lines(
+    text: str, needles: Tuple[str, ...]
+) -> Iterator[Tuple[int, int, int]]:
+    """
+    Yield (line_number, start, end) for lines of text containing any needle.
+
+    Lines are located with str.find from the needle hits, so the text is
+    never split into a list of lines.
+    """
+    starts: Set[int] = set()
+    for needle in needles:
+        i = text.find(needle)
+        while i != -1:
+            start = text.rfind("\n", 0, i) + 1
+            starts.add(start)
+            end = text.find("\n", i)
+            if end == -1:
+                break
+            i = text.find(needle, end + 1)
+
+    line_num = 1
+    pos = 0
+    for start in sorted(starts):
+        line_num += text.count("\n", pos, start)
+        pos = start
+        end = text.find("\n", start)
+        yield line_num, start, len(text) if end == -1 else end
+
+
 def check_python_file(file_path: Path) -> List[BrandViolation]:
     """
     Check Python file for brand violations in color definitions.
@@ -200,11 +398,24 @@ def check_python_file(file_path: Path) -> List[BrandViolation]:
 
     violations.extend(check_text_content(content, str(file_path)))
 
-    # Additional Python-specific checks
-    lines = content.split("\n")
-    for line_num, line in enumerate(lines, 1):
+    # Additional Python-specific checks, only on lines containing a needle.
+    # Lowercasing the whole file once keeps offsets aligned with content
+    # unless a character lowercases to several (rare non-ASCII text).
+    lower = content.lower()
+    if len(lower) == len(content):
+        lines: Iterator[Tuple[int, str, str]] = (
+            (line_num, content[start:end], lower[start:end])
+            for line_num, start, end in _candidate_lines(lower, _PYTHON_LINE_NEEDLES)
+        )
+    else:
+        lines = (
+            (line_num, line, line.lower())
+            for line_num, line in enumerate(content.split("\n"), 1)
+        )
+
+    for line_num, line, line_lower in lines:
         # Check for gridline settings (matplotlib)
-        if "grid(" in line.lower() and "true" in line.lower():
+        if "grid(" in line_lower and "true" in line_lower:
             violations.append(BrandViolation(
                 file_path=str(file_path),
                 rule="NO_GRIDLINES",
@@ -213,8 +424,8 @@ def check_python_file(file_path: Path) -> List[BrandViolation]:
             ))
 
         # Check for direct matplotlib color usage with green
-        if "color=" in line.lower() or "c=" in line:
-            if "'green'" in line.lower() or '"green"' in line.lower():
+        if "color=" in line_lower or "c=" in line:
+            if "'green'" in line_lower or '"green"' in line_lower:
                 violations.append(BrandViolation(
                     file_path=str(file_path),
                     rule="FORBIDDEN_COLOR",
@@ -230,7 +441,7 @@ def check_css_file(file_path: Path) -> List[BrandViolation]:
     violations: List[BrandViolation] = []
 
     try:
-        content = file_path.read_text(encoding="utf-8")
+        content = _read_source(file_path)
     except (IOError, UnicodeDecodeError) as e:
         logger.warning(f"Could not read {file_path}: {e}")
         return violations
@@ -238,7 +449,11 @@ def check_css_file(file_path: Path) -> List[BrandViolation]:
     violations.extend(check_text_content(content, str(file_path)))
 
     # Check for named green color
-    if re.search(r"\bgreen\b", content, re.IGNORECASE):
+    if isinstance(content, bytes):
+        named_green = _NAMED_GREEN_BYTES_PATTERN.search(content)
+    else:
+        named_green = _NAMED_GREEN_PATTERN.search(content)
+    if named_green:
         violations.append(BrandViolation(
             file_path=str(file_path),
             rule="FORBIDDEN_COLOR",
@@ -253,7 +468,7 @@ def check_html_file(file_path: Path) -> List[BrandViolation]:
     violations: List[BrandViolation] = []
 
     try:
-        content = file_path.read_text(encoding="utf-8")
+        content = _read_source(file_path)
     except (IOError, UnicodeDecodeError) as e:
         logger.warning(f"Could not read {file_path}: {e}")
         return violations
@@ -267,7 +482,7 @@ def check_svg_file(file_path: Path) -> List[BrandViolation]:
     violations: List[BrandViolation] = []
 
     try:
-        content = file_path.read_text(encoding="utf-8")
+        content = _read_source(file_path)
     except (IOError, UnicodeDecodeError) as e:
         logger.warning(f"Could not read {file_path}: {e}")
         return violations
@@ -276,6 +491,44 @@ def check_svg_file(file_path: Path) -> List[BrandViolation]:
     return violations
 
 
+if np is not None:
+    # Thresholds for 8-bit channels; values above 255 never reach a pixel
+    _GREEN_THRESHOLD_ARRAY = np.array(_GREEN_THRESHOLDS[:256], dtype=np.int16)
+
+
+def _sample_grid(img: "Image.Image", sample_step: int) -> "Image.Image":
+    """
+    Return the pixels at every sample_step-th row and column as an RGB image.
+
+    The grid is picked with a nearest-neighbour affine transform in C, so
+    only the sampled pixels are copied and converted. The offset moves
+    each output pixel center onto source pixel (x * step, y * step).
+    """
+    if sample_step > 1:
+        width, height = img.size
+        offset = 0.5 - sample_step / 2
+        img = img.transform(
+            (-(-width // sample_step), -(-height // sample_step)),
+            Image.Transform.AFFINE,
+            (sample_step, 0, offset, 0, sample_step, offset),
+            Image.Resampling.NEAREST,
+        )
+    # Conversion is per pixel, so converting the grid gives the same colors
+    # as sampling a converted image
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+    return img
+
+
+def _count_green_pixels(img: "Image.Image") -> Tuple[int, int]:
+    """Count green pixels of a sampled RGB grid with NumPy."""
+    pixels = np.asarray(img)
+    r, g, b = pixels[..., 0], pixels[..., 1], pixels[..., 2]
+    # Same threshold lookup as is_green_rgb, for the whole grid at once
+    green = g >= _GREEN_THRESHOLD_ARRAY[np.maximum(r, b)]
+    return int(np.count_nonzero(green)), int(green.size)
+
+
 def check_image_file(file_path: Path) -> List[BrandViolation]:
     """Check image file (PNG, JPG) for forbidden colors using pixel sampling."""
     violations: List[BrandViolation] = []
@@ -286,20 +539,18 @@ def check_image_file(file_path: Path) -> List[BrandViolation]:
 
     try:
         with Image.open(file_path) as img:
-            # Convert to RGB if needed
-            if img.mode != "RGB":
-                img = img.convert("RGB")
-
             # Sample pixels (don't check every pixel for performance)
             width, height = img.size
             sample_step = max(1, min(width, height) // 50)  # Sample ~50x50 grid
+            grid = _sample_grid(img, sample_step)
 
-            green_pixel_count = 0
-            total_sampled = 0
+            if np is not None:
+                green_pixel_count, total_sampled = _count_green_pixels(grid)
+            else:
+                green_pixel_count = 0
+                total_sampled = 0
 
-            for x in range(0, width, sample_step):
-                for y in range(0, height, sample_step):
-                    r, g, b = img.getpixel((x, y))
+                for r, g, b in grid.getdata():
                     total_sampled += 1
 
                     if is_green_rgb(r, g, b):
@@ -321,6 +572,39 @@ def check_image_file(file_path: Path) -> List[BrandViolation]:
     return violations
 
 
+def check_text_file(file_path: Path) -> List[BrandViolation]:
+    """Check a plain text file (Markdown, JSON, YAML...) for emojis and colors."""
+    try:
+        content = _read_source(file_path)
+    except (IOError, UnicodeDecodeError):
+        return []
+    return check_text_content(content, str(file_path))
+
+
+# Lowercase file suffix -> checker, resolved with one dict lookup per file
+_HANDLERS: Dict[str, Callable[[Path], List[BrandViolation]]] = {
+    ".py": check_python_file,
+    ".css": check_css_file,
+    ".scss": check_css_file,
+    ".sass": check_css_file,
+    ".less": check_css_file,
+    ".html": check_html_file,
+    ".htm": check_html_file,
+    ".svg": check_svg_file,
+    ".png": check_image_file,
+    ".jpg": check_image_file,
+    ".jpeg": check_image_file,
+    ".md": check_text_file,
+    ".txt": check_text_file,
+    ".json": check_text_file,
+    ".yaml": check_text_file,
+    ".yml": check_text_file,
+}
+
+# Every extension check_file knows how to check
+CHECKED_EXTENSIONS: FrozenSet[str] = frozenset(_HANDLERS)
+
+
 def check_file(file_path: Union[Path, str]) -> List[BrandViolation]:
     """
     Check a single file for brand violations.
@@ -333,44 +617,241 @@ def check_file(file_path: Union[Path, str]) -> List[BrandViolation]:
     """
     file_path = Path(file_path)
 
-    if not file_path.exists():
+    # Unsupported types are skipped before touching the filesystem
+    handler = _HANDLERS.get(file_path.suffix.lower())
+    if handler is None or not file_path.exists():
         return []
 
-    suffix = file_path.suffix.lower()
-
-    if suffix == ".py":
-        return check_python_file(file_path)
-    elif suffix in {".css", ".scss", ".sass", ".less"}:
-        return check_css_file(file_path)
-    elif suffix in {".html", ".htm"}:
-        return check_html_file(file_path)
-    elif suffix == ".svg":
-        return check_svg_file(file_path)
-    elif suffix in {".png", ".jpg", ".jpeg"}:
-        return check_image_file(file_path)
-    elif suffix in {".md", ".txt", ".json", ".yaml", ".yml"}:
-        # Check text files for emojis and colors in content
+    return handler(file_path)
+
+
+def _iter_files(directory: str, recursive: bool, extensions: AbstractSet[str]) -> Iterator[str]:
+    """
+    Yield paths of files with a checked extension under directory.
+
+    Uses os.scandir so type checks reuse the directory entry instead of a
+    stat per path. Files come in the same order as Path.glob("**/*"): a
+    directory's files first, then each subdirectory in turn. Symlinked
+    directories are not descended into.
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
+        return
+
+    subdirs: List[str] = []
+    for entry in entries:
+        if entry.is_file():
+            if os.path.splitext(entry.name)[1].lower() in extensions:
+                yield entry.path
+        elif recursive and entry.is_dir(follow_symlinks=False):
+            subdirs.append(entry.path)
+
+    for subdir in subdirs:
+        yield from _iter_files(subdir, recursive, extensions)
+
+
+# Directories with fewer files are checked in-process; below this size the
+# cost of starting worker processes outweighs the parallel speedup
+PARALLEL_MIN_FILES = 64
+_PARALLEL_CHUNKSIZE = 32
+
+# Smaller batches are checked on a thread pool so file reads (which release
+# the GIL) overlap; a handful of files is not worth starting threads for
+_THREADED_MIN_FILES = 8
+_MAX_READ_THREADS = 32
+
+# Bump when the cache layout changes; rule changes are caught by
+# _rules_fingerprint()
+_RESULT_CACHE_VERSION = 1
+
+# Default on-disk cache used by the pre-commit hook
+DEFAULT_CACHE_PATH = Path(".cache") / "brand_guard" / "results.json"
+
+
+def _install_rules(forbidden_colors: FrozenSet[str]) -> None:
+    """
+    Worker initializer: adopt the parent's FORBIDDEN_COLORS.
+
+    Spawned and forkserver workers re-import this module, so runtime changes
+    to the set would otherwise be lost.
+    """
+    global FORBIDDEN_COLORS
+    FORBIDDEN_COLORS = set(forbidden_colors)
+
+
+def _check_files(
+    files: List[str],
+    max_workers: Optional[int],
+) -> List[List[BrandViolation]]:
+    """
+    Run check_file over files and return the results in input order.
+
+    Large batches are spread over worker processes; smaller ones use
+    threads to overlap file I/O. max_workers=1 keeps everything serial.
+    """
+    if max_workers == 1:
+        return [check_file(file_path) for file_path in files]
+
+    if len(files) >= PARALLEL_MIN_FILES:
         try:
-            content = file_path.read_text(encoding="utf-8")
-            return check_text_content(content, str(file_path))
-        except (IOError, UnicodeDecodeError):
-            return []
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_install_rules,
+                initargs=(frozenset(FORBIDDEN_COLORS),),
+            ) as executor:
+                return list(executor.map(
+                    check_file, files, chunksize=_PARALLEL_CHUNKSIZE
+                ))
+        except (OSError, BrokenProcessPool) as e:
+            # e.g. sandboxes without process support; fall back to threads
+            logger.warning(f"Parallel brand check unavailable, using threads: {e}")
 
-    return []
+    if len(files) >= _THREADED_MIN_FILES:
+        threads = min(max_workers or _MAX_READ_THREADS, len(files))
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            return list(executor.map(check_file, files))
+
+    return [check_file(file_path) for file_path in files]
+
+
+@lru_cache(maxsize=1)
+def _checker_source_digest() -> str:
+    """Digest of this module's source, so edited checks invalidate the cache."""
+    try:
+        return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+    except OSError:
+        return ""
+
+
+def _rules_fingerprint() -> str:
+    """
+    Fingerprint of the rules that decide a file's violations.
+
+    Computed per run because FORBIDDEN_COLORS and the patterns are module
+    attributes that callers may change.
+    """
+    digest = hashlib.sha256()
+    for part in (
+        _checker_source_digest(),
+        *sorted(FORBIDDEN_COLORS),
+        EMOJI_PATTERN.pattern,
+        HEX_COLOR_PATTERN.pattern,
+        RGB_COLOR_PATTERN.pattern,
+        _RGB_BRANCH,
+        _NAMED_GREEN_PATTERN.pattern,
+    ):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _load_result_cache(cache_path: Path, rules: str) -> Dict[str, Any]:
+    """Load cached per-file results, or an empty cache if unusable."""
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != _RESULT_CACHE_VERSION
+        or data.get("rules") != rules
+    ):
+        return {}
+    files = data.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def _save_result_cache(
+    cache_path: Path, files: Dict[str, Any], rules: str
+) -> None:
+    """Write the result cache atomically; failures only cost a re-check."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        tmp_path.write_text(
+            json.dumps({
+                "version": _RESULT_CACHE_VERSION,
+                "rules": rules,
+                "files": files,
+            }),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Could not write brand check cache {cache_path}: {e}")
+
+
+def _check_files_cached(
+    files: List[str],
+    max_workers: Optional[int],
+    cache_path: Path,
+) -> List[List[BrandViolation]]:
+    """
+    Check files, reusing cached results for files whose mtime and size match.
+
+    Entries for files outside this run are kept, so one cache file can serve
+    several directories.
+    """
+    rules = _rules_fingerprint()
+    cached = _load_result_cache(cache_path, rules)
+    results: List[Optional[List[BrandViolation]]] = [None] * len(files)
+    stamps: Dict[str, List[int]] = {}
+    misses: List[int] = []
+
+    for i, file_path in enumerate(files):
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            misses.append(i)
+            continue
+        stamp = [stat.st_mtime_ns, stat.st_size]
+        stamps[file_path] = stamp
+        entry = cached.get(file_path)
+        if entry is not None and entry.get("stamp") == stamp:
+            results[i] = [BrandViolation(**v) for v in entry["violations"]]
+        else:
+            misses.append(i)
+
+    if misses:
+        checked = _check_files([files[i] for i in misses], max_workers)
+        for i, violations in zip(misses, checked):
+            results[i] = violations
+            stamp = stamps.get(files[i])
+            if stamp is not None:
+                cached[files[i]] = {
+                    "stamp": stamp,
+                    "violations": [asdict(v) for v in violations],
+                }
+        _save_result_cache(cache_path, cached, rules)
+
+    return [violations or [] for violations in results]
 
 
 def check_directory(
     directory: Union[Path, str],
     recursive: bool = True,
-    extensions: Optional[Set[str]] = None,
+    extensions: Optional[AbstractSet[str]] = None,
+    max_workers: Optional[int] = None,
+    cache_path: Optional[Union[Path, str]] = None,
 ) -> List[BrandViolation]:
     """
     Check all files in a directory for brand violations.
 
+    Large directories are checked in parallel across processes; violations
+    are returned in the same order as a serial scan.
+
     Args:
         directory: Path to the directory to check.
         recursive: If True, check subdirectories recursively.
         extensions: Set of file extensions to check. If None, checks common types.
+        max_workers: Worker processes for large directories (default: CPU
+            count). Use 1 to always check serially. Where workers are
+            spawned (macOS, Windows), scripts calling this must do so under
+            ``if __name__ == "__main__":``.
+        cache_path: Optional JSON file of per-file results keyed by path,
+            mtime and size. Unchanged files are not re-checked.
 
     Returns:
         List of all BrandViolation objects found.
@@ -381,20 +862,18 @@ def check_directory(
         return []
 
     if extensions is None:
-        extensions = {
-            ".py", ".css", ".scss", ".sass", ".less",
-            ".html", ".htm", ".svg", ".png", ".jpg", ".jpeg",
-            ".md", ".txt", ".json", ".yaml", ".yml",
-        }
+        extensions = CHECKED_EXTENSIONS
 
-    all_violations: List[BrandViolation] = []
+    files = list(_iter_files(str(directory), recursive, extensions))
 
-    pattern = "**/*" if recursive else "*"
+    if cache_path is not None:
+        results = _check_files_cached(files, max_workers, Path(cache_path))
+    else:
+        results = _check_files(files, max_workers)
 
-    for file_path in directory.glob(pattern):
-        if file_path.is_file() and file_path.suffix.lower() in extensions:
-            violations = check_file(file_path)
-            all_violations.extend(violations)
+    all_violations: List[BrandViolation] = []
+    for violations in results:
+        all_violations.extend(violations)
 
     return all_violations
 
@@ -20,23 +20,76 @@ Brand Rules Enforced:
     - No emojis in any text
 """
 
+import hashlib
 import logging
+import math
+import operator
+import os
+import shutil
+from functools import cache, lru_cache, partial, reduce, wraps
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+import numpy as np
 
-import matplotlib
-matplotlib.use('Agg')  # Non-interactive backend for server use
-import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
-from matplotlib.figure import Figure
-from matplotlib.axes import Axes
-from matplotlib.ticker import FuncFormatter
-
-from core.number_formatter import smart_format, format_axis_label
 from core.color_intelligence import get_chart_colors
+from core.number_formatter import format_axis_label, smart_format
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
+    from core.kds_theme import KDSTheme
 
 logger = logging.getLogger(__name__)
 
+# matplotlib is imported by _require_mpl() on first chart use, so code
+# that only needs KDSColors or the size helpers skips its startup cost
+matplotlib: Any = None
+plt: Any = None
+fm: Any = None
+LinearSegmentedColormap: Any = None
+Sankey: Any = None
+FuncFormatter: Any = None
+mtransforms: Any = None
+
+
+def _require_mpl() -> None:
+    """Import matplotlib (Agg backend) into this module on first call."""
+    global matplotlib, plt, fm, LinearSegmentedColormap, Sankey, FuncFormatter, mtransforms
+    if plt is not None:
+        return
+
+    import matplotlib as mpl
+    mpl.use('Agg')  # Non-interactive backend for server use
+    import matplotlib.font_manager as font_manager
+    import matplotlib.pyplot as pyplot
+    import matplotlib.transforms as transforms
+    from matplotlib.colors import LinearSegmentedColormap as cmap_cls
+    from matplotlib.sankey import Sankey as sankey_cls
+    from matplotlib.ticker import FuncFormatter as formatter_cls
+
+    matplotlib = mpl
+    fm = font_manager
+    LinearSegmentedColormap = cmap_cls
+    Sankey = sankey_cls
+    FuncFormatter = formatter_cls
+    mtransforms = transforms
+    _register_kds_colormaps()
+    plt = pyplot  # Set last: it marks the import as complete
+
 
 # Kearney Brand Colors
 class KDSColors:
@@ -68,6 +121,39 @@ class KDSColors:
     ]
 
 
+# Name of the default heatmap colormap, registered with matplotlib
+KDS_PURPLE_CMAP = "kds_purple"
+
+
+def _register_kds_colormaps() -> None:
+    """
+    Register the KDS purple colormap with matplotlib.colormaps.
+
+    Its lookup table is built once here; the registry hands out copies, so
+    each heatmap gets its own colormap without rebuilding it. Also makes
+    cmap="kds_purple" usable in any matplotlib call.
+    """
+    if KDS_PURPLE_CMAP in matplotlib.colormaps:
+        return
+    cmap = LinearSegmentedColormap.from_list(
+        KDS_PURPLE_CMAP, [KDSColors.BACKGROUND_DARK, KDSColors.PRIMARY, "#B266FF"]
+    )
+    cmap(0.0)  # Build the lookup table before it is copied into the registry
+    matplotlib.colormaps.register(cmap)
+
+
+# Above this many estimated data elements (bars, markers, points) SVG output
+# grows large and slow to render, while PNG cost stays constant; save()
+# then switches the default SVG format to a 2x-resolution PNG
+SVG_ELEMENT_LIMIT = 5000
+
+# Rendered-chart cache location for KDSChart(cache_dir=...), relative to
+# the project root like the brand check cache
+DEFAULT_CHART_CACHE_DIR = Path(".cache") / "charts"
+
+# Bump whenever chart rendering changes so cached files are not reused
+_RENDER_CACHE_VERSION = 1
+
 # Size presets for visualizations
 SIZE_PRESETS = {
     "presentation": (1920, 1080),  # 16:9
@@ -90,22 +176,167 @@ def parse_size_preset(size_spec: str) -> Tuple[int, int]:
     Returns:
         Tuple of (width, height) in pixels.
     """
+    spec = size_spec.lower()
+
     # Check if it's a preset
-    if size_spec.lower() in SIZE_PRESETS:
-        return SIZE_PRESETS[size_spec.lower()]
+    preset = SIZE_PRESETS.get(spec)
+    if preset is not None:
+        return preset
 
     # Try to parse as custom size (e.g., "1400x800")
-    if 'x' in size_spec.lower():
-        parts = size_spec.lower().split('x')
+    custom = _parse_custom_size(spec)
+    if custom is not None:
+        return custom
+
+    # Default to presentation size
+    return SIZE_PRESETS["presentation"]
+
+
+@lru_cache(maxsize=256)
+def _parse_custom_size(spec: str) -> Optional[Tuple[int, int]]:
+    """Parse a lowercased 'WIDTHxHEIGHT' string, or return None."""
+    if 'x' in spec:
+        parts = spec.split('x')
         try:
-            width = int(parts[0].strip())
-            height = int(parts[1].strip())
-            return (width, height)
+            return (int(parts[0].strip()), int(parts[1].strip()))
         except (ValueError, IndexError):
             pass
+    return None
 
-    # Default to presentation size
-    return SIZE_PRESETS["presentation"]
+
+@cache
+def _resolve_font_family() -> str:
+    """
+    Pick the KDS font family from the installed fonts.
+
+    The font list is fixed for the life of the process, so it is scanned
+    once rather than for every chart.
+    """
+    _require_mpl()
+    available_fonts = {f.name for f in fm.fontManager.ttflist}
+
+    if "Inter" in available_fonts:
+        return "Inter"
+    if "Arial" in available_fonts:
+        return "Arial"
+    return "sans-serif"
+
+
+@cache
+def _kds_rcparams(dark_mode: bool, font_family: str) -> "matplotlib.RcParams":
+    """
+    Build the KDS rcParams for one style combination.
+
+    Values are validated once, when the RcParams is built, and stored in
+    the validated form plt.rcParams holds. The result is shared; do not
+    modify it.
+    """
+    _require_mpl()
+    return matplotlib.RcParams({
+        "font.family": font_family,
+        "font.size": 11,
+        "font.weight": 400,
+        "axes.titleweight": 600,
+        "axes.labelweight": 500,
+        "axes.grid": False,  # NO GRIDLINES - KDS requirement
+        "axes.spines.top": False,
+        "axes.spines.right": False,
+        "legend.frameon": False,
+        "figure.facecolor": KDSColors.BACKGROUND_DARK if dark_mode else KDSColors.BACKGROUND_LIGHT,
+        "axes.facecolor": KDSColors.BACKGROUND_DARK if dark_mode else KDSColors.BACKGROUND_LIGHT,
+        "text.color": KDSColors.TEXT_LIGHT if dark_mode else KDSColors.TEXT_DARK,
+        "axes.labelcolor": KDSColors.TEXT_LIGHT if dark_mode else KDSColors.TEXT_DARK,
+        "axes.edgecolor": KDSColors.GRAY_400 if dark_mode else KDSColors.GRAY_300,
+        "xtick.color": KDSColors.TEXT_LIGHT if dark_mode else KDSColors.TEXT_DARK,
+        "ytick.color": KDSColors.TEXT_LIGHT if dark_mode else KDSColors.TEXT_DARK,
+    })
+
+
+@lru_cache(maxsize=32)
+def _theme_rcparams(theme: "KDSTheme") -> "matplotlib.RcParams":
+    """
+    Build the validated rcParams for a KDSTheme.
+
+    KDSTheme is frozen, so equal themes share one result; do not modify it.
+    """
+    _require_mpl()
+    return matplotlib.RcParams(theme.to_matplotlib_rcparams())
+
+
+@lru_cache(maxsize=1024)
+def _tick_label(value: float, is_currency: bool) -> str:
+    """
+    Smart-format one axis tick value.
+
+    Every draw of a chart (layout, tight bbox, output) relabels the same
+    ticks, and charts in a batch share most tick values.
+    """
+    return format_axis_label(value, is_currency=is_currency)
+
+
+def _format_tick(value: float, pos: Optional[int], is_currency: bool = False) -> str:
+    """FuncFormatter callback for smart-number axes."""
+    return _tick_label(value, is_currency)
+
+
+def _update_rcparams(params: Mapping[str, Any]) -> None:
+    """
+    Apply the params that are not already in effect to the global rcParams.
+
+    Every rcParams assignment runs a validator, while reading is a plain
+    lookup; charts in a batch usually share one style, so most calls
+    only compare.
+    """
+    _require_mpl()
+    current = plt.rcParams
+    changed = {key: value for key, value in params.items() if current[key] != value}
+    if changed:
+        current.update(changed)
+
+
+def _cache_token(value: Any) -> Any:
+    """
+    Return an exact, repr-stable stand-in for a chart input.
+
+    Raises TypeError for values without one (arbitrary objects, object
+    arrays); charts built from them are not cached.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        # The type is kept: 1, 1.0 and True label differently
+        return (type(value).__name__, value)
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(_cache_token(item) for item in value))
+    if isinstance(value, dict):
+        return ("dict", tuple(
+            (_cache_token(key), _cache_token(item)) for key, item in value.items()
+        ))
+    if isinstance(value, np.ndarray) and value.dtype != object:
+        return ("ndarray", value.dtype.str, value.shape, value.tobytes())
+    if isinstance(value, np.generic):
+        return (type(value).__name__, value.item())
+    raise TypeError(f"No cache token for {type(value).__name__}")
+
+
+_ChartMethod = TypeVar("_ChartMethod", bound=Callable[..., "KDSChart"])
+
+
+def _records_inputs(method: _ChartMethod) -> _ChartMethod:
+    """
+    Record a chart method's arguments so save() can key the render cache.
+
+    The arguments are captured as they are at call time, and only when the
+    chart has a cache_dir.
+    """
+    @wraps(method)
+    def wrapper(self: "KDSChart", *args: Any, **kwargs: Any) -> "KDSChart":
+        self._inputs_token = None
+        if self.cache_dir is not None:
+            try:
+                self._inputs_token = _cache_token((method.__name__, args, kwargs))
+            except TypeError:
+                pass
+        return method(self, *args, **kwargs)
+    return wrapper  # type: ignore[return-value]
 
 
 def pixels_to_inches(width: int, height: int, dpi: int = 150) -> Tuple[float, float]:
@@ -139,6 +370,7 @@ class KDSChart:
         smart_numbers: bool = True,
         intelligent_colors: bool = True,
         theme: Optional["KDSTheme"] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
     ):
         """
         Initialize KDSChart with brand defaults.
@@ -154,7 +386,15 @@ class KDSChart:
             intelligent_colors: If True, use context-aware coloring based on chart type.
             theme: Optional KDSTheme instance for custom theming. If provided,
                    applies theme's matplotlib rcParams after default setup.
+            cache_dir: Optional directory of rendered charts (for example
+                       DEFAULT_CHART_CACHE_DIR). save() copies a cached file
+                       when a chart with identical inputs and settings was
+                       rendered before, instead of rendering it again. Only
+                       the chart method's arguments are keyed, so do not use
+                       it for charts edited through fig/ax before saving.
         """
+        _require_mpl()
+
         # Handle size - priority: figsize > size_preset > default
         if figsize is not None:
             self.figsize = figsize
@@ -174,6 +414,9 @@ class KDSChart:
         self.theme = theme
         self.fig: Optional[Figure] = None
         self.ax: Optional[Axes] = None
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._estimated_elements = 0
+        self._inputs_token: Any = None
         self._setup_style()
 
         # Apply custom theme if provided (overrides defaults)
@@ -183,34 +426,10 @@ class KDSChart:
     def _setup_style(self) -> None:
         """Configure matplotlib style for KDS compliance."""
         # Try to use Inter font, fall back to Arial
-        available_fonts = [f.name for f in fm.fontManager.ttflist]
-
-        if "Inter" in available_fonts:
-            self.font_family = "Inter"
-        elif "Arial" in available_fonts:
-            self.font_family = "Arial"
-        else:
-            self.font_family = "sans-serif"
+        self.font_family = _resolve_font_family()
 
         # Set global style
-        plt.rcParams.update({
-            "font.family": self.font_family,
-            "font.size": 11,
-            "font.weight": 400,
-            "axes.titleweight": 600,
-            "axes.labelweight": 500,
-            "axes.grid": False,  # NO GRIDLINES - KDS requirement
-            "axes.spines.top": False,
-            "axes.spines.right": False,
-            "legend.frameon": False,
-            "figure.facecolor": KDSColors.BACKGROUND_DARK if self.dark_mode else KDSColors.BACKGROUND_LIGHT,
-            "axes.facecolor": KDSColors.BACKGROUND_DARK if self.dark_mode else KDSColors.BACKGROUND_LIGHT,
-            "text.color": KDSColors.TEXT_LIGHT if self.dark_mode else KDSColors.TEXT_DARK,
-            "axes.labelcolor": KDSColors.TEXT_LIGHT if self.dark_mode else KDSColors.TEXT_DARK,
-            "axes.edgecolor": KDSColors.GRAY_400 if self.dark_mode else KDSColors.GRAY_300,
-            "xtick.color": KDSColors.TEXT_LIGHT if self.dark_mode else KDSColors.TEXT_DARK,
-            "ytick.color": KDSColors.TEXT_LIGHT if self.dark_mode else KDSColors.TEXT_DARK,
-        })
+        _update_rcparams(_kds_rcparams(self.dark_mode, self.font_family))
 
     def _apply_theme(self) -> None:
         """
@@ -220,11 +439,15 @@ class KDSChart:
         This allows custom themes to override the default KDS styling.
         """
         if self.theme is not None:
-            rcparams = self.theme.to_matplotlib_rcparams()
-            plt.rcParams.update(rcparams)
+            _update_rcparams(_theme_rcparams(self.theme))
 
-    def _create_figure(self) -> Tuple[Figure, Axes]:
+    def _create_figure(self) -> Tuple["Figure", "Axes"]:
         """Create a new figure with KDS styling."""
+        # Release the figure of a previous, unsaved chart so batch runs do
+        # not accumulate open figures in pyplot
+        if self.fig is not None:
+            plt.close(self.fig)
+        self._estimated_elements = 0
         fig, ax = plt.subplots(figsize=self.figsize)
         fig.set_facecolor(
             KDSColors.BACKGROUND_DARK if self.dark_mode else KDSColors.BACKGROUND_LIGHT
@@ -265,11 +488,10 @@ class KDSChart:
                 has_negative=has_negative
             )
         else:
-            # Fallback to old palette cycling
-            colors = []
-            for i in range(n):
-                colors.append(KDSColors.PALETTE[i % len(KDSColors.PALETTE)])
-            return colors
+            # Fallback to old palette cycling: repeat the palette enough
+            # times and slice, both done in C
+            palette = KDSColors.PALETTE
+            return (palette * (n // len(palette) + 1))[:n]
 
     def _format_value(self, value: float, is_currency: bool = False) -> str:
         """Format a value for display with smart abbreviations."""
@@ -278,19 +500,85 @@ class KDSChart:
         prefix = "$" if is_currency else ""
         return smart_format(value, prefix=prefix)
 
-    def _setup_axis_formatter(self, ax: Axes, axis: str = 'y', is_currency: bool = False) -> None:
+    def _format_values(self, values: Sequence[float]) -> List[str]:
+        """
+        Format a batch of data labels, like _format_value on each value.
+
+        The formatter is chosen once for the batch and mapped in C; plain
+        numbers map straight to str with no Python call per label.
+        """
+        formatter = smart_format if self.smart_numbers else str
+        return list(map(formatter, values))
+
+    def _setup_axis_formatter(self, ax: "Axes", axis: str = 'y', is_currency: bool = False) -> None:
         """Setup smart number formatting for an axis."""
         if not self.smart_numbers:
             return
 
-        def formatter(x, pos):
-            return format_axis_label(x, is_currency=is_currency)
+        # A module-level callback, unlike a closure, leaves the figure picklable
+        formatter = partial(_format_tick, is_currency=is_currency)
 
         if axis == 'y':
             ax.yaxis.set_major_formatter(FuncFormatter(formatter))
         elif axis == 'x':
             ax.xaxis.set_major_formatter(FuncFormatter(formatter))
 
+    def _label_bar_ends(
+        self,
+        bars: Sequence,
+        texts: Sequence[str],
+        fontsize: float,
+        offset: float = 5,
+        horizontal: bool = False,
+    ) -> None:
+        """
+        Label each bar just outside its end (KDS requirement).
+
+        Placement and styling are the same for every label, so they are
+        resolved once for the whole batch rather than per bar.
+        """
+        if horizontal:
+            xytext, ha, va = (offset, 0), "left", "center"
+        else:
+            xytext, ha, va = (0, offset), "center", "bottom"
+        if horizontal:
+            coords = [(bar.get_width(), bar.get_y() + bar.get_height() / 2) for bar in bars]
+        else:
+            coords = [(bar.get_x() + bar.get_width() / 2, bar.get_height()) for bar in bars]
+
+        self._batch_annotate(
+            self.ax, coords, texts, xytext,
+            ha=ha,
+            va=va,
+            fontsize=fontsize,
+            color=KDSColors.TEXT_LIGHT if self.dark_mode else KDSColors.TEXT_DARK,
+        )
+
+    def _batch_annotate(
+        self,
+        ax: "Axes",
+        coords: Sequence[Tuple[float, float]],
+        texts: Sequence[str],
+        xytext: Tuple[float, float],
+        **style: Any,
+    ) -> None:
+        """
+        Place each text at its data point, shifted by xytext points.
+
+        Renders like ax.annotate with textcoords="offset points", but the
+        batch shares one offset transform and each label is a plain Text,
+        which does not re-resolve its annotation coordinates on every draw.
+        Points that are not finite get no label, as with annotate.
+        """
+        offset = mtransforms.offset_copy(
+            ax.transData, fig=self.fig, x=xytext[0], y=xytext[1], units="points"
+        )
+        add_text = ax.text
+        for (x, y), text in zip(coords, texts):
+            if math.isfinite(x) and math.isfinite(y):
+                add_text(x, y, text, transform=offset, **style)
+
+    @_records_inputs
     def bar(
         self,
         data: Sequence[float],
@@ -319,6 +607,7 @@ class KDSChart:
             self for method chaining.
         """
         self.fig, self.ax = self._create_figure()
+        self._estimated_elements += len(data)
 
         if colors is None:
             colors = self._get_colors(len(data), chart_type="bar", values=list(data))
@@ -335,18 +624,10 @@ class KDSChart:
 
             # Data labels outside bars (KDS requirement)
             if show_values:
-                for bar, value in zip(bars, data):
-                    width = bar.get_width()
-                    self.ax.annotate(
-                        self._format_value(value),
-                        xy=(width, bar.get_y() + bar.get_height() / 2),
-                        xytext=(5, 0),
-                        textcoords="offset points",
-                        ha="left",
-                        va="center",
-                        fontsize=10,
-                        color=KDSColors.TEXT_LIGHT if self.dark_mode else KDSColors.TEXT_DARK,
-                    )
+                self._label_bar_ends(
+                    bars, self._format_values(data),
+                    fontsize=10, horizontal=True,
+                )
         else:
             bars = self.ax.bar(labels, data, color=colors)
             if xlabel:
@@ -359,18 +640,9 @@ class KDSChart:
 
             # Data labels outside bars (KDS requirement)
             if show_values:
-                for bar, value in zip(bars, data):
-                    height = bar.get_height()
-                    self.ax.annotate(
-                        self._format_value(value),
-                        xy=(bar.get_x() + bar.get_width() / 2, height),
-                        xytext=(0, 5),
-                        textcoords="offset points",
-                        ha="center",
-                        va="bottom",
-                        fontsize=10,
-                        color=KDSColors.TEXT_LIGHT if self.dark_mode else KDSColors.TEXT_DARK,
-                    )
+                self._label_bar_ends(
+                    bars, self._format_values(data), fontsize=10,
+                )
 
         if title:
             self.ax.set_title(title, fontsize=14, fontweight=600, pad=20)
@@ -382,6 +654,7 @@ class KDSChart:
         plt.tight_layout()
         return self
 
+    @_records_inputs
     def line(
         self,
         x_data: Sequence,
@@ -421,6 +694,8 @@ class KDSChart:
             # Line charts use categorical colors for distinct series
             colors = self._get_colors(len(y_data), chart_type="line")
 
+        self._estimated_elements += sum(len(series) for series in y_data)
+
         for i, series in enumerate(y_data):
             label = labels[i] if labels and i < len(labels) else None
             marker = "o" if show_markers else None
@@ -449,6 +724,7 @@ class KDSChart:
         plt.tight_layout()
         return self
 
+    @_records_inputs
     def pie(
         self,
         data: Sequence[float],
@@ -478,6 +754,10 @@ class KDSChart:
             # Pie charts use sequential coloring - larger slices get darker colors
             colors = self._get_colors(len(data), chart_type="pie", values=list(data))
 
+        # Slice labels are styled as they are created
+        text_color = KDSColors.TEXT_LIGHT if self.dark_mode else KDSColors.TEXT_DARK
+        label_props = {"color": text_color, "fontsize": 10}
+
         # KDS requirement: labels outside slices
         if show_percentages:
             wedges, texts, autotexts = self.ax.pie(
@@ -489,6 +769,7 @@ class KDSChart:
                 startangle=90,
                 pctdistance=0.85,
                 labeldistance=1.15,
+                textprops=label_props,
             )
             for autotext in autotexts:
                 autotext.set_color(KDSColors.TEXT_LIGHT)
@@ -502,13 +783,9 @@ class KDSChart:
                 explode=explode,
                 startangle=90,
                 labeldistance=1.15,
+                textprops=label_props,
             )
 
-        # Style the labels
-        for text in texts:
-            text.set_color(KDSColors.TEXT_LIGHT if self.dark_mode else KDSColors.TEXT_DARK)
-            text.set_fontsize(10)
-
         if title:
             self.ax.set_title(title, fontsize=14, fontweight=600, pad=20)
 
@@ -516,6 +793,7 @@ class KDSChart:
         plt.tight_layout()
         return self
 
+    @_records_inputs
     def scatter(
         self,
         x_data: Sequence[float],
@@ -549,6 +827,7 @@ class KDSChart:
             color = KDSColors.PRIMARY
 
         self.ax.scatter(x_data, y_data, s=size, c=color, alpha=alpha)
+        self._estimated_elements += len(x_data)
 
         if xlabel:
             self.ax.set_xlabel(xlabel)
@@ -563,6 +842,7 @@ class KDSChart:
         plt.tight_layout()
         return self
 
+    @_records_inputs
     def grouped_bar(
         self,
         data: List[Sequence[float]],
@@ -590,8 +870,6 @@ class KDSChart:
         Returns:
             self for method chaining.
         """
-        import numpy as np
-
         self.fig, self.ax = self._create_figure()
 
         if colors is None:
@@ -601,6 +879,7 @@ class KDSChart:
         n_series = len(data)
         bar_width = 0.8 / n_series
         x = np.arange(n_groups)
+        self._estimated_elements += sum(len(series) for series in data)
 
         for i, (series, label) in enumerate(zip(data, series_labels)):
             offset = (i - n_series / 2 + 0.5) * bar_width
@@ -613,18 +892,9 @@ class KDSChart:
             )
 
             if show_values:
-                for bar, value in zip(bars, series):
-                    height = bar.get_height()
-                    self.ax.annotate(
-                        f"{value:,.0f}",
-                        xy=(bar.get_x() + bar.get_width() / 2, height),
-                        xytext=(0, 3),
-                        textcoords="offset points",
-                        ha="center",
-                        va="bottom",
-                        fontsize=8,
-                        color=KDSColors.TEXT_LIGHT if self.dark_mode else KDSColors.TEXT_DARK,
-                    )
+                self._label_bar_ends(
+                    bars, [f"{value:,.0f}" for value in series], fontsize=8, offset=3,
+                )
 
         self.ax.set_xticks(x)
         self.ax.set_xticklabels(group_labels)
@@ -643,6 +913,7 @@ class KDSChart:
         plt.tight_layout()
         return self
 
+    @_records_inputs
     def waterfall(
         self,
         data: Sequence[float],
@@ -671,8 +942,6 @@ class KDSChart:
         Returns:
             self for method chaining.
         """
-        import numpy as np
-
         self.fig, self.ax = self._create_figure()
 
         # Default colors using KDS palette
@@ -687,57 +956,50 @@ class KDSChart:
         n = len(data)
         x = np.arange(n)
 
-        # Calculate cumulative positions for waterfall effect
-        cumulative = [0.0]  # Running total
-        bar_bottoms = []
-        bar_heights = []
-        bar_colors = []
-
-        for i, value in enumerate(data):
-            if i == 0:
-                # First bar: starts from 0
-                bar_bottoms.append(0)
-                bar_heights.append(value)
-                bar_colors.append(default_colors['total'])
-                cumulative.append(value)
-            elif i == n - 1:
-                # Last bar: total bar from 0 to final value
-                final_value = cumulative[-1]
-                bar_bottoms.append(0)
-                bar_heights.append(final_value)
-                bar_colors.append(default_colors['total'])
-            else:
-                # Middle bars: show change from previous cumulative
-                prev_cumulative = cumulative[-1]
-                if value >= 0:
-                    bar_bottoms.append(prev_cumulative)
-                    bar_heights.append(value)
-                    bar_colors.append(default_colors['increase'])
-                else:
-                    bar_bottoms.append(prev_cumulative + value)
-                    bar_heights.append(abs(value))
-                    bar_colors.append(default_colors['decrease'])
-                cumulative.append(prev_cumulative + value)
+        # Calculate cumulative positions for waterfall effect. Middle bars
+        # span the change from the running total before them; the first
+        # bar starts at 0 and the last shows the final total from 0.
+        values = np.asarray(data)
+        cumulative = np.concatenate(([0], np.cumsum(values)[:-1]))
+        increase = values >= 0
+        bottoms = np.where(increase, cumulative, cumulative + values)
+        heights = np.abs(values)
+        bar_colors = [
+            default_colors['increase'] if up else default_colors['decrease']
+            for up in increase.tolist()
+        ]
+
+        if n > 0:
+            bottoms[0] = 0
+            heights[0] = values[0]
+            bar_colors[0] = default_colors['total']
+        if n > 1:
+            bottoms[-1] = 0
+            bar_colors[-1] = default_colors['total']
+
+        # Plain Python numbers, as value labels format them
+        bar_bottoms = bottoms.tolist()
+        bar_heights = heights.tolist()
+        if n > 1:
+            # The final total keeps the type of the input values (an int
+            # for integer data even when later items are floats)
+            bar_heights[-1] = reduce(operator.add, data[:-1])
 
         # Draw bars
         bars = self.ax.bar(x, bar_heights, bottom=bar_bottoms, color=bar_colors, width=0.6)
 
-        # Draw connector lines
-        if show_connectors and n > 1:
-            for i in range(n - 1):
-                if i == n - 2:
-                    # Don't draw connector to total bar
-                    continue
-                y_connect = bar_bottoms[i] + bar_heights[i]
-                self.ax.hlines(
-                    y=y_connect,
-                    xmin=x[i] + 0.3,
-                    xmax=x[i + 1] - 0.3,
-                    color=KDSColors.GRAY_400,
-                    linestyle='--',
-                    linewidth=1,
-                    alpha=0.7
-                )
+        # Draw connector lines as a single collection. Each runs from the
+        # top of a bar to the next bar; none leads into the total bar.
+        if show_connectors and n > 2:
+            self.ax.hlines(
+                y=np.add(bar_bottoms[:-2], bar_heights[:-2]),
+                xmin=x[:-2] + 0.3,
+                xmax=x[1:-1] - 0.3,
+                color=KDSColors.GRAY_400,
+                linestyle='--',
+                linewidth=1,
+                alpha=0.7
+            )
 
         # Add value labels
         if show_values:
@@ -786,6 +1048,7 @@ class KDSChart:
         plt.tight_layout()
         return self
 
+    @_records_inputs
     def stacked_bar(
         self,
         data: Dict[str, Sequence[float]],
@@ -817,8 +1080,6 @@ class KDSChart:
         Returns:
             self for method chaining.
         """
-        import numpy as np
-
         self.fig, self.ax = self._create_figure()
 
         series_names = list(data.keys())
@@ -831,43 +1092,44 @@ class KDSChart:
         x = np.arange(n_categories)
         text_color = KDSColors.TEXT_LIGHT if self.dark_mode else KDSColors.TEXT_DARK
 
-        # Calculate totals for each category
-        totals = [sum(data[series][i] for series in series_names) for i in range(n_categories)]
+        # Category totals, summed column-wise in C; they keep the input's
+        # number types (an int total prints as '6', not '6.0')
+        rows = [list(data[series_name]) for series_name in series_names]
+        totals = [sum(column) for column in zip(*rows)] if rows else [0] * n_categories
+
+        # One (series x category) matrix gives the running bottom of each
+        # series and the label-visibility test in a few array operations
+        matrix = np.asarray(rows) if rows else np.zeros((0, n_categories))
+        total_array = np.asarray(totals, dtype=float)
+        bottoms = np.zeros(matrix.shape)
+        bottoms[1:] = np.cumsum(matrix, axis=0)[:-1]
+
+        # Only label visible segments that are large enough: > 8% of total
+        with np.errstate(divide='ignore', invalid='ignore'):
+            segment_ratios = np.where(total_array > 0, matrix / total_array, 0)
+        labelled = (matrix > 0) & (segment_ratios > 0.08)
 
         # Stack the bars
-        bottom = np.zeros(n_categories)
         for idx, series_name in enumerate(series_names):
-            values = list(data[series_name])
+            values = rows[idx]
             if horizontal:
-                bars = self.ax.barh(x, values, left=bottom, label=series_name, color=colors[idx], height=0.6)
+                bars = self.ax.barh(x, values, left=bottoms[idx], label=series_name, color=colors[idx], height=0.6)
             else:
-                bars = self.ax.bar(x, values, bottom=bottom, label=series_name, color=colors[idx], width=0.6)
+                bars = self.ax.bar(x, values, bottom=bottoms[idx], label=series_name, color=colors[idx], width=0.6)
 
             # Add value labels inside segments
             if show_values:
-                for i, (bar, value) in enumerate(zip(bars, values)):
-                    if value > 0:  # Only show if segment is visible
-                        if horizontal:
-                            cx = bar.get_x() + bar.get_width() / 2
-                            cy = bar.get_y() + bar.get_height() / 2
-                        else:
-                            cx = bar.get_x() + bar.get_width() / 2
-                            cy = bar.get_y() + bar.get_height() / 2
-
-                        # Only show label if segment is large enough
-                        segment_ratio = value / totals[i] if totals[i] > 0 else 0
-                        if segment_ratio > 0.08:  # Show if > 8% of total
-                            self.ax.annotate(
-                                self._format_value(value),
-                                xy=(cx, cy),
-                                ha="center",
-                                va="center",
-                                fontsize=9,
-                                color=KDSColors.TEXT_LIGHT,
-                                fontweight=500,
-                            )
-
-            bottom = bottom + np.array(values)
+                for i in np.flatnonzero(labelled[idx]).tolist():
+                    bar = bars[i]
+                    self.ax.annotate(
+                        self._format_value(values[i]),
+                        xy=(bar.get_x() + bar.get_width() / 2, bar.get_y() + bar.get_height() / 2),
+                        ha="center",
+                        va="center",
+                        fontsize=9,
+                        color=KDSColors.TEXT_LIGHT,
+                        fontweight=500,
+                    )
 
         # Add total labels
         if show_totals:
@@ -920,6 +1182,7 @@ class KDSChart:
         plt.tight_layout()
         return self
 
+    @_records_inputs
     def combo(
         self,
         bar_data: Sequence[float],
@@ -959,8 +1222,6 @@ class KDSChart:
         Returns:
             self for method chaining.
         """
-        import numpy as np
-
         self.fig, self.ax = self._create_figure()
 
         # Colors
@@ -970,25 +1231,15 @@ class KDSChart:
             line_color = KDSColors.PALETTE[1]  # Light purple
 
         x = np.arange(len(labels))
-        text_color = KDSColors.TEXT_LIGHT if self.dark_mode else KDSColors.TEXT_DARK
 
         # Create bars on primary axis
         bars = self.ax.bar(x, bar_data, color=bar_color, width=0.6, label=bar_label, alpha=0.9)
 
         # Add bar value labels
         if show_values:
-            for bar, value in zip(bars, bar_data):
-                height = bar.get_height()
-                self.ax.annotate(
-                    self._format_value(value),
-                    xy=(bar.get_x() + bar.get_width() / 2, height),
-                    xytext=(0, 5),
-                    textcoords="offset points",
-                    ha="center",
-                    va="bottom",
-                    fontsize=9,
-                    color=text_color,
-                )
+            self._label_bar_ends(
+                bars, self._format_values(bar_data), fontsize=9,
+            )
 
         self.ax.set_xticks(x)
         self.ax.set_xticklabels(labels)
@@ -1007,18 +1258,14 @@ class KDSChart:
 
         # Add line value labels
         if show_values:
-            for i, value in enumerate(line_data):
-                ax2.annotate(
-                    self._format_value(value),
-                    xy=(i, value),
-                    xytext=(0, 10),
-                    textcoords="offset points",
-                    ha="center",
-                    va="bottom",
-                    fontsize=9,
-                    color=line_color,
-                    fontweight=500,
-                )
+            self._batch_annotate(
+                ax2, list(enumerate(line_data)), self._format_values(line_data), (0, 10),
+                ha="center",
+                va="bottom",
+                fontsize=9,
+                color=line_color,
+                fontweight=500,
+            )
 
         if line_ylabel:
             ax2.set_ylabel(line_ylabel, color=line_color)
@@ -1042,6 +1289,7 @@ class KDSChart:
         plt.tight_layout()
         return self
 
+    @_records_inputs
     def bullet(
         self,
         actual: float,
@@ -1075,20 +1323,20 @@ class KDSChart:
         if range_colors is None:
             range_colors = [KDSColors.GRAY_200, KDSColors.GRAY_300, KDSColors.GRAY_400]
 
-        # Ensure we have enough colors
-        while len(range_colors) < len(ranges):
-            range_colors.append(KDSColors.GRAY_400)
+        # Ensure we have enough colors, without extending the caller's list
+        band_colors = list(range_colors) + [KDSColors.GRAY_400] * (len(ranges) - len(range_colors))
 
         text_color = KDSColors.TEXT_LIGHT if self.dark_mode else KDSColors.TEXT_DARK
         sorted_ranges = sorted(ranges)
 
+        # Each band runs from the previous threshold up to its own
+        band_starts = [0] + sorted_ranges[:-1]
+        band_sizes = [r - start for r, start in zip(sorted_ranges, band_starts)]
+
         if horizontal:
             # Draw range bands (background)
-            prev = 0
-            for i, r in enumerate(sorted_ranges):
-                self.ax.barh(0, r - prev, left=prev, height=0.5,
-                            color=range_colors[i], alpha=0.6)
-                prev = r
+            self.ax.barh(0, band_sizes, left=band_starts, height=0.5,
+                         color=band_colors, alpha=0.6)
 
             # Draw actual value bar
             self.ax.barh(0, actual, height=0.25, color=KDSColors.PRIMARY)
@@ -1128,11 +1376,8 @@ class KDSChart:
 
         else:
             # Vertical bullet chart
-            prev = 0
-            for i, r in enumerate(sorted_ranges):
-                self.ax.bar(0, r - prev, bottom=prev, width=0.5,
-                           color=range_colors[i], alpha=0.6)
-                prev = r
+            self.ax.bar(0, band_sizes, bottom=band_starts, width=0.5,
+                        color=band_colors, alpha=0.6)
 
             # Draw actual value bar
             self.ax.bar(0, actual, width=0.25, color=KDSColors.PRIMARY)
@@ -1185,6 +1430,7 @@ class KDSChart:
         plt.tight_layout()
         return self
 
+    @_records_inputs
     def histogram(
         self,
         data: Sequence[float],
@@ -1258,6 +1504,7 @@ class KDSChart:
         plt.tight_layout()
         return self
 
+    @_records_inputs
     def heatmap(
         self,
         data: Sequence[Sequence[float]],
@@ -1287,18 +1534,14 @@ class KDSChart:
         Returns:
             self for method chaining.
         """
-        import numpy as np
-
         self.fig, self.ax = self._create_figure()
 
-        data_array = np.array(data)
+        data_array = np.asarray(data)  # No copy for ndarray input
         text_color = KDSColors.TEXT_LIGHT if self.dark_mode else KDSColors.TEXT_DARK
 
         # KDS-compliant purple colormap
         if cmap is None:
-            from matplotlib.colors import LinearSegmentedColormap
-            colors = [KDSColors.BACKGROUND_DARK, KDSColors.PRIMARY, "#B266FF"]
-            cmap = LinearSegmentedColormap.from_list("kds_purple", colors)
+            cmap = matplotlib.colormaps[KDS_PURPLE_CMAP]
 
         im = self.ax.imshow(data_array, cmap=cmap, aspect='auto', vmin=vmin, vmax=vmax)
 
@@ -1316,15 +1559,15 @@ class KDSChart:
             self.ax.set_yticklabels(row_labels)
 
         # Show values in cells
-        if show_values:
-            for i in range(data_array.shape[0]):
-                for j in range(data_array.shape[1]):
-                    val = data_array[i, j]
-                    # Choose text color based on cell brightness
-                    cell_color = "white" if val > (data_array.max() + data_array.min()) / 2 else "black"
-                    formatted_val = self._format_value(val) if self.smart_numbers else f"{val:.2f}"
-                    self.ax.text(j, i, formatted_val, ha="center", va="center",
-                                color=cell_color, fontsize=9)
+        if show_values and data_array.size:
+            # Choose text color based on cell brightness
+            white_cells = data_array > (data_array.max() + data_array.min()) / 2
+            format_cell = self._format_value if self.smart_numbers else "{:.2f}".format
+            add_text = self.ax.text
+            for (i, j), val in np.ndenumerate(data_array):
+                add_text(j, i, format_cell(val), ha="center", va="center",
+                         color="white" if white_cells[i, j] else "black", fontsize=9,
+                         in_layout=False)
 
         if title:
             self.ax.set_title(title, fontsize=14, fontweight=600, pad=20)
@@ -1332,6 +1575,7 @@ class KDSChart:
         plt.tight_layout()
         return self
 
+    @_records_inputs
     def boxplot(
         self,
         data: Union[Sequence[float], Sequence[Sequence[float]]],
@@ -1409,6 +1653,7 @@ class KDSChart:
         plt.tight_layout()
         return self
 
+    @_records_inputs
     def area(
         self,
         x_data: Sequence,
@@ -1474,6 +1719,7 @@ class KDSChart:
         plt.tight_layout()
         return self
 
+    @_records_inputs
     def donut(
         self,
         data: Sequence[float],
@@ -1507,6 +1753,9 @@ class KDSChart:
             colors = self._get_colors(len(data), chart_type="pie", values=list(data))
 
         text_color = KDSColors.TEXT_LIGHT if self.dark_mode else KDSColors.TEXT_DARK
+        # Slice labels (and percentages) are styled as they are created
+        label_props = {"color": text_color, "fontsize": 10}
+        wedge_props = dict(width=0.5, edgecolor=KDSColors.BACKGROUND_DARK if self.dark_mode else KDSColors.BACKGROUND_LIGHT)
 
         # Create donut (pie with white circle in center)
         if show_percentages:
@@ -1518,10 +1767,10 @@ class KDSChart:
                 startangle=90,
                 pctdistance=0.75,
                 labeldistance=1.15,
-                wedgeprops=dict(width=0.5, edgecolor=KDSColors.BACKGROUND_DARK if self.dark_mode else KDSColors.BACKGROUND_LIGHT),
+                wedgeprops=wedge_props,
+                textprops=label_props,
             )
             for autotext in autotexts:
-                autotext.set_color(text_color)
                 autotext.set_fontsize(9)
                 autotext.set_fontweight(500)
         else:
@@ -1531,14 +1780,10 @@ class KDSChart:
                 colors=colors,
                 startangle=90,
                 labeldistance=1.15,
-                wedgeprops=dict(width=0.5, edgecolor=KDSColors.BACKGROUND_DARK if self.dark_mode else KDSColors.BACKGROUND_LIGHT),
+                wedgeprops=wedge_props,
+                textprops=label_props,
             )
 
-        # Style the labels
-        for text in texts:
-            text.set_color(text_color)
-            text.set_fontsize(10)
-
         # Add center text
         if center_value or center_text:
             if center_value:
@@ -1556,6 +1801,7 @@ class KDSChart:
         plt.tight_layout()
         return self
 
+    @_records_inputs
     def sankey(
         self,
         flows: Sequence[float],
@@ -1593,8 +1839,6 @@ class KDSChart:
                 unit='$M'
             )
         """
-        from matplotlib.sankey import Sankey
-
         self.fig, self.ax = self._create_figure()
 
         if color is None:
@@ -1652,14 +1896,20 @@ class KDSChart:
         path: Union[str, Path],
         transparent: bool = False,
         format: Optional[str] = None,
+        compress_level: Optional[int] = None,
     ) -> Path:
         """
         Save the chart to a file.
 
         Args:
-            path: Output file path. If no extension, uses default_format.
+            path: Output file path. If no extension, uses default_format;
+                  a default of SVG becomes a 2x-DPI PNG for charts with more
+                  than SVG_ELEMENT_LIMIT data elements.
             transparent: If True, save with transparent background.
             format: Output format ('svg', 'png', 'pdf'). Overrides path extension.
+            compress_level: PNG zlib level (0-9). Lower levels encode faster
+                            but write larger files; None keeps Pillow's
+                            default of 6. Ignored for other formats.
 
         Returns:
             Path to the saved file.
@@ -1673,12 +1923,20 @@ class KDSChart:
         path = Path(path)
 
         # Determine format - priority: explicit format > path extension > default
+        dpi = self.dpi
         if format is not None:
             output_format = format.lower()
         elif path.suffix:
             output_format = path.suffix.lstrip('.').lower()
         else:
             output_format = self.default_format
+            if output_format == 'svg' and self._estimated_elements > SVG_ELEMENT_LIMIT:
+                output_format = 'png'
+                dpi = self.dpi * 2
+                logger.info(
+                    f"Chart has ~{self._estimated_elements} elements; "
+                    f"saving as {dpi} DPI PNG instead of SVG"
+                )
 
         # Ensure path has correct extension
         if not path.suffix or path.suffix.lstrip('.').lower() != output_format:
@@ -1686,6 +1944,16 @@ class KDSChart:
 
         path.parent.mkdir(parents=True, exist_ok=True)
 
+        if output_format != 'png':
+            compress_level = None
+
+        cache_file = self._render_cache_file(output_format, dpi, transparent, compress_level)
+        if cache_file is not None and cache_file.is_file():
+            shutil.copyfile(cache_file, path)
+            self.close()
+            logger.info(f"Chart saved to {path} ({output_format.upper()}, cached render)")
+            return path
+
         # SVG-specific settings
         if output_format == 'svg':
             self.fig.savefig(
@@ -1695,18 +1963,27 @@ class KDSChart:
                 facecolor=self.fig.get_facecolor() if not transparent else "none",
                 edgecolor="none",
                 transparent=transparent,
+                metadata={'Date': None},  # Reproducible output, no timestamp
             )
         else:
+            png_options = (
+                {"pil_kwargs": {"compress_level": compress_level}}
+                if compress_level is not None else {}
+            )
             self.fig.savefig(
                 path,
-                dpi=self.dpi,
+                dpi=dpi,
                 format=output_format,
                 bbox_inches="tight",
                 facecolor=self.fig.get_facecolor() if not transparent else "none",
                 edgecolor="none",
                 transparent=transparent,
+                **png_options,
             )
 
+        if cache_file is not None:
+            _store_render(path, cache_file)
+
         plt.close(self.fig)
         self.fig = None
         self.ax = None
@@ -1714,6 +1991,44 @@ class KDSChart:
         logger.info(f"Chart saved to {path} ({output_format.upper()})")
         return path
 
+    def _render_cache_file(
+        self,
+        output_format: str,
+        dpi: int,
+        transparent: bool,
+        compress_level: Optional[int] = None,
+    ) -> Optional[Path]:
+        """
+        Path of the cached render of the current chart, or None if uncached.
+
+        The key covers the chart method and its arguments plus every
+        setting that changes the output file.
+        """
+        if self.cache_dir is None or self._inputs_token is None:
+            return None
+
+        theme_params = (
+            sorted(self.theme.to_matplotlib_rcparams().items(), key=lambda item: item[0])
+            if self.theme is not None else None
+        )
+        key_source = repr((
+            _RENDER_CACHE_VERSION,
+            matplotlib.__version__,
+            self._inputs_token,
+            self.figsize,
+            self.dark_mode,
+            self.smart_numbers,
+            self.intelligent_colors,
+            self.font_family,
+            theme_params,
+            output_format,
+            dpi,
+            transparent,
+            compress_level,
+        ))
+        key = hashlib.blake2b(key_source.encode("utf-8"), digest_size=20).hexdigest()
+        return self.cache_dir / f"{key}.{output_format}"
+
     def show(self) -> None:
         """Display the chart (for interactive use)."""
         if self.fig is None:
@@ -1764,6 +2079,7 @@ class KDSChart:
             facecolor=self.fig.get_facecolor() if not transparent else "none",
             edgecolor="none",
             transparent=transparent,
+            metadata={'Date': None},  # Reproducible output, no timestamp
         )
 
         # Save PNG
@@ -1785,6 +2101,17 @@ class KDSChart:
         return (svg_path, png_path)
 
 
+def _store_render(path: Path, cache_file: Path) -> None:
+    """Copy a rendered chart into the cache atomically; failures are only logged."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_file.with_name(cache_file.name + ".tmp")
+        shutil.copyfile(path, tmp_path)
+        os.replace(tmp_path, cache_file)
+    except OSError as e:
+        logger.warning(f"Could not write chart cache {cache_file}: {e}")
+
+
 def recommend_chart_type(data_story: str, data_shape: Optional[Dict[str, int]] = None) -> str:
     """
     Suggest chart type based on story intent and data characteristics.
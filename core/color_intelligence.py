@@ -64,11 +64,14 @@ def get_sequential_colors(
     colors = [PURPLE_GRADIENT[int(i * step)] for i in range(n)]
 
     if values is not None:
-        # Sort colors by values (highest value gets darkest color)
-        sorted_indices = sorted(range(len(values)), key=lambda i: values[i], reverse=True)
+        # Sort colors by values (highest value gets darkest color). The
+        # sort key is the bound __getitem__, so ranking runs without a
+        # Python-level call per element
+        sorted_indices = sorted(range(len(values)), key=values.__getitem__, reverse=True)
+        ranked = colors[::-1] if reverse else colors
         result = [None] * n
         for rank, original_idx in enumerate(sorted_indices):
-            result[original_idx] = colors[rank] if not reverse else colors[-(rank+1)]
+            result[original_idx] = ranked[rank]
         return result
 
     return colors if not reverse else colors[::-1]
@@ -83,16 +86,9 @@ def get_categorical_colors(n: int) -> List[str]:
     if n <= len(CATEGORICAL_PALETTE):
         return CATEGORICAL_PALETTE[:n]
 
-    # If more colors needed, generate variations
-    colors = CATEGORICAL_PALETTE.copy()
-    while len(colors) < n:
-        # Add lightened versions
-        for base_color in CATEGORICAL_PALETTE:
-            if len(colors) >= n:
-                break
-            colors.append(lighten_color(base_color, 0.3))
-
-    return colors[:n]
+    # If more colors needed, cycle through lightened versions
+    repeats = -(-(n - len(CATEGORICAL_PALETTE)) // len(LIGHTENED_CATEGORICAL_PALETTE))
+    return (CATEGORICAL_PALETTE + LIGHTENED_CATEGORICAL_PALETTE * repeats)[:n]
 
 
 def get_diverging_colors(
@@ -151,6 +147,10 @@ def lighten_color(hex_color: str, factor: float = 0.2) -> str:
     return f"#{r:02x}{g:02x}{b:02x}"
 
 
+# Categorical colors beyond the base palette, computed once
+LIGHTENED_CATEGORICAL_PALETTE = [lighten_color(color, 0.3) for color in CATEGORICAL_PALETTE]
+
+
 def get_chart_colors(
     chart_type: Literal["bar", "pie", "line", "scatter", "area", "heatmap"],
     n: int,
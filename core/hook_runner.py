@@ -92,7 +92,9 @@ def handle_pre_commit() -> int:
     outputs_dir = Path("outputs")
     if outputs_dir.exists():
         logger.info("Checking outputs/ directory...")
-        issues = brand_guard.check_directory(outputs_dir)
+        issues = brand_guard.check_directory(
+            outputs_dir, cache_path=brand_guard.DEFAULT_CACHE_PATH
+        )
         all_issues.extend(issues)
         if not issues:
             logger.info("  No violations found.")
@@ -101,7 +103,9 @@ def handle_pre_commit() -> int:
     exports_dir = Path("exports")
     if exports_dir.exists():
         logger.info("Checking exports/ directory...")
-        issues = brand_guard.check_directory(exports_dir)
+        issues = brand_guard.check_directory(
+            exports_dir, cache_path=brand_guard.DEFAULT_CACHE_PATH
+        )
         all_issues.extend(issues)
         if not issues:
             logger.info("  No violations found.")
@@ -5,7 +5,6 @@ Formats large numbers for human readability in charts and reports.
 """
 
 from typing import Union, Optional
-import re
 
 
 def smart_format(
@@ -47,32 +46,28 @@ def smart_format(
 
     # Determine abbreviation
     if value >= 1_000_000_000:
-        formatted = f"{value / 1_000_000_000:.{decimals}f}B"
+        formatted = f"{value / 1_000_000_000:.{decimals}f}"
+        abbreviation = "B"
     elif value >= 1_000_000:
-        formatted = f"{value / 1_000_000:.{decimals}f}M"
+        formatted = f"{value / 1_000_000:.{decimals}f}"
+        abbreviation = "M"
     elif value >= 1_000:
-        formatted = f"{value / 1_000:.{decimals}f}K"
+        formatted = f"{value / 1_000:.{decimals}f}"
+        abbreviation = "K"
     else:
+        abbreviation = ""
         # For small numbers, show appropriate decimals
         if isinstance(value, float) and value != int(value):
             formatted = f"{value:.{decimals}f}"
         else:
             formatted = str(int(value))
 
-    # Remove trailing zeros after decimal (e.g., "2.0K" → "2K")
+    # Remove trailing zeros after decimal (e.g., "2.0K" → "2K"); the
+    # abbreviation is appended afterwards, so no need to split it off
     if '.' in formatted:
-        # Split by abbreviation letter if present
-        parts = re.split(r'([KMB])', formatted)
-        if len(parts) > 1:
-            # Has abbreviation
-            num_part = parts[0].rstrip('0').rstrip('.')
-            abbr_part = parts[1]
-            formatted = num_part + abbr_part
-        else:
-            # No abbreviation, just remove trailing zeros
-            formatted = formatted.rstrip('0').rstrip('.')
+        formatted = formatted.rstrip('0').rstrip('.')
 
-    return f"{sign}{prefix}{formatted}{suffix}"
+    return f"{sign}{prefix}{formatted}{abbreviation}{suffix}"
 
 
 def format_currency(value: Union[int, float], currency: str = "$") -> str:
@@ -55,6 +55,32 @@ class TestIsWeakTitle:
 
         assert not is_weak_title("North Region Captures 50% Market Share")
 
+    def test_action_words_match_whole_words(self):
+        """Action indicators embedded in other words do not count."""
+        from core.action_titles import is_weak_title
+
+        assert not is_weak_title("Pricing Leads Customer Retention")
+        assert is_weak_title("Customer Roadshows And Events")
+
+    def test_empty_title_is_weak(self):
+        """Empty and whitespace-only titles are weak."""
+        from core.action_titles import is_weak_title
+
+        assert is_weak_title("")
+        assert is_weak_title("   ")
+
+    def test_results_are_memoized(self):
+        """Repeated titles are served from the cache."""
+        from core.action_titles import is_weak_title
+
+        is_weak_title.cache_clear()
+        is_weak_title("Regional Revenue Analysis")
+        is_weak_title("Regional Revenue Analysis")
+
+        info = is_weak_title.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+
 
 class TestTransformToActionTitle:
     """Tests for title transformation."""
@@ -109,6 +135,28 @@ class TestTransformToActionTitle:
         assert "Overview" not in result
         assert "Regional Sales" in result or "Regional" in result
 
+    def test_transform_matches_sequential_pattern_removal(self):
+        """Fused removal matches applying each weak pattern in turn."""
+        import re
+
+        from core.action_titles import WEAK_PATTERNS, transform_to_action_title
+
+        titles = [
+            "Summary: Quarterly Sales",
+            "Data Regional Revenue Breakdown",
+            "Monthly Churn Analysis",
+            "Chart of Annual Margin Overview",
+            "Report",
+        ]
+        for title in titles:
+            expected = title
+            for pattern in WEAK_PATTERNS:
+                expected = re.sub(pattern, '', expected, flags=re.IGNORECASE)
+            expected = expected.strip()
+            expected = expected.title() if expected else title
+
+            assert transform_to_action_title(title) == expected
+
     def test_transform_with_dollar_value(self):
         """Should handle dollar values."""
         from core.action_titles import transform_to_action_title
@@ -172,6 +220,18 @@ class TestSuggestActionTitles:
         # Should include an "Outperforms" suggestion
         assert any("Outperforms" in s for s in suggestions)
 
+    def test_runner_up_found_regardless_of_order(self):
+        """Leader and runner-up are found wherever they appear in the dict."""
+        from core.action_titles import suggest_action_titles
+
+        suggestions = suggest_action_titles(
+            "sales comparison",
+            {"C": 30, "B": 70, "skip": "n/a", "A": 100}
+        )
+
+        assert suggestions[0] == "A Leads with 50% Share"
+        assert "A Outperforms B by 30" in suggestions
+
     def test_handles_non_numeric_values(self):
         """Should handle dict with non-numeric values."""
         from core.action_titles import suggest_action_titles
@@ -19,6 +19,7 @@ from core.audit_logger import (
     get_export_history,
     get_command_stats,
     compute_file_hash,
+    flush_logs,
     get_package_versions,
     create_reproducibility_record,
     create_export_manifest,
@@ -93,6 +94,32 @@ class TestCommandLogEntry:
         assert data["task_id"] == "1.1"
         assert data["spec_version"] == 3
 
+    def test_uses_slots(self):
+        """Test that entries do not carry a per-instance __dict__."""
+        entry = CommandLogEntry(timestamp="2025-12-01T12:00:00", command="/x")
+
+        assert not hasattr(entry, "__dict__")
+        assert entry.to_dict() == {
+            "timestamp": "2025-12-01T12:00:00",
+            "command": "/x",
+            "result": "success",
+        }
+
+    def test_to_json_without_orjson(self, monkeypatch):
+        """Test the stdlib json fallback produces the same entry."""
+        import core.audit_logger as audit_logger
+
+        entry = CommandLogEntry(
+            timestamp="2025-12-01T12:00:00",
+            command="/project:execute",
+            duration_sec=1.5,
+        )
+        expected = json.loads(entry.to_json())
+
+        monkeypatch.setattr(audit_logger, "orjson", None)
+
+        assert json.loads(entry.to_json()) == expected
+
 
 class TestExportLogEntry:
     """Tests for ExportLogEntry dataclass."""
@@ -144,6 +171,32 @@ class TestLogCommand:
 
         assert len(lines) == 3
 
+    def test_line_matches_entry_dataclass(self, project_dir):
+        """Test that logged lines match CommandLogEntry serialization."""
+        log_path = log_command(
+            project_dir, "/project:execute", duration_sec=2.0,
+            result="error", error_message="boom", task_id="1.2", spec_version=4,
+        )
+        logged = json.loads(log_path.read_text().strip())
+        expected = CommandLogEntry(
+            timestamp=logged["timestamp"], command="/project:execute",
+            duration_sec=2.0, result="error", error_message="boom",
+            task_id="1.2", spec_version=4,
+        )
+
+        assert list(logged.items()) == list(expected.to_dict().items())
+
+    def test_timestamp_is_iso_format(self, project_dir):
+        """Test that logged timestamps parse as ISO-8601 local time."""
+        before = datetime.now()
+        log_command(project_dir, "/project:status")
+        after = datetime.now()
+
+        timestamp = get_command_history(project_dir)[0]["timestamp"]
+
+        assert len(timestamp) == 26
+        assert before <= datetime.fromisoformat(timestamp) <= after
+
     def test_logs_duration(self, project_dir):
         """Test logging command duration."""
         log_command(project_dir, "/project:execute", duration_sec=45.5)
@@ -164,6 +217,60 @@ class TestLogCommand:
         assert history[0]["result"] == "error"
         assert history[0]["error_message"] == "File not found"
 
+    def test_concurrent_threads_write_whole_lines(self, project_dir):
+        """Test that concurrent appends never interleave within a line."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(
+                lambda i: log_command(project_dir, f"/command:{i}", task_id="x" * 500),
+                range(200),
+            ))
+
+        history = get_command_history(project_dir)
+        assert len(history) == 200
+        assert get_command_stats(project_dir)["total_commands"] == 200
+
+    def test_writes_without_orjson(self, project_dir, monkeypatch):
+        """Test logging with the stdlib json fallback."""
+        import core.audit_logger as audit_logger
+
+        monkeypatch.setattr(audit_logger, "orjson", None)
+        log_command(project_dir, "/project:status", task_id="caf\u00e9")
+
+        assert get_command_history(project_dir)[0]["task_id"] == "caf\u00e9"
+
+    def test_survives_log_file_deletion(self, project_dir):
+        """Test that a deleted log file is recreated on the next write."""
+        log_path = log_command(project_dir, "/project:status")
+        log_path.unlink()
+
+        log_command(project_dir, "/project:execute")
+
+        history = get_command_history(project_dir)
+        assert [h["command"] for h in history] == ["/project:execute"]
+
+    def test_survives_log_dir_removal(self, project_dir):
+        """Test that a removed log directory is recreated."""
+        import shutil
+
+        log_command(project_dir, "/project:status")
+        flush_logs()
+        shutil.rmtree(project_dir / "project_state" / "logs")
+
+        log_path = log_command(project_dir, "/project:execute")
+
+        assert log_path.exists()
+
+    def test_flush_logs_is_idempotent(self, project_dir):
+        """Test that flush_logs can be called repeatedly."""
+        log_command(project_dir, "/project:status")
+        flush_logs()
+        flush_logs()
+
+        log_command(project_dir, "/project:review")
+        assert len(get_command_history(project_dir)) == 2
+
 
 class TestLogExport:
     """Tests for log_export function."""
@@ -192,6 +299,19 @@ class TestLogExport:
         assert len(history[0]["files"]) == 3
         assert history[0]["human_review"] is True
 
+    def test_line_matches_entry_dataclass(self, project_dir):
+        """Test that logged lines match ExportLogEntry serialization."""
+        log_path = log_export(
+            project_dir, files=["a.pptx"], qc_passed=False, url="https://x"
+        )
+        logged = json.loads(log_path.read_text().strip())
+        expected = ExportLogEntry(
+            timestamp=logged["timestamp"], files=["a.pptx"],
+            qc_passed=False, url="https://x",
+        )
+
+        assert list(logged.items()) == list(expected.to_dict().items())
+
 
 class TestGetCommandHistory:
     """Tests for get_command_history function."""
@@ -230,6 +350,35 @@ class TestGetCommandHistory:
         assert len(history) == 2
         assert all(h["command"] == "/project:execute" for h in history)
 
+    def test_limit_reads_across_blocks(self, project_dir, monkeypatch):
+        """Test that tail reads match a full read across block boundaries."""
+        import core.audit_logger as audit_logger
+
+        for i in range(25):
+            log_command(project_dir, f"/command:{i}", task_id=str(i))
+        log_path = project_dir / "project_state" / "logs" / "commands" / "command_log.jsonl"
+        with open(log_path, "a") as f:
+            f.write("not json\n\n")
+        log_command(project_dir, "/command:last")
+
+        full = get_command_history(project_dir)
+        monkeypatch.setattr(audit_logger, "_TAIL_BLOCK_SIZE", 7)
+
+        assert get_command_history(project_dir, limit=10) == full[:10]
+        assert get_command_history(project_dir, limit=100) == full
+
+    def test_limit_with_filter(self, project_dir):
+        """Test combining limit with a command filter."""
+        for i in range(6):
+            log_command(project_dir, "/project:execute", task_id=str(i))
+            log_command(project_dir, "/project:status")
+
+        history = get_command_history(
+            project_dir, limit=2, command_filter="/project:execute"
+        )
+
+        assert [h["task_id"] for h in history] == ["5", "4"]
+
 
 class TestGetExportHistory:
     """Tests for get_export_history function."""
@@ -284,6 +433,64 @@ class TestGetCommandStats:
 
         assert stats["success_rate"] == 0.75
 
+    def test_accepts_preloaded_history(self, project_dir):
+        """Test computing stats from an already loaded history."""
+        log_command(project_dir, "/project:execute", duration_sec=30)
+        log_command(project_dir, "/project:status", result="error")
+        history = get_command_history(project_dir)
+
+        stats = get_command_stats(history=history)
+
+        assert stats == get_command_stats(project_dir)
+        assert stats["success_rate"] == 0.5
+
+    def test_requires_path_or_history(self):
+        """Test that one of project_path or history must be given."""
+        with pytest.raises(ValueError):
+            get_command_stats()
+
+    def test_running_stats_match_full_scan(self, project_dir):
+        """Test that incrementally maintained stats match a rebuild."""
+        import core.audit_logger as audit_logger
+
+        log_command(project_dir, "/project:plan", duration_sec=10)
+        log_command(project_dir, "/project:execute", result="error")
+        log_command(project_dir, "/project:execute", duration_sec=2.5)
+
+        stats = get_command_stats(project_dir)
+        rebuilt = audit_logger._compute_command_stats(get_command_history(project_dir))
+        rebuilt.pop("success_count")
+
+        assert (project_dir / "project_state" / "logs" / "commands" / "stats.json").exists()
+        assert stats == rebuilt
+
+    def test_stats_rebuilt_after_external_append(self, project_dir):
+        """Test that stats notice log lines written by someone else."""
+        log_command(project_dir, "/project:plan")
+        log_path = project_dir / "project_state" / "logs" / "commands" / "command_log.jsonl"
+        with open(log_path, "a") as f:
+            f.write(json.dumps({"timestamp": "2025-12-01T12:00:00", "command": "/x", "result": "error"}) + "\n")
+
+        assert get_command_stats(project_dir)["total_commands"] == 2
+
+        log_command(project_dir, "/project:execute")
+        stats = get_command_stats(project_dir)
+
+        assert stats["total_commands"] == 3
+        assert stats["commands_by_type"]["/x"] == 1
+        assert stats["success_rate"] == pytest.approx(2 / 3)
+
+    def test_corrupt_stats_file_ignored(self, project_dir):
+        """Test that a corrupt stats file falls back to the log."""
+        log_command(project_dir, "/project:plan")
+        stats_path = project_dir / "project_state" / "logs" / "commands" / "stats.json"
+        stats_path.write_text("{not json")
+
+        assert get_command_stats(project_dir)["total_commands"] == 1
+
+        log_command(project_dir, "/project:plan")
+        assert get_command_stats(project_dir)["total_commands"] == 2
+
 
 class TestComputeFileHash:
     """Tests for compute_file_hash function."""
@@ -316,6 +523,17 @@ class TestComputeFileHash:
 
         assert compute_file_hash(file1) != compute_file_hash(file2)
 
+    @pytest.mark.parametrize("content", [b"", b"x" * 100000])
+    def test_mmap_fallback_matches(self, tmp_path, monkeypatch, content):
+        """Test the pre-3.11 mmap path matches hashlib.sha256."""
+        import hashlib
+
+        test_file = tmp_path / "data.bin"
+        test_file.write_bytes(content)
+        monkeypatch.delattr(hashlib, "file_digest", raising=False)
+
+        assert compute_file_hash(test_file) == hashlib.sha256(content).hexdigest()
+
 
 class TestGetPackageVersions:
     """Tests for get_package_versions function."""
@@ -332,6 +550,40 @@ class TestGetPackageVersions:
         assert "pandas" in versions
         assert "pyyaml" in versions
 
+    def test_does_not_import_packages(self, monkeypatch):
+        """Test that versions come from metadata without importing."""
+        import core.audit_logger as audit_logger
+
+        audit_logger._package_versions.cache_clear()
+        monkeypatch.delitem(sys.modules, "duckdb", raising=False)
+        try:
+            versions = get_package_versions()
+        finally:
+            audit_logger._package_versions.cache_clear()
+
+        assert "duckdb" not in sys.modules
+        assert versions["duckdb"]
+
+    def test_missing_package_reported(self, monkeypatch):
+        """Test that missing distributions are reported as not installed."""
+        import core.audit_logger as audit_logger
+
+        monkeypatch.setattr(audit_logger, "KEY_PACKAGES", ("no-such-dist-kaca",))
+        audit_logger._package_versions.cache_clear()
+        try:
+            versions = get_package_versions()
+        finally:
+            audit_logger._package_versions.cache_clear()
+
+        assert versions == {"no-such-dist-kaca": "not installed"}
+
+    def test_returns_independent_copies(self):
+        """Test that callers cannot mutate the cached versions."""
+        versions = get_package_versions()
+        versions["pandas"] = "tampered"
+
+        assert get_package_versions()["pandas"] != "tampered"
+
 
 class TestCreateReproducibilityRecord:
     """Tests for create_reproducibility_record function."""
@@ -352,6 +604,21 @@ class TestCreateReproducibilityRecord:
         assert "Python Version" in content
         assert "Template Version" in content
 
+    def test_template_version_tracks_file_changes(self, project_dir):
+        """Test that an updated .kaca-version.json is re-read despite caching."""
+        content = create_reproducibility_record(project_dir).read_text()
+        assert "- Template Version: 2.0.0" in content
+
+        (project_dir / ".kaca-version.json").write_text(
+            json.dumps({"template_version": "2.10.0"})
+        )
+        content = create_reproducibility_record(project_dir).read_text()
+        assert "- Template Version: 2.10.0" in content
+
+        (project_dir / ".kaca-version.json").write_text("{not json")
+        content = create_reproducibility_record(project_dir).read_text()
+        assert "- Template Version: unknown" in content
+
     def test_includes_data_hashes(self, project_dir):
         """Test that record includes data hashes."""
         # Create a data file
@@ -363,6 +630,38 @@ class TestCreateReproducibilityRecord:
         assert "Data Snapshot" in content
         assert "test.csv" in content
 
+    def test_hashes_many_files(self, project_dir):
+        """Test that concurrently hashed files are reported in sorted order."""
+        raw_dir = project_dir / "data" / "raw"
+        for i in range(12):
+            (raw_dir / f"file_{i:02d}.csv").write_text(f"id,value\n{i},{i}")
+        (project_dir / "outputs" / "model.pkl").write_bytes(b"model")
+
+        content = create_reproducibility_record(project_dir).read_text()
+
+        listed = [line for line in content.splitlines() if line.startswith("- file_")]
+        assert [line.split(":")[0] for line in listed] == [
+            f"- file_{i:02d}.csv" for i in range(10)
+        ]
+        expected = compute_file_hash(raw_dir / "file_00.csv")[:16]
+        assert f"- file_00.csv: {expected}..." in content
+        assert "## Model Artifacts" in content
+        assert "- model.pkl" in content
+
+    def test_finds_nested_model_artifacts(self, project_dir):
+        """Test that model files are found at any depth, others ignored."""
+        nested = project_dir / "outputs" / "models" / "v2"
+        nested.mkdir(parents=True)
+        (nested / "weights.pt").write_bytes(b"w")
+        (project_dir / "outputs" / "clf.joblib").write_bytes(b"c")
+        (project_dir / "outputs" / "chart.png").write_bytes(b"p")
+
+        content = create_reproducibility_record(project_dir).read_text()
+
+        assert "- weights.pt" in content
+        assert "- clf.joblib" in content
+        assert "chart.png" not in content
+
     def test_includes_command_stats(self, project_dir):
         """Test that record includes command history stats."""
         log_command(project_dir, "/project:execute", duration_sec=30)
@@ -374,6 +673,16 @@ class TestCreateReproducibilityRecord:
         assert "Session History" in content
         assert "Total Commands" in content
 
+    def test_recreates_removed_logs_dir(self, project_dir):
+        """Test that a second record is written after the logs dir is deleted."""
+        import shutil
+
+        create_reproducibility_record(project_dir)
+        shutil.rmtree(project_dir / "project_state" / "logs")
+
+        record_path = create_reproducibility_record(project_dir)
+        assert record_path.exists()
+
 
 class TestCreateExportManifest:
     """Tests for create_export_manifest function."""
@@ -407,6 +716,30 @@ class TestCreateExportManifest:
         assert manifest["human_review_required"] is True
 
 
+    def test_manifest_picks_up_renamed_project(self, project_dir):
+        """Test that a changed spec.yaml is re-read despite caching."""
+        deliverables = [{"filename": "report.pptx"}]
+        create_export_manifest(project_dir, deliverables, {})
+
+        spec_path = project_dir / "project_state" / "spec.yaml"
+        spec_path.write_text(yaml.dump({
+            "version": 2,
+            "meta": {"project_name": "renamed-project-with-longer-name"},
+        }))
+        manifest_path = create_export_manifest(project_dir, deliverables, {})
+
+        manifest = json.loads(manifest_path.read_text())
+        assert manifest["project_name"] == "renamed-project-with-longer-name"
+
+    def test_manifest_without_spec(self, project_dir):
+        """Test that a missing spec.yaml yields an unknown project name."""
+        (project_dir / "project_state" / "spec.yaml").unlink()
+
+        manifest_path = create_export_manifest(project_dir, [], {})
+
+        assert json.loads(manifest_path.read_text())["project_name"] == "unknown"
+
+
 class TestFormatCommandHistory:
     """Tests for format_command_history function."""
 
@@ -425,6 +758,26 @@ class TestFormatCommandHistory:
         assert "[OK]" in result
         assert "/project:execute" in result
 
+    def test_exact_line_layout(self):
+        """Test the per-entry line layout, including optional detail lines."""
+        history = [
+            {"timestamp": "2025-01-02T03:04:05.123456", "command": "/a",
+             "result": "success", "duration_sec": 1.25},
+            {"timestamp": "2025-01-02T03:04:06", "command": "/b",
+             "result": "error", "task_id": "t1", "error_message": "boom"},
+        ]
+
+        lines = format_command_history(history, max_entries=1).splitlines()
+        assert lines[3] == "  [OK] 2025-01-02T03:04:05 /a (1.2s)"
+        assert lines[-1] == "  ... and 1 more entries"
+
+        lines = format_command_history(history[1:]).splitlines()
+        assert lines[3:] == [
+            "  [ERR] 2025-01-02T03:04:06 /b ",
+            "       Task: t1",
+            "       Error: boom",
+        ]
+
 
 class TestFormatExportHistory:
     """Tests for format_export_history function."""
@@ -443,3 +796,19 @@ class TestFormatExportHistory:
 
         assert "QC:PASS" in result
         assert "report.pptx" in result
+
+    def test_exact_line_layout(self):
+        """Test the per-entry layout and the file list truncation."""
+        history = [{
+            "timestamp": "2025-01-02T03:04:05.123456",
+            "files": [f"f{i}.pptx" for i in range(7)],
+            "qc_passed": False,
+            "human_review": True,
+            "destination": "sharepoint",
+        }]
+
+        lines = format_export_history(history).splitlines()
+
+        assert lines[3] == "  2025-01-02T03:04:05 - sharepoint - QC:FAIL - Reviewed"
+        assert lines[4:9] == [f"    - f{i}.pptx" for i in range(5)]
+        assert lines[9] == "    ... and 2 more files"
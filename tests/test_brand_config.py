@@ -10,6 +10,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 import yaml
 from core.brand_config import (
     BrandConfig,
+    CompiledBrandConfig,
     DEFAULT_BRAND_CONFIG,
     load_brand_config,
     is_color_allowed,
@@ -33,6 +34,14 @@ class TestBrandConfig:
         assert config.primary_color == "#7823DC"
         assert config.is_override is False
 
+    def test_uses_slots(self):
+        """Test that configs are slotted and reject unknown attributes."""
+        config = BrandConfig()
+
+        assert not hasattr(config, "__dict__")
+        with pytest.raises(AttributeError):
+            config.primary_colour = "#000000"
+
     def test_to_dict(self):
         """Test converting config to dict."""
         config = BrandConfig()
@@ -77,6 +86,37 @@ class TestLoadBrandConfig:
         assert config.brand_name == "Kearney"
         assert config.accent_colors == ["#7823DC", "#444444"]
 
+    def test_load_utf8_brand_name(self, tmp_path):
+        """Test that non-ASCII YAML content is decoded correctly."""
+        config_dir = tmp_path / "config" / "governance"
+        config_dir.mkdir(parents=True)
+        (config_dir / "brand.yaml").write_bytes(
+            "brand_name: Caf\u00e9 M\u00fcller\n".encode("utf-8")
+        )
+
+        config = load_brand_config(tmp_path)
+
+        assert config.brand_name == "Caf\u00e9 M\u00fcller"
+
+    def test_invalid_yaml_falls_back_to_defaults(self, tmp_path):
+        """Test that an unparseable brand.yaml is ignored."""
+        config_dir = tmp_path / "config" / "governance"
+        config_dir.mkdir(parents=True)
+        (config_dir / "brand.yaml").write_text("colors: [unclosed\n")
+
+        config = load_brand_config(tmp_path)
+
+        assert config.brand_name == "Kearney"
+        assert config.primary_color == "#7823DC"
+
+    def test_unreadable_brand_yaml_falls_back_to_defaults(self, tmp_path):
+        """Test that a brand.yaml that cannot be opened is ignored."""
+        (tmp_path / "config" / "governance" / "brand.yaml").mkdir(parents=True)
+
+        config = load_brand_config(tmp_path)
+
+        assert config.brand_name == "Kearney"
+
     def test_load_with_override_disabled(self, tmp_path):
         """Test that disabled override is ignored."""
         config_dir = tmp_path / "config"
@@ -175,6 +215,97 @@ class TestLoadBrandConfig:
         assert config.logo_placement == "top-left"
 
 
+class TestApplyConfig:
+    """Tests for mapping YAML data onto BrandConfig fields."""
+
+    def test_nested_fields_applied(self):
+        """Test that every nested section reaches its attribute."""
+        from core.brand_config import _apply_config
+
+        config = BrandConfig()
+        _apply_config(config, {
+            "brand_name": "Client",
+            "colors": {"background": {"dark": "#000000"}, "accent": ["#111111"]},
+            "typography": {"weights": [300]},
+            "charts": {"data_labels_outside": False},
+            "logo": {"placement": "bottom-left"},
+        })
+
+        assert config.brand_name == "Client"
+        assert config.background_dark == "#000000"
+        assert config.background_light == "#FFFFFF"
+        assert config.accent_colors == ["#111111"]
+        assert config.font_weights == [300]
+        assert config.data_labels_outside is False
+        assert config.logo_placement == "bottom-left"
+
+    def test_unknown_and_malformed_entries_ignored(self):
+        """Test that unknown keys and non-mapping sections are skipped."""
+        from core.brand_config import _apply_config
+
+        config = BrandConfig()
+        _apply_config(config, {
+            "enabled": True,
+            "colors": "purple",
+            "typography": {1: "x"},
+            "primary": "#000000",
+        })
+
+        assert config.primary_color == "#7823DC"
+        assert config.primary_font == "Inter"
+
+
+class TestBrandConfigCache:
+    """Tests for caching of parsed brand configs."""
+
+    def _write_override(self, tmp_path, brand_name):
+        config_dir = tmp_path / "config"
+        config_dir.mkdir(parents=True, exist_ok=True)
+        path = config_dir / "brand_override.yaml"
+        path.write_text(yaml.dump({"enabled": True, "brand_name": brand_name}))
+        return path
+
+    def test_repeated_loads_skip_parsing(self, tmp_path, monkeypatch):
+        """Test that an unchanged project is only parsed once."""
+        import core.brand_config as brand_config
+
+        self._write_override(tmp_path, "Client")
+        calls = []
+        original = brand_config._load_yaml_file
+        monkeypatch.setattr(
+            brand_config, "_load_yaml_file",
+            lambda path: calls.append(path) or original(path),
+        )
+
+        first = load_brand_config(tmp_path)
+        second = load_brand_config(tmp_path)
+
+        assert len(calls) == 2  # brand.yaml and brand_override.yaml, once
+        assert first == second
+
+    def test_edited_override_is_reloaded(self, tmp_path):
+        """Test that changing an override file invalidates the cache."""
+        path = self._write_override(tmp_path, "Client")
+        assert load_brand_config(tmp_path).brand_name == "Client"
+
+        path.write_text(yaml.dump({"enabled": True, "brand_name": "Other Client"}))
+        assert load_brand_config(tmp_path).brand_name == "Other Client"
+
+        path.unlink()
+        assert load_brand_config(tmp_path).brand_name == "Kearney"
+
+    def test_mutating_result_does_not_leak(self, tmp_path):
+        """Test that callers get independent copies of a cached config."""
+        config = load_brand_config(tmp_path)
+        config.forbidden_colors.append("#123456")
+        config.allowed_colors.add("#abcdef")
+
+        fresh = load_brand_config(tmp_path)
+
+        assert "#123456" not in fresh.forbidden_colors
+        assert "#abcdef" not in fresh.allowed_colors
+
+
 class TestIsColorAllowed:
     """Tests for is_color_allowed function."""
 
@@ -222,6 +353,56 @@ class TestIsColorForbidden:
 
         assert is_color_forbidden("#7823DC", config) is False
 
+    def test_sees_in_place_list_changes(self):
+        """Test that edits to forbidden_colors after a check are honored."""
+        config = BrandConfig()
+        config.forbidden_colors = ["#00FF00"]
+        assert is_color_forbidden(" #ff0000 ", config) is False
+
+        config.forbidden_colors.append("#FF0000")
+        assert is_color_forbidden(" #ff0000 ", config) is True
+
+        config.forbidden_colors[0] = "#0000FF"
+        assert is_color_forbidden("#00ff00", config) is False
+
+
+class TestCompiledBrandConfig:
+    """Tests for the compiled lookup view of a BrandConfig."""
+
+    def test_compiled_sets_are_normalized(self, tmp_path):
+        """Test that the compiled view holds lowercased frozensets."""
+        compiled = load_brand_config(tmp_path).compiled
+
+        assert isinstance(compiled, CompiledBrandConfig)
+        assert "#00ff00" in compiled.forbidden
+        assert "#7823dc" in compiled.allowed
+        assert "no_emojis" in compiled.enforced
+        assert compiled.chart_colors[0] == "#7823DC"
+
+    def test_checks_accept_compiled_config(self):
+        """Test that hot-path checks give the same answers for both types."""
+        config = BrandConfig()
+        config.forbidden_colors = ["#00FF00"]
+        compiled = config.compiled
+
+        for color in ("#00ff00", " #00FF00 ", "#7823DC"):
+            assert is_color_forbidden(color, compiled) == is_color_forbidden(color, config)
+            assert is_color_allowed(color, compiled) == is_color_allowed(color, config)
+        assert is_rule_enforced("no_emojis", compiled) is True
+        assert is_rule_enforced("custom_rule", compiled) is False
+
+    def test_compiled_is_an_immutable_snapshot(self):
+        """Test that the compiled view is frozen and tracks later edits on recompile."""
+        config = BrandConfig()
+        compiled = config.compiled
+
+        with pytest.raises(AttributeError):
+            compiled.forbidden = frozenset()
+
+        config.forbidden_colors.append("#FF0000")
+        assert "#ff0000" not in compiled.forbidden
+        assert "#ff0000" in config.compiled.forbidden
+
 
 class TestGetBrandColors:
     """Tests for get_brand_colors function."""
@@ -1,20 +1,21 @@
 """Tests for core/brand_guard.py"""
 
-import pytest
-from pathlib import Path
-import tempfile
 import os
+import tempfile
+from pathlib import Path
+
+import pytest
 
 from core.brand_guard import (
-    check_file,
+    ALLOWED_COLORS,
+    FORBIDDEN_COLORS,
+    BrandViolation,
     check_directory,
+    check_file,
     check_text_content,
+    is_green_rgb,
     normalize_hex,
     rgb_to_hex,
-    is_green_rgb,
-    BrandViolation,
-    FORBIDDEN_COLORS,
-    ALLOWED_COLORS,
 )
 
 
@@ -51,6 +52,16 @@ class TestColorUtilities:
         assert is_green_rgb(0, 0, 255) is False  # Blue
         assert is_green_rgb(100, 100, 100) is False  # Gray
 
+    def test_is_green_rgb_matches_ratio_rule(self):
+        """Test the threshold table against the G > 100, G > 1.3 x R/B rule."""
+        def rule(r, g, b):
+            return g > 100 and g > r * 1.3 and g > b * 1.3
+
+        for m in list(range(0, 1000, 7)) + [76, 77, 100, 255, 999, 1000, 1500, -5]:
+            for g in range(0, 1400, 3):
+                assert is_green_rgb(m, g, 0) == rule(m, g, 0)
+                assert is_green_rgb(0, g, m) == rule(0, g, m)
+
 
 class TestTextContentChecks:
     """Tests for text content validation."""
@@ -70,6 +81,18 @@ class TestTextContentChecks:
         emoji_violations = [v for v in violations if v.rule == "NO_EMOJIS"]
         assert len(emoji_violations) == 0
 
+    def test_emoji_range_boundaries(self):
+        """Test the edges of the merged emoji ranges."""
+        from core.brand_guard import EMOJI_PATTERN
+
+        inside = ["\u24C2", "\U0001F251", "\U0001F300", "\U0001F64F",
+                  "\U0001F680", "\U0001F6FF", "\U0001F900", "\U0001FAFF"]
+        outside = ["\u24C1", "\U0001F252", "\U0001F2FF", "\U0001F650",
+                   "\U0001F67F", "\U0001F700", "\U0001F8FF", "\U0001FB00"]
+
+        assert all(EMOJI_PATTERN.fullmatch(ch) for ch in inside)
+        assert not any(EMOJI_PATTERN.search(ch) for ch in outside)
+
     def test_detect_forbidden_hex_color(self):
         """Test detection of forbidden hex colors."""
         content = 'color: #00FF00;'  # Pure green
@@ -99,6 +122,103 @@ class TestTextContentChecks:
         assert len(emoji_violations) == 1
         assert emoji_violations[0].line_number == 2
 
+    def test_violation_order_within_line(self):
+        """Test that each line reports emojis, then hex, then RGB colors."""
+        content = (
+            "ok\n"
+            "rgb(0, 255, 0) #00ff00 \U0001F600 x \U0001F680 #0f0\n"
+            "\n"
+            "color: #2e7d32"
+        )
+        violations = check_text_content(content, "test.txt")
+
+        assert [(v.line_number, v.message) for v in violations] == [
+            (2, "Emoji detected: \U0001F600\U0001F680"),
+            (2, "Forbidden green color: #00ff00"),
+            (2, "Forbidden green color: #0f0"),
+            (2, "Forbidden green RGB color: rgb(0, 255, 0)"),
+            (4, "Forbidden green color: #2e7d32"),
+        ]
+
+    def test_rgb_split_across_lines_not_matched(self):
+        """Test that rgb() values spanning lines are not reported."""
+        content = "rgb(\n0, 255, 0)\nrgb(0,\t255 ,0)"
+        violations = check_text_content(content, "test.css")
+
+        assert [v.line_number for v in violations] == [3]
+
+    def test_forbidden_hex_spellings(self):
+        """Test short, upper-case and embedded hex tokens against the forbidden set."""
+        content = "#0F0 #7FFF00 #00ff00ab #0f0a #7823dc #0f0_ok #00ff00"
+        violations = check_text_content(content, "a.css")
+
+        assert [v.message for v in violations] == [
+            "Forbidden green color: #0F0",
+            "Forbidden green color: #7FFF00",
+            "Forbidden green color: #00ff00",
+        ]
+
+    def test_forbidden_colors_changes_take_effect(self, monkeypatch):
+        """Test that the scan follows updates to FORBIDDEN_COLORS."""
+        import core.brand_guard as brand_guard
+
+        assert check_text_content("fill: #123456", "a.svg") == []
+
+        monkeypatch.setattr(
+            brand_guard, "FORBIDDEN_COLORS", FORBIDDEN_COLORS | {"#123456"}
+        )
+
+        assert len(check_text_content("fill: #123456", "a.svg")) == 1
+
+    def test_only_needed_branches_scanned(self):
+        """Test that the scan pattern only includes branches whose marker occurs."""
+        from core.brand_guard import _text_check_pattern
+
+        _text_check_pattern.cache_clear()
+        check_text_content("color: #00ff00", "a.css")
+        check_text_content("caf\u00e9 rgb(0, 255, 0)", "a.txt")
+
+        patterns = [p.pattern for p in (
+            _text_check_pattern(frozenset(FORBIDDEN_COLORS), False, False, True, False),
+            _text_check_pattern(frozenset(FORBIDDEN_COLORS), False, True, False, True),
+        )]
+        assert _text_check_pattern.cache_info().hits == 2
+        assert "rgb" not in patterns[0] and "emoji" not in patterns[0]
+        assert "hex" not in patterns[1]
+
+    def test_ascii_bytes_match_str_results(self):
+        """Test that ASCII bytes are checked exactly like the decoded text."""
+        content = "a { color: #00FF00; }\nb { color: rgb(0,\x1c255, 0); }\n#0f0_x #0f0"
+
+        from_bytes = check_text_content(content.encode("ascii"), "a.css")
+
+        assert from_bytes == check_text_content(content, "a.css")
+        assert [v.line_number for v in from_bytes] == [1, 2, 3]
+
+    def test_carriage_return_line_endings(self, tmp_path):
+        """Test that files with CR or CRLF newlines keep their line numbers."""
+        path = tmp_path / "mixed.css"
+        path.write_bytes(b"a {}\rb { color: #00ff00; }\r\nc { color: green; }")
+
+        violations = check_file(path)
+
+        assert [(v.line_number, v.message) for v in violations] == [
+            (2, "Forbidden green color: #00ff00"),
+            (None, "Named color 'green' is forbidden in CSS."),
+        ]
+
+    def test_plain_ascii_skips_pattern_scan(self, monkeypatch):
+        """Test that text with no color or emoji markers is not regex-scanned."""
+        import core.brand_guard as brand_guard
+
+        def fail(content):
+            raise AssertionError("pattern scan should be skipped")
+
+        monkeypatch.setattr(brand_guard, "_matches_by_line", fail)
+
+        assert check_text_content("plain text\nwith no markers", "a.txt") == []
+        assert check_text_content("", "a.txt") == []
+
 
 class TestFileChecks:
     """Tests for file validation."""
@@ -165,6 +285,101 @@ class TestFileChecks:
             os.unlink(temp_path)
 
 
+class TestImageChecks:
+    """Tests for image color sampling."""
+
+    def _save_image(self, tmp_path, name, pixels):
+        from PIL import Image
+
+        img = Image.new("RGB", (len(pixels[0]), len(pixels)))
+        img.putdata([p for row in pixels for p in row])
+        path = tmp_path / name
+        img.save(path)
+        return path
+
+    def test_green_image_flagged(self, tmp_path):
+        """Test that a mostly green image is flagged."""
+        path = self._save_image(tmp_path, "green.png", [[(0, 200, 0)] * 60] * 60)
+
+        violations = check_file(path)
+
+        assert len(violations) == 1
+        assert "100.0% of sampled pixels" in violations[0].message
+
+    def test_purple_image_passes(self, tmp_path):
+        """Test that a Kearney purple image is not flagged."""
+        path = self._save_image(tmp_path, "purple.png", [[(120, 35, 220)] * 60] * 60)
+
+        assert check_file(path) == []
+
+    def test_vectorized_matches_pixel_loop(self, tmp_path, monkeypatch):
+        """Test that NumPy sampling reports the same ratio as the pixel loop."""
+        import random
+
+        import core.brand_guard as brand_guard
+
+        rng = random.Random(7)
+        pixels = [
+            [tuple(rng.randrange(256) for _ in range(3)) for _ in range(130)]
+            for _ in range(110)
+        ]
+        path = self._save_image(tmp_path, "noise.png", pixels)
+
+        vectorized = check_file(path)
+        monkeypatch.setattr(brand_guard, "np", None)
+        looped = check_file(path)
+
+        assert vectorized == looped
+        assert len(looped) == 1
+
+    def test_sample_grid_picks_every_nth_pixel(self):
+        """Test that the sampled grid holds pixels (x * step, y * step), in RGB."""
+        from PIL import Image
+
+        from core.brand_guard import _sample_grid
+
+        img = Image.new("L", (23, 17))
+        img.putdata([(x * 7 + y * 3) % 256 for y in range(17) for x in range(23)])
+
+        grid = _sample_grid(img, 5)
+
+        assert grid.mode == "RGB"
+        assert grid.size == (5, 4)
+        assert grid.getpixel((4, 3)) == (img.getpixel((20, 15)),) * 3
+        assert list(grid.getdata()) == [
+            (img.getpixel((x, y)),) * 3
+            for y in range(0, 17, 5) for x in range(0, 23, 5)
+        ]
+
+
+class TestFileDispatch:
+    """Tests for suffix-based checker dispatch."""
+
+    def test_unsupported_suffix_skips_filesystem(self, monkeypatch):
+        """Test that unknown file types are rejected without a stat call."""
+        def fail(self):
+            raise AssertionError("exists() should not be called")
+
+        monkeypatch.setattr(Path, "exists", fail)
+
+        assert check_file("archive.zip") == []
+
+    def test_suffix_is_case_insensitive(self, tmp_path):
+        """Test that upper-case suffixes reach the same checker."""
+        path = tmp_path / "STYLE.CSS"
+        path.write_text("a { color: #00FF00; }")
+
+        assert len(check_file(path)) == 1
+
+    def test_text_files_checked(self, tmp_path):
+        """Test that Markdown and YAML files get the text checks."""
+        (tmp_path / "notes.md").write_text("Status: \U0001F600\n")
+        (tmp_path / "theme.yml").write_text("accent: '#4caf50'\n")
+
+        assert check_file(tmp_path / "notes.md")[0].rule == "NO_EMOJIS"
+        assert check_file(tmp_path / "theme.yml")[0].rule == "FORBIDDEN_COLOR"
+
+
 class TestDirectoryChecks:
     """Tests for directory validation."""
 
@@ -214,6 +429,167 @@ class TestDirectoryChecks:
             nested_violations = [v for v in violations if "nested" in v.file_path]
             assert len(nested_violations) == 0
 
+    def test_scan_order_matches_glob(self, tmp_path):
+        """Test that files are visited in Path.glob order, filtered by suffix."""
+        from core.brand_guard import _iter_files
+
+        (tmp_path / "b" / "c").mkdir(parents=True)
+        (tmp_path / "a").mkdir()
+        for rel in ("x.py", "b/y.CSS", "b/c/z.md", "a/skip.bin", "a/w.txt", "top.html"):
+            (tmp_path / rel).write_text("x")
+        extensions = {".py", ".css", ".md", ".txt", ".html"}
+
+        expected = [
+            str(p) for p in tmp_path.glob("**/*")
+            if p.is_file() and p.suffix.lower() in extensions
+        ]
+
+        assert list(_iter_files(str(tmp_path), True, extensions)) == expected
+        assert len(expected) == 5
+
+    def test_symlinked_directories_not_followed(self, tmp_path):
+        """Test that recursion does not descend into symlinked directories."""
+        real = tmp_path / "real"
+        real.mkdir()
+        (real / "bad.css").write_text("a { color: #00FF00; }")
+        try:
+            (tmp_path / "link").symlink_to(real, target_is_directory=True)
+        except (OSError, NotImplementedError):
+            pytest.skip("symlinks not supported")
+
+        violations = check_directory(tmp_path)
+
+        assert [Path(v.file_path).parent.name for v in violations] == ["real"]
+
+    def test_parallel_matches_serial(self, tmp_path, monkeypatch):
+        """Test that the process pool path returns the serial results in order."""
+        import core.brand_guard as brand_guard
+
+        monkeypatch.setattr(brand_guard, "PARALLEL_MIN_FILES", 4)
+        for i in range(10):
+            content = "color = '#00FF00'\n" if i % 2 else "# clean\n"
+            (tmp_path / f"file_{i}.py").write_text(content)
+
+        parallel = check_directory(tmp_path, max_workers=2)
+        serial = check_directory(tmp_path, max_workers=1)
+
+        assert parallel == serial
+        assert len(serial) == 5
+
+    def test_spawned_workers_use_current_rules(self, tmp_path, monkeypatch, caplog):
+        """Test that spawned workers see runtime changes to FORBIDDEN_COLORS."""
+        import functools
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        import core.brand_guard as brand_guard
+
+        monkeypatch.setattr(brand_guard, "PARALLEL_MIN_FILES", 4)
+        monkeypatch.setattr(
+            brand_guard, "ProcessPoolExecutor",
+            functools.partial(
+                ProcessPoolExecutor, mp_context=multiprocessing.get_context("spawn")
+            ),
+        )
+        monkeypatch.setattr(
+            brand_guard, "FORBIDDEN_COLORS", FORBIDDEN_COLORS | {"#123456"}
+        )
+        for i in range(10):
+            (tmp_path / f"file_{i}.css").write_text("a { color: #123456; }")
+
+        parallel = check_directory(tmp_path, max_workers=2)
+        serial = check_directory(tmp_path, max_workers=1)
+
+        assert "using threads" not in caplog.text
+        assert parallel == serial
+        assert len(serial) == 10
+
+    def test_threaded_matches_serial(self, tmp_path):
+        """Test that the threaded path for mid-sized batches keeps file order."""
+        for i in range(12):
+            content = "color = '#00FF00'\n" if i % 3 else "# clean\n"
+            (tmp_path / f"file_{i:02d}.py").write_text(content)
+
+        threaded = check_directory(tmp_path)
+        serial = check_directory(tmp_path, max_workers=1)
+
+        assert threaded == serial
+        assert len(serial) == 8
+
+
+class TestResultCache:
+    """Tests for the on-disk per-file result cache."""
+
+    def _make_project(self, tmp_path):
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "bad.css").write_text("a { color: #00FF00; }")
+        (src / "ok.css").write_text("a { color: #7823DC; }")
+        return src
+
+    def test_cached_results_match_fresh_scan(self, tmp_path):
+        """Test that a warm cache returns the same violations as a cold scan."""
+        src = self._make_project(tmp_path)
+        cache = tmp_path / "cache.json"
+
+        cold = check_directory(src, cache_path=cache)
+        warm = check_directory(src, cache_path=cache)
+
+        assert cache.exists()
+        assert warm == cold == check_directory(src)
+        assert len(warm) == 1
+
+    def test_unchanged_files_not_rechecked(self, tmp_path, monkeypatch):
+        """Test that only modified files are checked on a warm cache."""
+        import core.brand_guard as brand_guard
+
+        src = self._make_project(tmp_path)
+        cache = tmp_path / "cache.json"
+        check_directory(src, cache_path=cache)
+
+        (src / "ok.css").write_text("a {\n  color: #4CAF50;\n}")
+        checked = []
+        original = brand_guard.check_file
+        monkeypatch.setattr(
+            brand_guard, "check_file",
+            lambda path: checked.append(Path(path).name) or original(path),
+        )
+
+        violations = check_directory(src, cache_path=cache)
+
+        assert checked == ["ok.css"]
+        assert len(violations) == 2
+
+    def test_corrupt_or_stale_cache_ignored(self, tmp_path):
+        """Test that unreadable or old-version caches are rebuilt."""
+        src = self._make_project(tmp_path)
+        cache = tmp_path / "cache.json"
+
+        cache.write_text("{not json")
+        assert len(check_directory(src, cache_path=cache)) == 1
+
+        cache.write_text('{"version": 0, "files": {}}')
+        assert len(check_directory(src, cache_path=cache)) == 1
+
+    def test_rule_change_invalidates_cache(self, tmp_path, monkeypatch):
+        """Test that changing FORBIDDEN_COLORS discards cached results."""
+        import core.brand_guard as brand_guard
+
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "style.css").write_text("a { color: #123456; }")
+        cache = tmp_path / "cache.json"
+        assert check_directory(src, cache_path=cache, max_workers=1) == []
+
+        monkeypatch.setattr(
+            brand_guard, "FORBIDDEN_COLORS",
+            brand_guard.FORBIDDEN_COLORS | {"#123456"},
+        )
+
+        violations = check_directory(src, cache_path=cache, max_workers=1)
+
+        assert [v.rule for v in violations] == ["FORBIDDEN_COLOR"]
+
 
 class TestBrandViolation:
     """Tests for BrandViolation dataclass."""
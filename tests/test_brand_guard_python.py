@@ -127,6 +127,35 @@ ax.grid(True)  # gridline violation
         assert isinstance(violations, list)
 
 
+    def test_line_checks_report_each_line_once(self, tmp_path):
+        py_file = tmp_path / "test.py"
+        py_file.write_text(
+            "import matplotlib\n"
+            "ax.grid(True); ax2.grid(True)\n"
+            "\n"
+            "plt.plot(x, c='green')  # ax.grid(True)\n"
+        )
+
+        violations = check_python_file(py_file)
+
+        assert [(v.line_number, v.rule) for v in violations] == [
+            (2, "NO_GRIDLINES"),
+            (4, "NO_GRIDLINES"),
+            (4, "FORBIDDEN_COLOR"),
+        ]
+
+    def test_line_numbers_with_case_expanding_text(self, tmp_path):
+        py_file = tmp_path / "test.py"
+        # U+0130 lowercases to two characters, shifting offsets
+        py_file.write_text("name = '\u0130stanbul'\nax.plot(color='GREEN')\n")
+
+        violations = check_python_file(py_file)
+
+        assert [(v.line_number, v.rule) for v in violations] == [
+            (2, "FORBIDDEN_COLOR"),
+        ]
+
+
 class TestBrandViolationDataclass:
 
     def test_file_read_error_has_warning_severity(self, tmp_path):
@@ -1,9 +1,10 @@
 """Tests for core/chart_engine.py"""
 
-import pytest
-from pathlib import Path
-import tempfile
 import os
+import tempfile
+from pathlib import Path
+
+import pytest
 
 from core.chart_engine import KDSChart, KDSColors
 
@@ -46,6 +47,74 @@ class TestKDSChartInit:
         assert chart.figsize == (12, 8)
         assert chart.dpi == 300
 
+    def test_font_family_resolved_once(self):
+        """Test that the installed font list is scanned once per process."""
+        from core.chart_engine import _resolve_font_family
+
+        _resolve_font_family.cache_clear()
+        first = KDSChart()
+        second = KDSChart(dark_mode=False)
+
+        assert first.font_family == second.font_family
+        assert first.font_family in ("Inter", "Arial", "sans-serif")
+        assert _resolve_font_family.cache_info().misses == 1
+
+    def test_style_rcparams_reapplied_after_changes(self):
+        """Test that each chart restores its style when rcParams differ."""
+        import matplotlib.pyplot as plt
+
+        KDSChart(dark_mode=False)
+        assert plt.rcParams["axes.facecolor"] == KDSColors.BACKGROUND_LIGHT
+
+        KDSChart()
+        assert plt.rcParams["axes.facecolor"] == KDSColors.BACKGROUND_DARK
+
+        plt.rcParams["axes.grid"] = True
+        KDSChart()
+        assert plt.rcParams["axes.grid"] is False
+
+    def test_theme_rcparams_built_once_and_reapplied(self):
+        """Test that a theme is validated once and restored after other charts."""
+        import matplotlib.pyplot as plt
+
+        from core.chart_engine import _theme_rcparams
+        from core.kds_theme import KDSTheme
+
+        _theme_rcparams.cache_clear()
+        theme = KDSTheme(background_dark="#101010")
+        KDSChart(theme=theme)
+        assert plt.rcParams["axes.facecolor"] == "#101010"
+
+        KDSChart(dark_mode=False)
+        assert plt.rcParams["axes.facecolor"] == KDSColors.BACKGROUND_LIGHT
+
+        KDSChart(theme=KDSTheme(background_dark="#101010"))
+        assert plt.rcParams["axes.facecolor"] == "#101010"
+        assert plt.rcParams["axes.titlecolor"] == theme.text_light
+        assert _theme_rcparams.cache_info().misses == 1
+
+
+class TestSizePresets:
+    """Tests for parse_size_preset."""
+
+    def test_presets_and_custom_sizes(self):
+        """Test preset names (any case) and custom WIDTHxHEIGHT strings."""
+        from core.chart_engine import parse_size_preset
+
+        assert parse_size_preset("Document") == (1200, 900)
+        assert parse_size_preset("1400X800") == (1400, 800)
+        assert parse_size_preset(" 640 x 480 ") == (640, 480)
+        assert parse_size_preset("12x") == (1920, 1080)
+        assert parse_size_preset("unknown") == (1920, 1080)
+
+    def test_presets_added_later_are_honored(self, monkeypatch):
+        """Test that preset lookups see changes to SIZE_PRESETS."""
+        from core.chart_engine import SIZE_PRESETS, parse_size_preset
+
+        monkeypatch.setitem(SIZE_PRESETS, "poster", (2400, 3600))
+
+        assert parse_size_preset("poster") == (2400, 3600)
+
 
 class TestBarChart:
     """Tests for bar chart creation."""
@@ -87,6 +156,16 @@ class TestBarChart:
             assert output_path.exists()
             assert output_path.stat().st_size > 0
 
+    def test_bar_labels_sit_at_bar_ends(self):
+        """Test that value labels are anchored at bar ends and skip NaN bars."""
+        chart = KDSChart(smart_numbers=False)
+        chart.bar([100, float("nan"), -50], ["A", "B", "C"])
+
+        texts = chart.ax.texts
+        assert [t.get_text() for t in texts] == ["100", "-50"]
+        assert [t.get_position() for t in texts] == [(0.0, 100), (2.0, -50)]
+        chart.close()
+
 
 class TestLineChart:
     """Tests for line chart creation."""
@@ -225,6 +304,101 @@ class TestChartSave:
 
             assert output_path.exists()
 
+    def test_png_compress_level(self, tmp_path):
+        """Test that compress_level trades PNG size for encode speed."""
+        sizes = {}
+        for level in (None, 0):
+            chart = KDSChart(figsize=(4, 3), dpi=50)
+            chart.bar([1, 2, 3], ["A", "B", "C"])
+            sizes[level] = chart.save(tmp_path / f"level_{level}.png", compress_level=level).stat().st_size
+
+        assert sizes[0] > sizes[None]
+
+    def test_svg_is_reproducible(self, tmp_path):
+        """Test that SVG output carries no timestamp."""
+        chart = KDSChart(figsize=(4, 3))
+        chart.bar([1, 2, 3], ["A", "B", "C"])
+        saved = chart.save(tmp_path / "chart.svg", compress_level=1)
+
+        assert "<dc:date>" not in saved.read_text()
+
+    def test_save_both_writes_svg_and_png(self, tmp_path):
+        """Test that save_both writes both formats from one figure."""
+        chart = KDSChart(figsize=(4, 3), dpi=50)
+        chart.bar([1, 2, 3], ["A", "B", "C"])
+        svg_path, png_path = chart.save_both(tmp_path / "chart.png")
+
+        assert (svg_path, png_path) == (tmp_path / "chart.svg", tmp_path / "chart.png")
+        assert "<dc:date>" not in svg_path.read_text()
+        assert png_path.read_bytes().startswith(b"\x89PNG")
+        assert chart.fig is None
+
+    def test_dense_chart_defaults_to_png(self, tmp_path, monkeypatch):
+        """Test that a default-SVG save of a dense chart switches to PNG."""
+        import core.chart_engine as chart_engine
+
+        monkeypatch.setattr(chart_engine, "SVG_ELEMENT_LIMIT", 10)
+        chart = KDSChart(figsize=(4, 3), dpi=50)
+        chart.scatter(list(range(20)), list(range(20)))
+
+        saved = chart.save(tmp_path / "dense")
+
+        assert saved == tmp_path / "dense.png"
+        assert saved.read_bytes().startswith(b"\x89PNG")
+
+    def test_dense_chart_keeps_explicit_svg(self, tmp_path, monkeypatch):
+        """Test that an explicit SVG extension is honored for dense charts."""
+        import core.chart_engine as chart_engine
+
+        monkeypatch.setattr(chart_engine, "SVG_ELEMENT_LIMIT", 10)
+        chart = KDSChart(figsize=(4, 3))
+        chart.line([1, 2, 3, 4, 5, 6], [[1, 2, 3, 4, 5, 6], [6, 5, 4, 3, 2, 1]])
+
+        assert chart.save(tmp_path / "dense.svg") == tmp_path / "dense.svg"
+
+        chart.bar([1, 2, 3], ["A", "B", "C"])
+        assert chart.save(tmp_path / "sparse") == tmp_path / "sparse.svg"
+
+
+class TestRenderCache:
+    """Tests for the opt-in rendered-chart cache."""
+
+    def test_identical_chart_reuses_cached_render(self, tmp_path, monkeypatch):
+        """Test that a repeated chart is copied from the cache, not re-rendered."""
+        from matplotlib.figure import Figure
+
+        cache_dir = tmp_path / "cache"
+        first = KDSChart(cache_dir=cache_dir).bar([1, 2, 3], ["A", "B", "C"])
+        first_path = first.save(tmp_path / "first.svg")
+        assert len(list(cache_dir.iterdir())) == 1
+
+        def fail_savefig(*args, **kwargs):
+            raise AssertionError("chart was rendered again")
+
+        monkeypatch.setattr(Figure, "savefig", fail_savefig)
+        second = KDSChart(cache_dir=cache_dir).bar([1, 2, 3], ["A", "B", "C"])
+        second_path = second.save(tmp_path / "second.svg")
+
+        assert second_path.read_bytes() == first_path.read_bytes()
+        assert second.fig is None
+
+    def test_changed_inputs_render_again(self, tmp_path):
+        """Test that different data, settings or formats get their own entries."""
+        cache_dir = tmp_path / "cache"
+        KDSChart(cache_dir=cache_dir).bar([1, 2, 3], ["A", "B", "C"]).save(tmp_path / "a.svg")
+        KDSChart(cache_dir=cache_dir).bar([1, 2, 3.0], ["A", "B", "C"]).save(tmp_path / "b.svg")
+        KDSChart(cache_dir=cache_dir, dark_mode=False).bar([1, 2, 3], ["A", "B", "C"]).save(tmp_path / "c.svg")
+        KDSChart(cache_dir=cache_dir).bar([1, 2, 3], ["A", "B", "C"]).save(tmp_path / "d.png")
+
+        assert len(list(cache_dir.iterdir())) == 4
+
+    def test_no_cache_by_default(self, tmp_path, monkeypatch):
+        """Test that charts without cache_dir write no cache files."""
+        monkeypatch.chdir(tmp_path)
+        KDSChart().bar([1, 2, 3], ["A", "B", "C"]).save(tmp_path / "chart.svg")
+
+        assert not (tmp_path / ".cache").exists()
+
 
 class TestChartClose:
     """Tests for chart close functionality."""
@@ -244,6 +418,19 @@ class TestChartClose:
         chart = KDSChart()
         chart.close()  # Should not raise
 
+    def test_new_chart_closes_unsaved_figure(self):
+        """Test that drawing a second chart releases the first figure."""
+        import matplotlib.pyplot as plt
+
+        chart = KDSChart()
+        chart.bar([1, 2, 3], ["A", "B", "C"])
+        open_figures = len(plt.get_fignums())
+        chart.line([1, 2, 3], [3, 2, 1])
+
+        assert len(plt.get_fignums()) == open_figures
+        assert chart.fig.number in plt.get_fignums()
+        chart.close()
+
 
 class TestKDSCompliance:
     """Tests for KDS brand compliance."""
@@ -301,6 +488,37 @@ class TestGetColors:
         assert all(c.startswith('#') and len(c) == 7 for c in colors)
 
 
+class TestValueFormatting:
+    """Tests for data label formatting."""
+
+    def test_batch_formatting_matches_single_values(self):
+        """Test that _format_values agrees with _format_value in both modes."""
+        values = [0, 12, 999.5, 1500, -2500000, 3.2e9]
+        for smart_numbers in (True, False):
+            chart = KDSChart(smart_numbers=smart_numbers)
+            assert chart._format_values(values) == [chart._format_value(v) for v in values]
+
+        assert KDSChart(smart_numbers=False)._format_values([1500, 2.5]) == ["1500", "2.5"]
+
+    def test_axis_tick_labels_memoized_and_picklable(self):
+        """Test that tick labels are cached across charts and figures pickle."""
+        import pickle
+
+        from core.chart_engine import _tick_label
+
+        _tick_label.cache_clear()
+        chart = KDSChart()
+        for _ in range(2):
+            chart.bar([1500, 2500, 3500], ["A", "B", "C"])
+            chart.fig.canvas.draw()
+        labels = [t.get_text() for t in chart.ax.get_yticklabels()]
+
+        assert "2K" in labels
+        assert _tick_label.cache_info().hits > 0
+        pickle.loads(pickle.dumps(chart.fig))
+        chart.close()
+
+
 class TestNewChartTypes:
     """Tests for new chart types in KDSChart v2."""
 
@@ -326,6 +544,30 @@ class TestNewChartTypes:
         )
         assert result is chart
 
+    def test_waterfall_bar_geometry(self):
+        """Bars span each change from the running total; ends start at 0."""
+        chart = KDSChart(smart_numbers=False)
+        chart.waterfall(data=[100, 20, -15.5, 0], labels=['Start', 'Add', 'Sub', 'End'])
+
+        patches = chart.ax.patches
+        assert [p.get_y() for p in patches] == [0, 100, 104.5, 0]
+        assert [p.get_height() for p in patches] == [100, 20, 15.5, 104.5]
+        assert [t.get_text() for t in chart.ax.texts][-1] == "104.5"
+        chart.close()
+
+    def test_waterfall_connectors_in_one_collection(self):
+        """Connectors are one collection, ending before the total bar."""
+        from matplotlib.collections import LineCollection
+
+        chart = KDSChart()
+        chart.waterfall(data=[100, 20, -15, 105], labels=['Start', 'Add', 'Sub', 'End'])
+
+        collections = [c for c in chart.ax.collections if isinstance(c, LineCollection)]
+        assert len(collections) == 1
+        tops = [segment[0][1] for segment in collections[0].get_segments()]
+        assert tops == [100, 120]
+        chart.close()
+
     def test_stacked_bar_creates_figure(self, tmp_path):
         """Stacked bar chart should create a figure."""
         from core.chart_engine import KDSChart
@@ -339,6 +581,19 @@ class TestNewChartTypes:
         chart.save(str(output))
         assert output.exists()
 
+    def test_stacked_bar_labels_and_stacking(self):
+        """Segments stack on running totals; small and empty ones stay unlabelled."""
+        chart = KDSChart(smart_numbers=False)
+        chart.stacked_bar(
+            data={'A': [50, 0], 'B': [4, 30], 'C': [46, 10]},
+            labels=['Q1', 'Q2'],
+        )
+
+        assert [p.get_y() for p in chart.ax.patches] == [0, 0, 50, 0, 54, 30]
+        texts = [t.get_text() for t in chart.ax.texts]
+        assert texts == ["50", "30", "46", "10", "100", "40"]
+        chart.close()
+
     def test_stacked_bar_horizontal(self, tmp_path):
         """Stacked bar chart should support horizontal orientation."""
         chart = KDSChart()
@@ -408,6 +663,21 @@ class TestNewChartTypes:
         chart.save(str(output))
         assert output.exists()
 
+    def test_bullet_range_bands(self):
+        """Bullet bands span sorted thresholds and pad colors without mutation."""
+        import matplotlib.colors as mcolors
+
+        range_colors = ["#111111"]
+        chart = KDSChart()
+        chart.bullet(actual=60, target=80, ranges=[100, 50, 75], range_colors=range_colors)
+
+        bands = chart.ax.patches[:3]
+        assert [(bar.get_x(), bar.get_width()) for bar in bands] == [(0, 50), (50, 25), (75, 25)]
+        assert mcolors.to_hex(bands[0].get_facecolor()) == "#111111"
+        assert mcolors.to_hex(bands[2].get_facecolor()) == KDSColors.GRAY_400.lower()
+        assert range_colors == ["#111111"]
+        chart.close()
+
     def test_histogram_creates_figure(self, tmp_path):
         """Histogram should create a figure."""
         from core.chart_engine import KDSChart
@@ -457,6 +727,40 @@ class TestNewChartTypes:
         )
         assert result is chart
 
+    def test_heatmap_cell_text_positions_and_colors(self):
+        """Heatmap cells above the value midpoint get white text."""
+        chart = KDSChart(smart_numbers=False)
+        chart.heatmap(data=[[1, 2, 3], [4, 5, 6]])
+
+        cells = {text.get_position(): text for text in chart.ax.texts}
+        assert len(cells) == 6
+        assert cells[(2, 0)].get_text() == "3.00"
+        assert cells[(2, 0)].get_color() == "black"
+        assert cells[(0, 1)].get_text() == "4.00"
+        assert cells[(0, 1)].get_color() == "white"
+        # Cell labels sit inside the image, so layout passes skip them
+        assert not any(text.get_in_layout() for text in chart.ax.texts)
+        chart.close()
+
+    def test_heatmap_default_colormap_is_registered_copy(self):
+        """Heatmaps use their own copy of the registered KDS colormap."""
+        import matplotlib
+
+        from core.chart_engine import KDS_PURPLE_CMAP
+
+        first = KDSChart()
+        first.heatmap(data=[[1, 2], [3, 4]])
+        cmap = first.ax.images[0].get_cmap()
+        assert cmap.name == KDS_PURPLE_CMAP
+        assert cmap is not matplotlib.colormaps[KDS_PURPLE_CMAP]
+
+        cmap.set_bad("red")
+        second = KDSChart()
+        second.heatmap(data=[[1, 2], [3, 4]])
+        assert second.ax.images[0].get_cmap().get_bad().tolist() != [1.0, 0.0, 0.0, 1.0]
+        first.close()
+        second.close()
+
     def test_heatmap_without_values(self, tmp_path):
         """Heatmap should work without value annotations."""
         chart = KDSChart()
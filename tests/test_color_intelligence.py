@@ -53,6 +53,16 @@ class TestGetSequentialColors:
         assert colors_normal == list(reversed(colors_reversed))
 
 
+    def test_sequential_colors_rank_by_value(self):
+        """Test exact rank mapping, with ties kept in input order."""
+        colors = get_sequential_colors(4, values=[10, 30, 10, 20])
+        gradient = [PURPLE_GRADIENT[int(i * 3)] for i in range(4)]
+
+        assert colors == [gradient[2], gradient[0], gradient[3], gradient[1]]
+        assert get_sequential_colors(4, values=[10, 30, 10, 20], reverse=True) == [
+            gradient[1], gradient[3], gradient[0], gradient[2]
+        ]
+
 class TestGetCategoricalColors:
     """Tests for get_categorical_colors function."""
 
@@ -77,6 +87,13 @@ class TestGetCategoricalColors:
         # First colors should match palette
         assert colors[:len(CATEGORICAL_PALETTE)] == CATEGORICAL_PALETTE
 
+    def test_categorical_colors_cycle_lightened_palette(self):
+        """Test that extra colors cycle through lightened palette colors."""
+        n = len(CATEGORICAL_PALETTE) * 3 + 2
+        colors = get_categorical_colors(n)
+        lightened = [lighten_color(c, 0.3) for c in CATEGORICAL_PALETTE]
+        assert colors == CATEGORICAL_PALETTE + lightened * 2 + lightened[:2]
+
     def test_categorical_colors_distinct(self):
         """Test that colors within palette are distinct."""
         colors = get_categorical_colors(len(CATEGORICAL_PALETTE))
@@ -0,0 +1,203 @@
+# tests/test_import_surface.py
+"""Tests for the lazy public import surface of the core package."""
+
+import ast
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import core
+
+REPO_ROOT = Path(__file__).parent.parent
+
+
+def _run_python(code, env_extra=None):
+    """Run a snippet in a fresh interpreter rooted at the repo."""
+    env = dict(os.environ)
+    env.pop("KACA_EAGER_IMPORT", None)
+    if env_extra:
+        env.update(env_extra)
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stdout.strip()
+
+
+class TestLazyAttributes:
+    """Tests for PEP 562 lazy attribute resolution."""
+
+    def test_all_matches_lazy_table(self):
+        """Every exported name is resolvable through the lazy table."""
+        assert set(core.__all__) == set(core._LAZY_ATTRS)
+
+    def test_all_is_immutable_tuple(self):
+        """__all__ is derived from the lazy table as a tuple."""
+        assert isinstance(core.__all__, tuple)
+        assert core.__all__ == tuple(core._LAZY_ATTRS)
+
+    def test_known_exports_present(self):
+        """A representative subset of the public API stays exported."""
+        for name in (
+            "check_file",
+            "KDSChart",
+            "KDSPresentation",
+            "load_state",
+            "create_spec",
+            "DesignSystem",
+            "is_weak_title",
+            "compute_diff",
+            "Telemetry",
+        ):
+            assert name in core.__all__
+
+    @pytest.mark.parametrize("name", sorted(core._LAZY_ATTRS))
+    def test_every_name_resolves(self, name):
+        """Each lazy name resolves to its submodule attribute."""
+        module_name, attr = core._LAZY_ATTRS[name]
+        value = getattr(core, name)
+        assert value is getattr(sys.modules[module_name], attr)
+
+    def test_resolved_name_is_cached(self):
+        """Resolved names are bound into the package namespace."""
+        value = core.is_weak_title
+        assert core.__dict__["is_weak_title"] is value
+
+    def test_unknown_name_raises_attribute_error(self):
+        """Unknown names raise AttributeError, not KeyError."""
+        with pytest.raises(AttributeError):
+            _ = core.does_not_exist
+
+    def test_dir_includes_lazy_names(self):
+        """dir() advertises names that have not been resolved yet."""
+        names = dir(core)
+        for name in core._LAZY_ATTRS:
+            assert name in names
+
+    def test_import_core_does_not_load_engines(self):
+        """A bare `import core` does not import heavy submodules."""
+        out = _run_python(
+            "import sys, core; "
+            "print('core.chart_engine' in sys.modules)"
+        )
+        assert out == "False"
+
+    def test_chart_palette_does_not_load_matplotlib(self):
+        """KDSColors is usable without importing matplotlib."""
+        out = _run_python(
+            "import sys; from core.chart_engine import KDSColors; "
+            "KDSColors.PALETTE[0]; "
+            "print('matplotlib' in sys.modules)"
+        )
+        assert out == "False"
+
+    def test_chart_instance_loads_matplotlib(self):
+        """Creating a KDSChart imports matplotlib on demand."""
+        out = _run_python(
+            "import sys; from core.chart_engine import KDSChart; "
+            "KDSChart(); "
+            "print('matplotlib.pyplot' in sys.modules)"
+        )
+        assert out == "True"
+
+    def test_eager_import_env_resolves_everything(self):
+        """KACA_EAGER_IMPORT=1 resolves every lazy name at import time."""
+        out = _run_python(
+            "import sys, core; "
+            "print('core.chart_engine' in sys.modules)",
+            env_extra={"KACA_EAGER_IMPORT": "1"},
+        )
+        assert out == "True"
+
+
+class TestFeatureFlags:
+    """Tests for env-var opt-outs of optional feature exports."""
+
+    def test_disabled_telemetry_raises_without_import(self):
+        """KACA_DISABLE_TELEMETRY hides telemetry and skips its import."""
+        out = _run_python(
+            "import sys, core\n"
+            "try:\n"
+            "    core.Telemetry\n"
+            "except AttributeError:\n"
+            "    print('core.telemetry' in sys.modules)\n",
+            env_extra={"KACA_DISABLE_TELEMETRY": "1"},
+        )
+        assert out == "False"
+
+    def test_disabled_flag_leaves_other_names(self, monkeypatch):
+        """Disabling one feature does not affect other exports."""
+        monkeypatch.setenv("KACA_DISABLE_INSIGHTS", "1")
+        monkeypatch.delitem(core.__dict__, "InsightEngine", raising=False)
+
+        with pytest.raises(AttributeError):
+            _ = core.InsightEngine
+        assert callable(core.compute_diff)
+
+    @pytest.mark.parametrize("env_var", sorted(core._FEATURE_FLAGS))
+    def test_star_import_skips_disabled_names(self, env_var):
+        """`from core import *` works with a feature disabled."""
+        out = _run_python(
+            "from core import *\n"
+            "import core\n"
+            "print(all(name in globals() for name in core.__all__), "
+            "len(core.__all__) < len(core._LAZY_ATTRS))",
+            env_extra={env_var: "1"},
+        )
+        assert out == "True True"
+
+    def test_eager_import_skips_disabled_features(self):
+        """Eager mode does not resolve disabled names."""
+        out = _run_python(
+            "import sys, core; "
+            "print('core.plan_updater' in sys.modules)",
+            env_extra={
+                "KACA_EAGER_IMPORT": "1",
+                "KACA_DISABLE_PLAN_UPDATER": "1",
+            },
+        )
+        assert out == "False"
+
+
+class TestModuleDefinitions:
+    """Guards against duplicated package-level definitions."""
+
+    def _assigned_names(self):
+        tree = ast.parse((REPO_ROOT / "core" / "__init__.py").read_text())
+        names = []
+        for node in tree.body:
+            if isinstance(node, ast.Assign):
+                names.extend(
+                    t.id for t in node.targets if isinstance(t, ast.Name)
+                )
+        return names
+
+    def test_single_version_assignment(self):
+        """__version__ is assigned exactly once."""
+        assert self._assigned_names().count("__version__") == 1
+
+    def test_single_all_assignment(self):
+        """__all__ is assigned exactly once."""
+        assert self._assigned_names().count("__all__") == 1
+
+    def test_single_module_docstring(self):
+        """Only one docstring-style string literal appears at module level."""
+        tree = ast.parse((REPO_ROOT / "core" / "__init__.py").read_text())
+        docstrings = [
+            node for node in tree.body
+            if isinstance(node, ast.Expr)
+            and isinstance(node.value, ast.Constant)
+            and isinstance(node.value.value, str)
+        ]
+        assert len(docstrings) == 1
+
+    def test_version(self):
+        """The package reports the current version."""
+        assert core.__version__ == "3.0.0"
@@ -78,6 +78,12 @@ class TestSmartFormat:
         assert smart_format(3000000) == "3M"
         assert smart_format(5000000000) == "5B"
 
+    def test_smart_format_trailing_zeros_keep_abbreviation(self):
+        """Test that stripping zeros keeps the suffix after the abbreviation."""
+        assert smart_format(10000, suffix="%") == "10K%"
+        assert smart_format(2050000, decimals=2) == "2.05M"
+        assert smart_format(999950) == "1000K"
+
 
 class TestFormatCurrency:
     """Tests for format_currency function."""